@@ -1,7 +1,50 @@
 import os
 import json
-from openai import OpenAI
-from openai._exceptions import APIError
+import asyncio
+import copy
+import random
+import time
+from dataclasses import dataclass
+from openai_client import create_async_openai_client, get_openai_client
+from openai import APIConnectionError, APIError, APIStatusError
+from recommendation_cache import RecommendationCache, normalize_profile, profile_cache_key, prompt_fingerprint
+from singleflight import SingleFlight
+from json_stream import IncrementalObjectParser
+
+MODEL = "gpt-4o"
+
+SYSTEM_MESSAGE = """
+You are a career guidance expert. Analyze the user's skills, experience, and interests to recommend suitable career paths.
+Provide detailed recommendations in JSON format with the following structure:
+{
+    "careers": [
+        {
+            "title": "Career Title",
+            "match_score": 0-100,
+            "description": "Detailed description",
+            "requirements": "Key requirements bullet points",
+            "growth_potential": "Growth potential description",
+            "next_steps": "Recommended next steps"
+        }
+    ],
+    "development_plan": "Detailed development plan"
+}
+"""
+
+# Responses are reused for equivalent profiles (in process and across restarts and
+# workers) until the model or the system prompt changes
+RECOMMENDATION_CACHE = RecommendationCache(prompt_fingerprint(MODEL, SYSTEM_MESSAGE))
+
+# Concurrent calls for the same profile (other sessions, reruns) share one request
+RECOMMENDATION_FLIGHTS = SingleFlight()
+
+# Batch requests: bounded concurrency, one token bucket per batch and per-item retries
+BATCH_CONCURRENCY = int(os.environ.get("CAREER_ADVISOR_CONCURRENCY", 8))
+BATCH_RATE_PER_SECOND = float(os.environ.get("CAREER_ADVISOR_RATE_PER_SECOND", 5))  # 0 disables the limit
+BATCH_BURST = int(os.environ.get("CAREER_ADVISOR_BURST", 10))
+BATCH_MAX_RETRIES = int(os.environ.get("CAREER_ADVISOR_MAX_RETRIES", 3))
+RETRY_BASE_DELAY = 0.5  # Seconds; the backoff doubles per attempt, with full jitter
+RETRY_STATUS_CODES = {408, 409, 429}  # Retried besides every 5xx
 
 def validate_api_key():
     """Validate that OpenAI API key is properly configured"""
@@ -12,58 +55,305 @@ def validate_api_key():
         )
     return True
 
-# Initialize OpenAI client with environment variable
-client = OpenAI()  # This will automatically use OPENAI_API_KEY from environment
+def _request_kwargs(profile):
+    """chat.completions.create arguments for a normalized profile"""
+    return {
+        "model": MODEL,
+        "messages": [
+            {"role": "system", "content": SYSTEM_MESSAGE},
+            {"role": "user", "content": json.dumps(profile)}
+        ],
+        "response_format": {"type": "json_object"}
+    }
+
+def _advisor_error(e):
+    """The exception get_career_recommendations reports for a failed request"""
+    if isinstance(e, APIError):
+        if "insufficient_quota" in str(e):
+            return Exception(
+                "The OpenAI API key has exceeded its quota or has billing issues. "
+                "Please check your OpenAI account billing status and limits."
+            )
+        return Exception(f"OpenAI API error: {str(e)}")
+    return Exception(f"Failed to get career recommendations: {str(e)}")
+
+def _request_recommendations(profile):
+    """Ask the model for recommendations for a normalized profile"""
+    # Validate API key before making the request
+    validate_api_key()
+
+    response = get_openai_client().chat.completions.create(**_request_kwargs(profile))
+
+    return json.loads(response.choices[0].message.content)
 
 def get_career_recommendations(skills, experience_years, education_level, interests):
     """
     Get career recommendations based on user input using OpenAI API
+
+    The request is built from the normalized profile (sorted skills, bucketed
+    experience), so a cached response answers exactly the request that would be sent.
+    Callers asking for the same profile while a request is in flight wait for it and
+    get its result (or its error) instead of sending their own.
     """
     try:
-        # Validate API key before making the request
+        profile = normalize_profile(skills, experience_years, education_level, interests)
+        result = RECOMMENDATION_FLIGHTS.do(
+            profile_cache_key(profile),
+            lambda: RECOMMENDATION_CACHE.get_or_compute(profile, lambda: _request_recommendations(profile))
+        )
+        return copy.deepcopy(result)  # Callers sharing a flight must not see each other's changes
+    except Exception as e:
+        raise _advisor_error(e)
+
+@dataclass
+class StreamTiming:
+    """Latencies of one streamed recommendation, in seconds since the request started"""
+    first_token: float = None
+    first_career: float = None
+    total: float = None
+    careers: int = 0
+    cached: bool = False
+    shared: bool = False         # Replayed from another caller's request for the same profile
+
+class _StreamAbandoned(Exception):
+    """The leader of a streamed flight stopped reading before the response was complete"""
+
+class RecommendationStream:
+    """
+    Career recommendations read from a streamed completion
+
+    Iterating yields ("career", entry) for every careers[] entry as soon as it is
+    complete, then ("development_plan", text). timing is filled in along the way. A
+    cached response is replayed at once; a streamed one is cached when complete.
+    Streams of the same profile share one request: the first streams it, the others
+    wait for it to complete and replay its response. Use it as a context manager so
+    an interrupted iteration (a Streamlit rerun) releases the request at once.
+    """
+
+    def __init__(self, profile, client=None, cache=RECOMMENDATION_CACHE, flights=RECOMMENDATION_FLIGHTS):
+        self.profile = profile
+        self.timing = StreamTiming()
+        self._client = client
+        self._cache = cache
+        self._flights = flights
+        self._iterator = None
+
+    def _events(self, document, start):
+        for career in document.get("careers", []):
+            self._count_career(start)
+            yield "career", career
+        if "development_plan" in document:
+            yield "development_plan", document["development_plan"]
+
+    def _count_career(self, start):
+        if self.timing.first_career is None:
+            self.timing.first_career = time.perf_counter() - start
+        self.timing.careers += 1
+
+    def _cached(self):
+        return self._cache.get(self.profile) if self._cache is not None else None
+
+    def _stream(self, start):
+        """Stream the completion, yielding events as they complete; returns the whole document"""
+        if self._client is None:
+            validate_api_key()
+        client = self._client or get_openai_client()
+        # Closing the stream releases its pooled connection even when iteration stops early
+        with client.chat.completions.create(**_request_kwargs(self.profile), stream=True) as stream:
+            parser = IncrementalObjectParser()
+            for chunk in stream:
+                piece = chunk.choices[0].delta.content if chunk.choices else None
+                if not piece:
+                    continue
+                if self.timing.first_token is None:
+                    self.timing.first_token = time.perf_counter() - start
+                for key, value in parser.feed(piece):
+                    if key == "careers":
+                        self._count_career(start)
+                        yield "career", value
+                    elif key == "development_plan":
+                        yield "development_plan", value
+            document = parser.close()
+        if self._cache is not None:
+            self._cache.put(self.profile, document)
+        return document
+
+    def _lead(self, key, call, start):
+        """Stream as the flight's leader and hand the document (or the error) to its waiters"""
+        try:
+            # A flight that finished between the cache lookup and begin() left its response cached
+            document = self._cached()
+            if document is not None:
+                self.timing.cached = True
+                self.timing.first_token = time.perf_counter() - start
+                yield from self._events(document, start)
+            else:
+                document = yield from self._stream(start)
+        except GeneratorExit:
+            self._flights.finish(key, call, error=_StreamAbandoned())
+            raise
+        except BaseException as e:
+            self._flights.finish(key, call, error=e)
+            raise
+        self._flights.finish(key, call, document)
+
+    def __iter__(self):
+        self._iterator = self._iterate()
+        return self._iterator
+
+    def close(self):
+        """Stop iterating: closes the HTTP stream and lets streams waiting on this one take over"""
+        if self._iterator is not None:
+            self._iterator.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _iterate(self):
+        start = time.perf_counter()
+        try:
+            cached = self._cached()
+            if cached is not None:
+                self.timing.cached = True
+                self.timing.first_token = time.perf_counter() - start
+                yield from self._events(cached, start)
+            elif self._flights is None:
+                yield from self._stream(start)
+            else:
+                key = profile_cache_key(self.profile)
+                while True:
+                    call, leader = self._flights.begin(key)
+                    if leader:
+                        yield from self._lead(key, call, start)
+                        break
+                    try:
+                        document = copy.deepcopy(self._flights.wait(call))
+                    except _StreamAbandoned:
+                        continue  # Its reader went away (a rerun); start over, possibly as the leader
+                    self.timing.shared = True
+                    self.timing.first_token = time.perf_counter() - start
+                    yield from self._events(document, start)
+                    break
+        except Exception as e:
+            raise _advisor_error(e)
+        self.timing.total = time.perf_counter() - start
+
+def stream_career_recommendations(skills, experience_years, education_level, interests, client=None):
+    """Streaming get_career_recommendations: a RecommendationStream of careers as they are generated"""
+    return RecommendationStream(normalize_profile(skills, experience_years, education_level, interests), client)
+
+class TokenBucket:
+    """Asyncio token bucket: rate tokens per second, at most burst of them banked"""
+
+    def __init__(self, rate, burst, clock=time.monotonic):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self.tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = asyncio.Lock()  # Waiters are served in arrival order
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        if not self.rate:
+            return
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+@dataclass
+class BatchResult:
+    """Outcome of one profile of a batch"""
+    index: int                   # Position in the input profiles
+    profile: dict                # Normalized profile
+    recommendations: dict = None
+    error: Exception = None
+    attempts: int = 0            # Requests sent (0 when answered from the cache)
+    cached: bool = False
+
+    @property
+    def ok(self):
+        return self.error is None
+
+def _is_retryable(e):
+    """Connection problems, timeouts, rate limits, server errors and unparsable replies"""
+    if isinstance(e, (APIConnectionError, json.JSONDecodeError)):
+        return True
+    return isinstance(e, APIStatusError) and (e.status_code >= 500 or e.status_code in RETRY_STATUS_CODES)
+
+async def iter_career_recommendations(profiles, client=None, concurrency=BATCH_CONCURRENCY,
+                                      rate=BATCH_RATE_PER_SECOND, burst=BATCH_BURST,
+                                      max_retries=BATCH_MAX_RETRIES, cache=RECOMMENDATION_CACHE):
+    """
+    Recommendations for many profiles, yielded as BatchResults as they complete
+
+    Each profile is a dict with the get_career_recommendations arguments. Cached
+    profiles are yielded first. The others are requested through AsyncOpenAI with at
+    most `concurrency` requests in flight and `rate` requests per second; retryable
+    failures are retried per profile with exponential backoff. A failed profile
+    yields a result with its error instead of ending the batch.
+    """
+    own_client = client is None
+    if own_client:
         validate_api_key()
+        client = create_async_openai_client(max_retries=0)  # Retries are per profile, below
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = TokenBucket(rate, burst)
 
-        prompt = {
-            "skills": skills,
-            "experience_years": experience_years,
-            "education_level": education_level,
-            "interests": interests
-        }
+    async def request(result):
+        for attempt in range(max_retries + 1):
+            if attempt:
+                await asyncio.sleep(random.uniform(0, RETRY_BASE_DELAY * 2 ** (attempt - 1)))
+            async with semaphore:
+                await bucket.acquire()
+                result.attempts += 1
+                try:
+                    response = await client.chat.completions.create(**_request_kwargs(result.profile))
+                    result.recommendations = json.loads(response.choices[0].message.content)
+                    result.error = None
+                except Exception as e:
+                    result.error = e
+                    if not _is_retryable(e):
+                        break
+                    continue
+            if cache is not None:
+                cache.put(result.profile, result.recommendations)
+            return result
+        result.error = _advisor_error(result.error)
+        return result
 
-        system_message = """
-        You are a career guidance expert. Analyze the user's skills, experience, and interests to recommend suitable career paths.
-        Provide detailed recommendations in JSON format with the following structure:
-        {
-            "careers": [
-                {
-                    "title": "Career Title",
-                    "match_score": 0-100,
-                    "description": "Detailed description",
-                    "requirements": "Key requirements bullet points",
-                    "growth_potential": "Growth potential description",
-                    "next_steps": "Recommended next steps"
-                }
-            ],
-            "development_plan": "Detailed development plan"
-        }
-        """
-
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": json.dumps(prompt)}
-            ],
-            response_format={"type": "json_object"}
-        )
+    pending = []
+    try:
+        for index, profile in enumerate(profiles):
+            result = BatchResult(index, normalize_profile(**profile))
+            result.recommendations = cache.get(result.profile) if cache is not None else None
+            if result.recommendations is not None:
+                result.cached = True
+                yield result
+            else:
+                pending.append(asyncio.ensure_future(request(result)))
+        for future in asyncio.as_completed(pending):
+            yield await future
+    finally:
+        for future in pending:
+            future.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if own_client:
+            await client.close()
 
-        return json.loads(response.choices[0].message.content)
-    except APIError as e:
-        if "insufficient_quota" in str(e):
-            raise Exception(
-                "The OpenAI API key has exceeded its quota or has billing issues. "
-                "Please check your OpenAI account billing status and limits."
-            )
-        raise Exception(f"OpenAI API error: {str(e)}")
-    except Exception as e:
-        raise Exception(f"Failed to get career recommendations: {str(e)}")
\ No newline at end of file
+def get_career_recommendations_batch(profiles, **options):
+    """Run iter_career_recommendations to completion; BatchResults in input order"""
+    async def collect():
+        return [result async for result in iter_career_recommendations(profiles, **options)]
+
+    return sorted(asyncio.run(collect()), key=lambda result: result.index)
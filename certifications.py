@@ -0,0 +1,250 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+import numpy as np
+from skill_catalog import CATALOG, DOMAIN_NAMES, lookup_domain_codes
+from skill_scoring import top_k_indices
+from profile_stats import STRENGTH_MIN_RATING
+
+# Certification catalog behind the Career Roadmap recommendations.
+#
+# Certifications live in data/certifications.json (or CERTIFICATIONS_PATH), each
+# tagged with the learning goals it serves and the catalog skills and domains it
+# covers. The file is loaded once per process into inverted indexes (goal, skill
+# and domain -> certification ids) and a certification x skill/domain coverage
+# matrix. A lookup reads one posting list; ranking scores only those candidates by
+# the skill gaps they cover, so both stay well under a millisecond with tens of
+# thousands of certifications.
+#
+#   python certifications.py --certifications 50000   # time lookups on a synthetic catalog
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+CERTIFICATIONS_PATH = os.environ.get("CERTIFICATIONS_PATH", os.path.join(DATA_DIR, "certifications.json"))
+CERTIFICATIONS_VERSION = 1
+
+DEFAULT_CERT_COUNT = 3  # Certifications recommended per goal
+
+_NO_CERTIFICATIONS = np.empty(0, dtype=np.int32)
+
+
+@dataclass
+class CertificationMatch:
+    """A ranked certification with the gaps it covers"""
+    name: str
+    gap_score: float     # Rating points below STRENGTH_MIN_RATING over the covered skills and domains
+    covered: list        # Covered skills and domains with a gap, largest gap first
+
+
+def _postings(tags_per_certification):
+    """Inverted index from every tag to the sorted ids of the certifications carrying it"""
+    postings = {}
+    for cert_id, tags in enumerate(tags_per_certification):
+        for tag in tags:
+            postings.setdefault(tag, []).append(cert_id)
+    return {tag: np.array(ids, dtype=np.int32) for tag, ids in postings.items()}
+
+
+class CertificationCatalog:
+    """Certifications with inverted indexes by goal, skill and domain
+
+    Coverage terms are the catalog domains followed by every skill any
+    certification covers; indptr/indices hold the certification x term matrix.
+    """
+
+    def __init__(self, names, goals, skills, domains):
+        self.names = list(names)
+        self.name_index = {name: i for i, name in enumerate(self.names)}
+        self.goal_index = _postings(goals)
+        self.skill_index = _postings(skills)
+        self.domain_index = _postings(domains)
+
+        self.terms = list(DOMAIN_NAMES) + sorted(self.skill_index)
+        self.domain_terms = {domain: t for t, domain in enumerate(DOMAIN_NAMES)}
+        self.skill_terms = {skill: t for t, skill in enumerate(self.terms) if t >= len(DOMAIN_NAMES)}
+        rows = [
+            [self.domain_terms[d] for d in cert_domains] + [self.skill_terms[s] for s in cert_skills]
+            for cert_domains, cert_skills in zip(domains, skills)
+        ]
+        self.indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in rows], out=self.indptr[1:])
+        self.indices = np.fromiter((t for row in rows for t in row), dtype=np.int32, count=self.indptr[-1])
+
+    def __len__(self):
+        return len(self.names)
+
+    def with_goal(self, goal):
+        """Ids of the certifications serving a learning goal"""
+        return self.goal_index.get(goal, _NO_CERTIFICATIONS)
+
+    def with_skill(self, skill):
+        """Ids of the certifications covering a skill"""
+        return self.skill_index.get(skill, _NO_CERTIFICATIONS)
+
+    def in_domain(self, domain):
+        """Ids of the certifications covering a whole domain"""
+        return self.domain_index.get(domain, _NO_CERTIFICATIONS)
+
+    def gap_weights(self, ratings):
+        """(terms,) rating points below STRENGTH_MIN_RATING of rated skills and domain averages"""
+        levels = np.full(len(self.terms), float(STRENGTH_MIN_RATING))
+        skills = list(ratings)
+        values = np.fromiter((ratings[skill] for skill in skills), dtype=float, count=len(skills))
+        for skill, value in zip(skills, values):
+            t = self.skill_terms.get(skill)
+            if t is not None:
+                levels[t] = value
+        codes = lookup_domain_codes(skills)
+        counts = np.bincount(codes, minlength=len(DOMAIN_NAMES))
+        sums = np.bincount(codes, weights=values, minlength=len(DOMAIN_NAMES))
+        rated = counts > 0
+        levels[:len(DOMAIN_NAMES)][rated] = sums[rated] / counts[rated]
+        return np.maximum(STRENGTH_MIN_RATING - levels, 0.0)
+
+    def rank(self, candidates, ratings, k=DEFAULT_CERT_COUNT, gaps=None):
+        """The k candidate certifications covering the most gap points, catalog order on ties"""
+        candidates = np.asarray(candidates, dtype=np.int64)
+        if not len(candidates):
+            return []
+        gaps = self.gap_weights(ratings) if gaps is None else gaps
+        starts = self.indptr[candidates]
+        lengths = self.indptr[candidates + 1] - starts
+        # Positions of every candidate's terms in indices, candidate by candidate
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        terms = self.indices[np.arange(lengths.sum()) + offsets]
+        scores = np.bincount(np.repeat(np.arange(len(candidates)), lengths),
+                             weights=gaps[terms], minlength=len(candidates))
+        matches = []
+        for i in top_k_indices(scores, k):
+            cert_terms = self.indices[self.indptr[candidates[i]]:self.indptr[candidates[i] + 1]]
+            covered = sorted((t for t in cert_terms.tolist() if gaps[t] > 0), key=lambda t: -gaps[t])
+            matches.append(CertificationMatch(
+                name=self.names[candidates[i]],
+                gap_score=float(scores[i]),
+                covered=[self.terms[t] for t in covered]
+            ))
+        return matches
+
+    def recommend(self, goal, ratings, k=DEFAULT_CERT_COUNT):
+        """Certifications for a learning goal, ranked by the gaps they cover"""
+        return self.rank(self.with_goal(goal), ratings, k)
+
+    def recommend_for_gaps(self, ratings, k=DEFAULT_CERT_COUNT, exclude=()):
+        """Certifications covering the most gap points among those covering any gap"""
+        gaps = self.gap_weights(ratings)
+        postings = [
+            self.domain_index.get(self.terms[t], _NO_CERTIFICATIONS) if t < len(DOMAIN_NAMES)
+            else self.skill_index[self.terms[t]]
+            for t in np.flatnonzero(gaps)
+        ]
+        candidates = np.unique(np.concatenate([_NO_CERTIFICATIONS] + postings))
+        if exclude:
+            candidates = np.setdiff1d(candidates, [self.name_index[name] for name in exclude if name in self.name_index])
+        return self.rank(candidates, ratings, k, gaps)
+
+
+def _is_string_list(value):
+    return isinstance(value, list) and all(isinstance(item, str) and item.strip() for item in value)
+
+
+def validate_certifications(doc):
+    """Problems with a certifications document, empty when it is valid"""
+    if not isinstance(doc, dict):
+        return ["certifications file must be a JSON object"]
+    problems = []
+    if doc.get("version") != CERTIFICATIONS_VERSION:
+        problems.append(f"unsupported version {doc.get('version')!r}, expected {CERTIFICATIONS_VERSION}")
+    certifications = doc.get("certifications")
+    if not isinstance(certifications, list):
+        return problems + ["certifications must be a list"]
+    names = set()
+    for i, cert in enumerate(certifications):
+        name = cert.get("name") if isinstance(cert, dict) else None
+        if not isinstance(name, str) or not name.strip():
+            problems.append(f"certifications[{i}] needs a non-empty name")
+            continue
+        if name in names:
+            problems.append(f"certification {name!r} is defined twice")
+        names.add(name)
+        for field in ("goals", "skills", "domains"):
+            if not _is_string_list(cert.get(field, [])):
+                problems.append(f"certification {name!r}: {field} must be a list of non-empty strings")
+        if not cert.get("skills") and not cert.get("domains"):
+            problems.append(f"certification {name!r} covers no skills or domains")
+        for skill in cert.get("skills", []) if _is_string_list(cert.get("skills", [])) else []:
+            if skill not in CATALOG.index:
+                problems.append(f"certification {name!r}: unknown skill {skill!r}")
+        for domain in cert.get("domains", []) if _is_string_list(cert.get("domains", [])) else []:
+            if CATALOG.domain_code(domain) is None:
+                problems.append(f"certification {name!r}: unknown domain {domain!r}")
+    return problems
+
+
+def load_certifications(path=CERTIFICATIONS_PATH):
+    """Load and validate a certifications file; raises ValueError listing every problem found"""
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    problems = validate_certifications(doc)
+    if problems:
+        raise ValueError(f"invalid certifications file {path}:\n  " + "\n  ".join(problems))
+    certifications = doc["certifications"]
+    return CertificationCatalog(
+        names=[cert["name"] for cert in certifications],
+        goals=[cert.get("goals", []) for cert in certifications],
+        skills=[cert.get("skills", []) for cert in certifications],
+        # Domains are stored under their catalog spelling
+        domains=[[DOMAIN_NAMES[CATALOG.domain_code(d)] for d in cert.get("domains", [])] for cert in certifications]
+    )
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_certification_catalog():
+    """Certification catalog, loaded and indexed once per process"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = load_certifications()
+    return _catalog
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Time certification lookups on a synthetic catalog")
+    parser.add_argument("--certifications", type=int, default=50000)
+    parser.add_argument("--goals", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    skills = sorted(CATALOG.index)
+    goals = [f"Goal {i}" for i in range(args.goals)]
+    n = args.certifications
+    names = [f"Certification {i}" for i in range(n)]
+    cert_goals = [[goals[g] for g in rng.choice(args.goals, rng.integers(1, 3), replace=False)] for _ in range(n)]
+    cert_skills = [[skills[s] for s in rng.choice(len(skills), rng.integers(1, 6), replace=False)] for _ in range(n)]
+    cert_domains = [[DOMAIN_NAMES[rng.integers(len(DOMAIN_NAMES))]] if rng.random() < 0.3 else [] for _ in range(n)]
+    start = time.perf_counter()
+    catalog = CertificationCatalog(names, cert_goals, cert_skills, cert_domains)
+    print(f"{n} certifications, {len(catalog.terms)} coverage terms: indexed in {time.perf_counter() - start:.2f} s")
+
+    ratings = {skill: float(rng.integers(1, 6)) for skills in CATALOG.categories.values() for skill in skills}
+    queries = rng.choice(goals, args.queries)
+    start = time.perf_counter()
+    for goal in queries:
+        catalog.with_goal(goal)
+    print(f"goal lookup: {(time.perf_counter() - start) / len(queries) * 1e6:.2f} us")
+    start = time.perf_counter()
+    for goal in queries:
+        catalog.recommend(goal, ratings)
+    print(f"ranked recommendation ({np.mean([len(catalog.with_goal(g)) for g in goals]):.0f} candidates): "
+          f"{(time.perf_counter() - start) / len(queries) * 1e3:.3f} ms")
+    start = time.perf_counter()
+    catalog.recommend_for_gaps(ratings)
+    print(f"gap recommendation over {n} certifications: {(time.perf_counter() - start) * 1e3:.1f} ms")
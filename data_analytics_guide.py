@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+from figure_compaction import plotly_chart
 
 def show_analytics_documentation():
     """
@@ -78,7 +79,7 @@ def show_analytics_documentation():
                 aspect="auto"
             )
             fig.update_layout(margin=dict(l=40, r=20, t=20, b=20))
-            st.plotly_chart(fig, use_container_width=True)
+            plotly_chart(fig, use_container_width=True)
         
         with cols[1]:
             # Sample radar chart
@@ -128,7 +129,7 @@ def show_analytics_documentation():
                 height=300,
                 margin=dict(l=30, r=30, t=20, b=20)
             )
-            st.plotly_chart(fig, use_container_width=True)
+            plotly_chart(fig, use_container_width=True)
         
         st.markdown("""
         ### Additional Visualizations
@@ -229,7 +230,7 @@ def show_analytics_documentation():
                 range=[0, 10]
             )
         )
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig, use_container_width=True)
         
         st.markdown("""
         #### Key Question Framework for Analysis
@@ -340,7 +341,7 @@ def show_analytics_documentation():
             )
             
             fig.update_layout(margin=dict(l=20, r=20, t=50, b=20))
-            st.plotly_chart(fig, use_container_width=True)
+            plotly_chart(fig, use_container_width=True)
         
         st.markdown("""
         ### Data Sources and Validation
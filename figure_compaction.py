@@ -0,0 +1,197 @@
+import base64
+from functools import lru_cache
+import json
+import numbers
+import numpy as np
+import plotly
+import plotly.graph_objects as go
+import streamlit as st
+from report_profiler import stage
+
+# Figure compaction applied before every st.plotly_chart call. Plotly figures carry
+# their whole template (one entry per trace type), full float precision and
+# float-typed integers; on every rerun all of that goes over the websocket. The
+# compacted figure renders the same: the template keeps only the trace types the
+# figure uses, floats are rounded to FLOAT_DIGITS and integral values are sent as
+# integers. With Plotly >= 6 long numeric arrays travel as narrowed base64 typed
+# arrays (float32, smallest integer type); short ones stay plain lists.
+#
+#   python figure_compaction.py                    # bytes per chart vs the baseline
+#   python figure_compaction.py --update-baseline  # accept the current numbers
+
+FLOAT_DIGITS = 3
+
+# Plotly >= 6 serializes NumPy arrays as base64 typed arrays; older versions write lists
+TYPED_ARRAYS = int(plotly.__version__.split(".")[0]) >= 6
+TYPED_ARRAY_MIN_SIZE = 64
+
+# Set to False to send figures untouched (used to measure the "before" payloads)
+ENABLED = True
+
+
+def _compact_array(values, digits):
+    """Quantized numeric array, as a typed array when long enough and a list otherwise"""
+    values = np.asarray(values)
+    if values.dtype.kind == "f":
+        values = np.round(values, digits)
+        if np.isfinite(values).all() and np.array_equal(values, np.trunc(values)):
+            values = values.astype(np.int64)
+    if not TYPED_ARRAYS or values.size < TYPED_ARRAY_MIN_SIZE:
+        # Short arrays are smaller as JSON lists than with the typed-array header
+        return values.tolist()
+    if values.dtype.kind == "f":
+        return values.astype(np.float32)
+    return values.astype(np.result_type(np.min_scalar_type(values.min()), np.min_scalar_type(values.max())))
+
+
+def _is_numeric_list(value):
+    return (
+        len(value) > 0
+        and all(isinstance(v, numbers.Real) and not isinstance(v, bool) for v in value)
+    )
+
+
+def _decode_typed_array(spec):
+    """NumPy array from a plotly.js typed-array spec ({"dtype", "bdata", "shape"})"""
+    values = np.frombuffer(base64.b64decode(spec["bdata"]), dtype=np.dtype(spec["dtype"]))
+    if "shape" in spec:
+        values = values.reshape([int(n) for n in str(spec["shape"]).split(",")])
+    return values
+
+
+def _quantize(value, digits):
+    """Round every float in a nested figure dict; numeric sequences become compact arrays"""
+    if isinstance(value, dict):
+        if "bdata" in value and "dtype" in value:
+            # Plotly >= 6 already encoded this array in to_dict(); requantize its values
+            return _compact_array(_decode_typed_array(value), digits)
+        return {k: _quantize(v, digits) for k, v in value.items()}
+    if isinstance(value, np.ndarray):
+        return _compact_array(value, digits) if value.dtype.kind in "fiu" else value
+    if isinstance(value, (list, tuple)):
+        if _is_numeric_list(value):
+            return _compact_array(value, digits)
+        return [_quantize(v, digits) for v in value]
+    if isinstance(value, float):
+        value = round(value, digits)
+        return int(value) if value.is_integer() else value
+    return value
+
+
+def _template_key(template):
+    return json.dumps(template, sort_keys=True, separators=(",", ":"))
+
+
+@lru_cache(maxsize=64)
+def _minimal_template(template_json, trace_types):
+    """Template reduced to the layout plus the given trace types, shared by equal figures"""
+    template = json.loads(template_json)
+    data = template.get("data", {})
+    minimal = {"layout": template.get("layout", {})}
+    if any(trace_type in data for trace_type in trace_types):
+        minimal["data"] = {t: data[t] for t in trace_types if t in data}
+    return minimal
+
+
+def compact_figure(fig, digits=FLOAT_DIGITS):
+    """Compacted copy of a Plotly figure (or figure dict) for sending to the browser"""
+    if not ENABLED:
+        return fig
+    spec = fig.to_dict() if isinstance(fig, go.Figure) else dict(fig)
+    data = [_quantize(trace, digits) for trace in spec.get("data", [])]
+    layout = dict(spec.get("layout", {}))
+    template = layout.pop("template", None)
+    layout = _quantize(layout, digits)
+    if template is not None:
+        # Streamlit's theme reads layout.template, so it is pruned rather than dropped
+        trace_types = tuple(sorted({trace.get("type", "scatter") for trace in data}))
+        layout["template"] = _minimal_template(_template_key(template), trace_types)
+    compacted = {"data": data, "layout": layout}
+    if spec.get("frames"):
+        compacted["frames"] = _quantize(spec["frames"], digits)
+    return go.Figure(compacted, _validate=False)
+
+
+def plotly_chart(fig, compacted=False, **kwargs):
+    """st.plotly_chart with the figure compacted first (skipped if it already is)"""
+    if not compacted:
+        with stage("compact"):
+            fig = compact_figure(fig)
+    with stage("plotly_chart"):
+        return st.plotly_chart(fig, **kwargs)
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import sys
+    from streamlit.testing.v1 import AppTest
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(here)
+    sys.path.insert(0, here)
+    import figure_compaction  # The pages import this module by name, not as __main__
+    from report_cache import REPORT_CACHE
+
+    parser = argparse.ArgumentParser(description="Report plotly_chart payload bytes before and after compaction")
+    parser.add_argument("--baseline", default=os.path.join(here, "data", "figure_payload_baseline.json"))
+    parser.add_argument("--update-baseline", action="store_true", help="Store the compacted sizes as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Allowed growth over the baseline (fraction)")
+    args = parser.parse_args()
+
+    def comprehensive_report_page():
+        import streamlit as st
+        from analytics_report import generate_analytics_report, LAZY_SECTIONS
+        from skill_catalog import SKILL_CATEGORIES
+        for section in LAZY_SECTIONS:
+            st.session_state[f"report_section_{section}"] = True
+        skills = [skill for category in SKILL_CATEGORIES.values() for skill in category]
+        ratings = {skill: i % 5 + 1 for i, skill in enumerate(skills)}
+        generate_analytics_report(ratings, 3, "Bachelor's Degree", "Tech Lead", ["Cloud Architecture"])
+
+    def documentation_page():
+        from data_analytics_guide import show_analytics_documentation
+        show_analytics_documentation()
+
+    pages = {
+        "main": lambda: AppTest.from_file(os.path.join(here, "main.py"), default_timeout=120),
+        "report": lambda: AppTest.from_function(comprehensive_report_page, default_timeout=120),
+        "guide": lambda: AppTest.from_function(documentation_page, default_timeout=120)
+    }
+
+    def chart_bytes(enabled):
+        figure_compaction.ENABLED = enabled
+        REPORT_CACHE.clear()  # Cached report figures are stored compacted
+        result = {}
+        for page, make in pages.items():
+            at = make().run()
+            if at.exception:
+                raise SystemExit(f"{page} failed: {at.exception[0].message}")
+            for i, chart in enumerate(at.get("plotly_chart")):
+                result[f"{page}[{i}]"] = len(chart.proto.spec)
+        return result
+
+    before = chart_bytes(False)
+    after = chart_bytes(True)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    regressions = []
+    print(f"{'chart':<12} {'before':>8} {'after':>8} {'saved':>6} {'baseline':>9}")
+    for chart, size in after.items():
+        limit = baseline.get(chart)
+        if limit is not None and size > limit * (1 + args.tolerance):
+            regressions.append(chart)
+        print(f"{chart:<12} {before.get(chart, 0):>8} {size:>8} {1 - size / before[chart]:>6.0%} "
+              f"{limit if limit is not None else '-':>9}{'  REGRESSION' if chart in regressions else ''}")
+    total_before, total_after = sum(before.values()), sum(after.values())
+    print(f"{'total':<12} {total_before:>8} {total_after:>8} {1 - total_after / total_before:>6.0%}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(after, f, indent=2)
+        print(f"Wrote {args.baseline}")
+    elif regressions:
+        sys.exit(f"{len(regressions)} charts grew more than {args.tolerance:.0%} over the baseline")
@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+import numpy as np
+from skill_catalog import DOMAIN_NAMES, OTHER_DOMAIN, lookup_domain_codes
+
+# Precomputed industry benchmark table keyed by role x experience bucket x domain.
+# The table ships as a .npy file that is memory-mapped on first use, plus a small
+# JSON index with the axis labels. Run this module to rebuild both files.
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+TABLE_PATH = os.path.join(DATA_DIR, "industry_benchmarks.npy")
+INDEX_PATH = os.path.join(DATA_DIR, "industry_benchmarks.json")
+
+# Role-based benchmark modifier
+ROLE_MODIFIERS = {
+    "Student": -1.0,
+    "Junior Developer": -0.5,
+    "Mid-level Developer": 0.0,
+    "Senior Developer": 0.5,
+    "Tech Lead": 0.8,
+    "Manager": 0.3,
+    "Other": 0.0
+}
+
+# Domain-specific industry benchmarks
+BASE_BENCHMARKS = {
+    "Programming": 3.5,
+    "Data & Analytics": 3.2,
+    "Infrastructure": 3.3,
+    "Soft Skills": 3.7,
+    "Other": 3.0
+}
+
+DEFAULT_ROLE = "Other"
+
+# Experience buckets in years; lookups interpolate between them and clamp outside
+EXPERIENCE_BUCKETS = np.arange(0, 11, dtype=float)
+
+
+@dataclass
+class BenchmarkTable:
+    """Benchmark values with the axis indexes used for lookups"""
+    values: np.ndarray       # (roles, experience buckets, domains)
+    roles: list
+    experience_years: np.ndarray
+    domains: list
+    role_index: dict
+    domain_index: dict
+
+
+def build_benchmark_values(roles=None, experience_years=EXPERIENCE_BUCKETS, domains=None):
+    """Benchmark values from the role, experience and domain modifiers"""
+    roles = list(ROLE_MODIFIERS) if roles is None else roles
+    domains = list(BASE_BENCHMARKS) if domains is None else domains
+    role_modifier = np.array([ROLE_MODIFIERS.get(role, 0) for role in roles])
+    exp_modifier = np.minimum(1.0, np.asarray(experience_years) / 10)  # Caps at 10 years
+    base = np.array([BASE_BENCHMARKS.get(domain, 3.0) for domain in domains])
+    return np.minimum(5.0, base[None, None, :] + role_modifier[:, None, None] + exp_modifier[None, :, None])
+
+
+def write_benchmark_table(table_path=TABLE_PATH, index_path=INDEX_PATH):
+    """Rebuild the benchmark table files"""
+    roles = list(ROLE_MODIFIERS)
+    domains = list(BASE_BENCHMARKS)
+    os.makedirs(os.path.dirname(table_path), exist_ok=True)
+    np.save(table_path, build_benchmark_values(roles, EXPERIENCE_BUCKETS, domains))
+    with open(index_path, "w") as f:
+        json.dump({
+            "roles": roles,
+            "experience_years": EXPERIENCE_BUCKETS.tolist(),
+            "domains": domains
+        }, f, indent=2)
+
+
+_table = None
+_table_lock = threading.Lock()
+
+
+def get_benchmark_table():
+    """Benchmark table, loaded and memory-mapped once per process"""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                with open(INDEX_PATH) as f:
+                    index = json.load(f)
+                _table = BenchmarkTable(
+                    values=np.load(TABLE_PATH, mmap_mode="r"),
+                    roles=index["roles"],
+                    experience_years=np.asarray(index["experience_years"], dtype=float),
+                    domains=index["domains"],
+                    role_index={role: i for i, role in enumerate(index["roles"])},
+                    domain_index={domain: i for i, domain in enumerate(index["domains"])}
+                )
+    return _table
+
+
+def _role_codes(table, roles):
+    default = table.role_index[DEFAULT_ROLE]
+    return np.array([table.role_index.get(role, default) for role in roles], dtype=np.int64)
+
+
+def _interpolate(table, role_codes, experience, domain_codes):
+    """(N, K) benchmarks, linearly interpolated between experience buckets"""
+    years = table.experience_years
+    position = np.interp(np.asarray(experience, dtype=float), years, np.arange(len(years)))
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, len(years) - 1)
+    weight = (position - lower)[:, None]
+    rows = role_codes[:, None]
+    columns = np.asarray(domain_codes)[None, :]
+    return (1 - weight) * table.values[rows, lower[:, None], columns] + weight * table.values[rows, upper[:, None], columns]
+
+
+def lookup_benchmarks(roles, experience, domains):
+    """Benchmarks of N profiles (roles, experience) for K domains as an (N, K) array"""
+    table = get_benchmark_table()
+    other = table.domain_index[OTHER_DOMAIN]
+    domain_codes = [table.domain_index.get(domain, other) for domain in domains]
+    return _interpolate(table, _role_codes(table, roles), experience, domain_codes)
+
+
+def lookup_skill_benchmarks(roles, experience, skills):
+    """Benchmarks of N profiles for S skills, via each skill's catalog domain, as an (N, S) array"""
+    table = get_benchmark_table()
+    other = table.domain_index[OTHER_DOMAIN]
+    domain_codes = [table.domain_index.get(DOMAIN_NAMES[code], other) for code in lookup_domain_codes(skills)]
+    return _interpolate(table, _role_codes(table, roles), experience, domain_codes)
+
+
+if __name__ == "__main__":
+    write_benchmark_table()
+    print(f"Wrote {TABLE_PATH} and {INDEX_PATH}")
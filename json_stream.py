@@ -0,0 +1,135 @@
+import json
+
+# Incremental parser for a JSON object that arrives in pieces (a streamed model
+# completion). Text is fed as it comes; every top-level member is emitted as soon as
+# its value is syntactically complete, and top-level arrays are emitted element by
+# element, so a consumer can show the first entries of a list while the rest of the
+# document is still being generated. Each character is scanned once; only complete
+# values are handed to json.loads.
+
+_WHITESPACE = frozenset(" \t\r\n")
+
+
+class IncrementalObjectParser:
+    """Feed pieces of a JSON object; get (key, value) events as members complete
+
+    Members whose value is an array produce one (key, element) event per element
+    instead of one for the whole array. close() parses the complete text once more,
+    so malformed input the scan lets through still fails there.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = None
+        self._expect = "open"      # open, key, colon, value or after (top-level object grammar)
+        self._key = None
+        self._value_start = None   # Start of the current top-level value
+        self._in_array = False     # The current top-level value is an array
+        self._item_start = None    # Start of the current element of that array
+        self.done = False
+
+    def _emit(self, events, start, end):
+        events.append((self._key, json.loads(self._text[start:end])))
+
+    def _end_scalar(self, events, i):
+        """Emit a pending number or literal that ends at i"""
+        if self._depth == 1 and self._value_start is not None and not self._in_array:
+            self._emit(events, self._value_start, i)
+            self._value_start = None
+        elif self._depth == 2 and self._in_array and self._item_start is not None:
+            self._emit(events, self._item_start, i)
+            self._item_start = None
+
+    def _start_value(self, i):
+        """Record where a value starting at i begins, if it is one we emit"""
+        if self._depth == 1 and self._expect == "value":
+            self._value_start = i
+            self._in_array = self._text[i] == "["
+            self._expect = "after"
+        elif self._depth == 2 and self._in_array and self._item_start is None:
+            self._item_start = i
+
+    def feed(self, piece):
+        """Add the next piece of text; returns the (key, value) events it completed"""
+        if self.done:
+            if piece.strip():
+                raise ValueError("data after the end of the JSON object")
+            return []
+        self._text += piece
+        text = self._text
+        events = []
+        for i in range(self._pos, len(text)):
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    start = self._string_start
+                    if self._depth == 1 and self._expect == "key":
+                        self._key = json.loads(text[start:i + 1])
+                        self._expect = "colon"
+                    elif self._depth == 1 and self._value_start == start:
+                        self._emit(events, start, i + 1)
+                        self._value_start = None
+                    elif self._depth == 2 and self._in_array and self._item_start == start:
+                        self._emit(events, start, i + 1)
+                        self._item_start = None
+                continue
+            if c in _WHITESPACE:
+                continue
+            if self._depth == 0:
+                if self._expect != "open" or c != "{":
+                    raise ValueError(f"expected a JSON object at offset {i}, got {c!r}")
+                self._depth = 1
+                self._expect = "key"
+                continue
+            if c == '"':
+                self._in_string = True
+                self._string_start = i
+                self._start_value(i)
+            elif c in "{[":
+                self._start_value(i)
+                self._depth += 1
+            elif c in "}]":
+                self._end_scalar(events, i)
+                self._depth -= 1
+                if self._depth == 0:
+                    self.done = True
+                    self._pos = len(text)
+                    rest = text[i + 1:]
+                    if rest.strip():
+                        raise ValueError("data after the end of the JSON object")
+                    return events
+                if self._depth == 1 and self._value_start is not None:
+                    if not self._in_array:
+                        self._emit(events, self._value_start, i + 1)
+                    self._value_start = None
+                    self._in_array = False
+                elif self._depth == 2 and self._in_array and self._item_start is not None:
+                    self._emit(events, self._item_start, i + 1)
+                    self._item_start = None
+            elif c == ",":
+                self._end_scalar(events, i)
+                if self._depth == 1:
+                    self._expect = "key"
+                    self._in_array = False
+            elif c == ":":
+                if self._depth == 1:
+                    self._expect = "value"
+            else:
+                self._start_value(i)  # Number or literal; ends at the next , } or ]
+        self._pos = len(text)
+        return events
+
+    def close(self):
+        """The whole object; raises ValueError if the text ended before it was complete"""
+        if not self.done:
+            raise ValueError("the JSON object is incomplete")
+        return json.loads(self._text)
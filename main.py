@@ -3,11 +3,19 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 import numpy as np
-import random  # Add this import
+import time
+import html
 from datetime import datetime, timedelta
 from utils import load_css, create_skill_rating_chart, get_skill_recommendations
 from analytics_report import generate_analytics_report
 from data_analytics_guide import add_analytics_document_tab
+from skill_catalog import SKILL_CATEGORIES
+from profile_model import sync_profile_model
+from profile_stats import LEVEL_LABELS
+from industry_benchmarks import lookup_skill_benchmarks
+from role_graph import DEFAULT_PATH_COUNT, get_role_graph
+from certifications import get_certification_catalog
+from figure_compaction import plotly_chart
 
 # Add health check endpoint
 from streamlit.web.server.server import Server
@@ -17,6 +25,30 @@ if "STREAMLIT_HEALTH_CHECK" in os.environ:
     st.success("Health check passed!")
     st.stop()
 
+# Assessment inputs live in a form or, in live mode, in a plain container. Streamlit
+# derives widget ids from the form, so switching modes creates new widgets; the
+# applied values are kept under their own session key and restored into the new ones.
+ASSESSMENT_INPUTS_KEY = "assessment_inputs"
+ASSESSMENT_MODE_KEY = "assessment_inputs_live"
+
+def restore_assessment_inputs(live_updates):
+    """Put the kept assessment values back into the widget keys after a mode switch"""
+    state = st.session_state
+    kept = state.setdefault(ASSESSMENT_INPUTS_KEY, {})
+    if state.get(ASSESSMENT_MODE_KEY) != live_updates:
+        state[ASSESSMENT_MODE_KEY] = live_updates
+        for key, value in kept.items():
+            state[key] = value
+    return kept
+
+def assessment_input(widget, *args, key, default, **kwargs):
+    """Assessment widget seeded through its session key (default on first use), not a value argument"""
+    if key not in st.session_state:
+        st.session_state[key] = default
+    value = widget(*args, key=key, **kwargs)
+    st.session_state[ASSESSMENT_INPUTS_KEY][key] = value
+    return value
+
 def main():
     # Set page config at the very beginning
     st.set_page_config(
@@ -48,137 +80,146 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
-        # Technical Skills assessment with enhanced categories
-        technical_skills = {
-            "Programming": {
-                "Frontend Development": 0,
-                "Backend Development": 0,
-                "Database Management": 0,
-                "Version Control/Git": 0,
-                "Mobile Development": 0,
-                "Testing & QA": 0
-            },
-            "Data & Analytics": {
-                "Data Analysis": 0,
-                "Data Visualization": 0,
-                "Machine Learning": 0,
-                "Statistical Analysis": 0,
-                "Big Data Technologies": 0,
-                "Business Intelligence": 0
-            },
-            "Infrastructure": {
-                "Cloud Services": 0,
-                "DevOps": 0,
-                "System Administration": 0,
-                "Cybersecurity": 0,
-                "Networking": 0,
-                "Containerization": 0
-            },
-            "Soft Skills": {
-                "Technical Communication": 0,
-                "Project Management": 0,
-                "Problem Solving": 0,
-                "Team Collaboration": 0,
-                "Time Management": 0,
-                "Adaptability": 0
-            }
-        }
-        
-        # Create tabs for skill categories
-        skill_tabs = st.tabs(list(technical_skills.keys()))
-        
-        # Store all skill ratings
-        all_ratings = {}
-        
-        # Create enhanced sliders for each category in tabs
-        for tab, (category, skills) in zip(skill_tabs, technical_skills.items()):
-            with tab:
-                st.markdown(f"<h3>{category} Skills Assessment</h3>", unsafe_allow_html=True)
-                
-                # Visual skill level guide
-                st.markdown("""
-                <div style="display: flex; justify-content: space-between; margin-bottom: 20px;">
-                    <div><span class="skill-level-dot beginner"></span> 1: Beginner</div>
-                    <div><span class="skill-level-dot intermediate"></span> 2-3: Intermediate</div>
-                    <div><span class="skill-level-dot advanced"></span> 4: Advanced</div>
-                    <div><span class="skill-level-dot expert"></span> 5: Expert</div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Two columns layout for skills
-                col1, col2 = st.columns(2)
-                skill_list = list(skills.keys())
-                half = len(skill_list) // 2
-                
-                # First column of skills
-                with col1:
-                    for skill in skill_list[:half]:
-                        rating = st.slider(
-                            f"{skill}",
-                            1, 5, 3,
-                            key=f"{category}_{skill}"
-                        )
-                        all_ratings[skill] = rating
-                
-                # Second column of skills
-                with col2:
-                    for skill in skill_list[half:]:
-                        rating = st.slider(
-                            f"{skill}",
-                            1, 5, 3,
-                            key=f"{category}_{skill}"
-                        )
-                        all_ratings[skill] = rating
-        
-        # Additional Information with enhanced UI
-        st.markdown("""
-        <div class="card-container">
-            <h3>📝 Professional Background</h3>
-            <p>Help us understand your experience and career aspirations</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
+        # Ratings and background are batched in a form: changing a slider no longer reruns
+        # the whole app (all four tabs), only submitting does. Live mode restores the
+        # rerun-per-change behaviour for users who want the dashboard to follow every edit.
+        live_updates = st.toggle(
+            "Update analytics on every change",
+            value=False,
+            key="assessment_live_updates",
+            help="When off, changes are applied together when you generate the analysis"
+        )
         
-        with col1:
-            experience_years = st.number_input("Years of Technical Experience", 0, 50, 3)
-            education_level = st.selectbox(
-                "Highest Education Level",
-                ["High School", "Associate's Degree", "Bachelor's Degree", "Master's Degree", "PhD", "Self-taught"]
-            )
+        restore_assessment_inputs(live_updates)
         
-        with col2:
-            current_role = st.selectbox(
-                "Current Role",
-                ["Student", "Junior Developer", "Mid-level Developer", "Senior Developer", "Tech Lead", "Manager", "Other"]
-            )
-            industry = st.selectbox(
-                "Industry Sector",
-                ["Technology", "Finance", "Healthcare", "Education", "E-commerce", "Manufacturing", "Other"]
+        with st.container() if live_updates else st.form("skills_assessment", border=False):
+            # Technical Skills assessment from the shared skill catalog (loaded once per process)
+            technical_skills = SKILL_CATEGORIES
+            
+            # Create tabs for skill categories
+            skill_tabs = st.tabs(list(technical_skills.keys()))
+            
+            # Store all skill ratings
+            all_ratings = {}
+            
+            # Create enhanced sliders for each category in tabs
+            for tab, (category, skills) in zip(skill_tabs, technical_skills.items()):
+                with tab:
+                    st.markdown(f"<h3>{category} Skills Assessment</h3>", unsafe_allow_html=True)
+                    
+                    # Visual skill level guide
+                    st.markdown("""
+                    <div style="display: flex; justify-content: space-between; margin-bottom: 20px;">
+                        <div><span class="skill-level-dot beginner"></span> 1: Beginner</div>
+                        <div><span class="skill-level-dot intermediate"></span> 2-3: Intermediate</div>
+                        <div><span class="skill-level-dot advanced"></span> 4: Advanced</div>
+                        <div><span class="skill-level-dot expert"></span> 5: Expert</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    # Two columns layout for skills
+                    col1, col2 = st.columns(2)
+                    skill_list = skills
+                    half = len(skill_list) // 2
+                    
+                    # First column of skills
+                    with col1:
+                        for skill in skill_list[:half]:
+                            rating = assessment_input(
+                                st.slider,
+                                f"{skill}",
+                                1, 5,
+                                key=f"{category}_{skill}",
+                                default=3
+                            )
+                            all_ratings[skill] = rating
+                    
+                    # Second column of skills
+                    with col2:
+                        for skill in skill_list[half:]:
+                            rating = assessment_input(
+                                st.slider,
+                                f"{skill}",
+                                1, 5,
+                                key=f"{category}_{skill}",
+                                default=3
+                            )
+                            all_ratings[skill] = rating
+            
+            # Additional Information with enhanced UI
+            st.markdown("""
+            <div class="card-container">
+                <h3>📝 Professional Background</h3>
+                <p>Help us understand your experience and career aspirations</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                experience_years = assessment_input(
+                    st.number_input, "Years of Technical Experience", 0, 50,
+                    key="assessment_experience_years", default=3
+                )
+                education_level = assessment_input(
+                    st.selectbox,
+                    "Highest Education Level",
+                    ["High School", "Associate's Degree", "Bachelor's Degree", "Master's Degree", "PhD", "Self-taught"],
+                    key="assessment_education_level",
+                    default="High School"
+                )
+            
+            with col2:
+                current_role = assessment_input(
+                    st.selectbox,
+                    "Current Role",
+                    ["Student", "Junior Developer", "Mid-level Developer", "Senior Developer", "Tech Lead", "Manager", "Other"],
+                    key="assessment_current_role",
+                    default="Student"
+                )
+                industry = assessment_input(
+                    st.selectbox,
+                    "Industry Sector",
+                    ["Technology", "Finance", "Healthcare", "Education", "E-commerce", "Manufacturing", "Other"],
+                    key="assessment_industry",
+                    default="Technology"
+                )
+            
+            # Interest areas with enhanced UI
+            st.markdown("<h3>🎯 Focus Areas</h3>", unsafe_allow_html=True)
+            learning_goals = assessment_input(
+                st.multiselect,
+                "Select Your Career & Learning Goals",
+                [
+                    "Full-Stack Development",
+                    "Cloud Architecture",
+                    "Data Science & ML",
+                    "DevOps & SRE",
+                    "Cybersecurity",
+                    "Mobile Development",
+                    "UI/UX Design",
+                    "Technical Leadership",
+                    "Blockchain Development",
+                    "AR/VR Development",
+                    "Game Development",
+                    "IoT Development"
+                ],
+                key="assessment_learning_goals",
+                default=[]
             )
+                
+            # Analysis button with enhanced UI
+            if live_updates:
+                generate_analysis = st.button("Generate Comprehensive Analysis", type="primary")
+            else:
+                generate_analysis = st.form_submit_button("Generate Comprehensive Analysis", type="primary")
         
-        # Interest areas with enhanced UI
-        st.markdown("<h3>🎯 Focus Areas</h3>", unsafe_allow_html=True)
-        learning_goals = st.multiselect(
-            "Select Your Career & Learning Goals",
-            [
-                "Full-Stack Development",
-                "Cloud Architecture",
-                "Data Science & ML",
-                "DevOps & SRE",
-                "Cybersecurity",
-                "Mobile Development",
-                "UI/UX Design",
-                "Technical Leadership",
-                "Blockchain Development",
-                "AR/VR Development",
-                "Game Development",
-                "IoT Development"
-            ]
-        )
+        # Running aggregates of the submitted ratings; only changed skills are re-applied.
+        # Every tab reads the same per-profile statistics, computed once per rerun.
+        profile_model = sync_profile_model(st.session_state, all_ratings, learning_goals)
+        profile_stats = profile_model.stats()
         
-        # Analysis button with enhanced UI
-        if st.button("Generate Comprehensive Analysis", type="primary"):
+        if generate_analysis:
             # Progress bar for visual feedback
             progress_bar = st.progress(0)
             for i in range(100):
@@ -203,7 +244,7 @@ def main():
                     
                     category_ratings = {skill: all_ratings[skill] for skill in skills}
                     fig = create_skill_rating_chart(category_ratings)
-                    st.plotly_chart(fig, use_container_width=True)
+                    plotly_chart(fig, use_container_width=True)
                 
                 # Enhanced Skill Gap Analysis
                 st.markdown("""
@@ -217,10 +258,7 @@ def main():
                 
                 with col1:
                     # Enhanced category averages visualization
-                    category_averages = {}
-                    for category, skills in technical_skills.items():
-                        avg = sum(all_ratings[skill] for skill in skills) / len(skills)
-                        category_averages[category] = avg
+                    category_averages = dict(zip(profile_model.domains, profile_stats.domain_avg[0]))
                     
                     # Create enhanced bar chart for category averages
                     fig = px.bar(
@@ -236,18 +274,15 @@ def main():
                         coloraxis_showscale=False,
                         height=400,
                     )
-                    st.plotly_chart(fig, use_container_width=True)
+                    plotly_chart(fig, use_container_width=True)
                 
                 with col2:
                     # Enhanced skill gaps identification with visual indicators
-                    strengths = []
-                    skill_gaps = []
-                    
-                    for skill, rating in all_ratings.items():
-                        if rating >= 4:
-                            strengths.append({"skill": skill, "level": rating})
-                        elif rating <= 2:
-                            skill_gaps.append({"skill": skill, "level": rating})
+                    # Highest-rated strengths and lowest-rated gaps first
+                    strengths = [{"skill": profile_model.skills[i], "level": profile_model.ratings[i]}
+                                 for i in profile_stats.top_strengths()]
+                    skill_gaps = [{"skill": profile_model.skills[i], "level": profile_model.ratings[i]}
+                                  for i in profile_stats.top_gaps()]
                     
                     # Display strengths
                     st.markdown("<h3>💪 Your Strengths</h3>", unsafe_allow_html=True)
@@ -330,9 +365,12 @@ def main():
                 </div>
                 """, unsafe_allow_html=True)
                 
-                # Generate random industry data for visualization
-                industry_data = {skill: min(5, max(1, rating + random.uniform(-1, 1))) 
-                                for skill, rating in list(all_ratings.items())[:8]}  # Use a subset
+                # Industry benchmarks for a subset of skills, read from the benchmark table
+                benchmark_skills = list(all_ratings.keys())[:8]
+                industry_data = dict(zip(
+                    benchmark_skills,
+                    lookup_skill_benchmarks([current_role], [experience_years], benchmark_skills)[0]
+                ))
                 
                 # Create a comparison dataframe
                 comparison_data = {
@@ -352,7 +390,7 @@ def main():
                     template="plotly_white",
                     title="Your Skills vs. Industry Benchmarks"
                 )
-                st.plotly_chart(fig, use_container_width=True)
+                plotly_chart(fig, use_container_width=True)
                 
                 # Skill distribution with explanation
                 st.subheader("Skill Level Distribution")
@@ -367,18 +405,7 @@ def main():
                 
                 # Count ratings by level
                 if all_ratings:
-                    rating_counts = {'Beginner (1)': 0, 'Basic (2)': 0, 'Intermediate (3)': 0, 'Advanced (4)': 0, 'Expert (5)': 0}
-                    for rating in all_ratings.values():
-                        if rating == 1:
-                            rating_counts['Beginner (1)'] += 1
-                        elif rating == 2:
-                            rating_counts['Basic (2)'] += 1
-                        elif rating == 3:
-                            rating_counts['Intermediate (3)'] += 1
-                        elif rating == 4:
-                            rating_counts['Advanced (4)'] += 1
-                        elif rating == 5:
-                            rating_counts['Expert (5)'] += 1
+                    rating_counts = dict(zip(LEVEL_LABELS, profile_stats.level_counts[0].tolist()))
                     
                     # Create a pie chart
                     fig = px.pie(
@@ -388,7 +415,7 @@ def main():
                         color_discrete_sequence=px.colors.sequential.Viridis,
                         hole=0.4
                     )
-                    st.plotly_chart(fig, use_container_width=True)
+                    plotly_chart(fig, use_container_width=True)
                 else:
                     st.info("Rate your skills in the Assessment tab to see your skill distribution")
             else:
@@ -415,54 +442,84 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
-        # Show career path visualization based on current role
-        role_paths = {
-            "Student": ["Junior Developer", "Mid-level Developer", "Senior Developer", "Tech Lead", "CTO"],
-            "Junior Developer": ["Mid-level Developer", "Senior Developer", "Tech Lead", "Engineering Manager", "CTO"],
-            "Mid-level Developer": ["Senior Developer", "Tech Lead", "Engineering Manager", "Director of Engineering", "CTO"],
-            "Senior Developer": ["Tech Lead", "Engineering Manager", "Product Architect", "Director of Engineering", "CTO"],
-            "Tech Lead": ["Engineering Manager", "Product Architect", "Director of Engineering", "VP of Engineering", "CTO"],
-            "Manager": ["Director of Engineering", "VP of Engineering", "CTO", "Chief Digital Officer", "CEO"],
-            "Other": ["Specialist", "Consultant", "Team Lead", "Department Head", "Executive"]
-        }
+        # Career paths from the role graph: transitions carry typical years and the skill
+        # thresholds they need; paths only use transitions the current ratings are close to
+        role_graph = get_role_graph()
         
-        if current_role in role_paths:
+        if current_role in role_graph:
             st.subheader(f"Career Progression Path from {current_role}")
             st.markdown("""
             <div class="chart-explanation">
                 <p><strong>Chart Type:</strong> Timeline Chart</p>
-                <p><strong>Purpose:</strong> Visualizes your potential career progression path based on your current role.</p>
-                <p><strong>How to interpret:</strong> Each point represents a career milestone, with approximate years of experience
-                required to reach each level. The path is customized based on your current position.</p>
+                <p><strong>Purpose:</strong> Visualizes your fastest career paths from your current role to a target role.</p>
+                <p><strong>How to interpret:</strong> Each point represents a career milestone, with the typical years of experience
+                needed to reach it. Paths only use transitions whose skill requirements are within reach of your current ratings.</p>
             </div>
             """, unsafe_allow_html=True)
             
-            # Create a career path visualization
-            career_data = {
-                'Position': [current_role] + role_paths[current_role],
-                'Level': list(range(1, len(role_paths[current_role]) + 2)),
-                'Years': [0, 2, 5, 8, 12, 15][:len(role_paths[current_role]) + 1]
-            }
-            df = pd.DataFrame(career_data)
-            
-            fig = px.line(
-                df, 
-                x='Years', 
-                y='Level', 
-                text='Position',
-                markers=True,
-                line_shape='spline',
-                template="plotly_white"
-            )
-            
-            fig.update_traces(textposition="top center")
-            fig.update_layout(
-                title="Your Technical Career Timeline",
-                xaxis_title="Experience (Years)",
-                yaxis_title="Career Level",
-                height=500
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            reachable = role_graph.reachable_roles(current_role)
+            if reachable:
+                # Most senior roles first, the fastest one on ties; the default is the most
+                # senior role the current ratings already lead to
+                eligible = role_graph.eligible_edges(all_ratings)
+                reachable_now = role_graph.reachable_roles(current_role, eligible)
+                targets = sorted(reachable, key=lambda role: (-role_graph.levels[role_graph.role_index[role]], reachable[role]))
+                default_target = next((i for i, role in enumerate(targets) if role in reachable_now), 0)
+                target_role = st.selectbox("Target Role", targets, index=default_target, key="roadmap_target_role")
+                
+                paths = role_graph.k_shortest_paths(current_role, target_role, DEFAULT_PATH_COUNT, eligible)
+                if not paths:
+                    st.warning(f"Your current ratings don't yet meet the requirements on any path to {target_role}. "
+                               "Showing the typical paths; the steps below list the skills to build first.")
+                    paths = role_graph.k_shortest_paths(current_role, target_role, DEFAULT_PATH_COUNT)
+                
+                # Create a career path visualization, one line per alternative path
+                career_data = pd.DataFrame([
+                    {
+                        'Path': f"Path {i + 1} ({path.total_years:g} years)",
+                        'Position': role,
+                        'Level': int(role_graph.levels[role_graph.role_index[role]]),
+                        'Years': years
+                    }
+                    for i, path in enumerate(paths)
+                    for role, years in zip(path.roles, path.cumulative_years)
+                ])
+                
+                fig = px.line(
+                    career_data, 
+                    x='Years', 
+                    y='Level', 
+                    color='Path',
+                    text='Position',
+                    markers=True,
+                    line_shape='spline',
+                    template="plotly_white"
+                )
+                
+                fig.update_traces(textposition="top center")
+                fig.update_layout(
+                    title="Your Technical Career Timeline",
+                    xaxis_title="Experience (Years)",
+                    yaxis_title="Career Level",
+                    height=500
+                )
+                plotly_chart(fig, use_container_width=True)
+                
+                # Requirements along the fastest path
+                steps = []
+                for edge, from_role, to_role in zip(paths[0].edges, paths[0].roles, paths[0].roles[1:]):
+                    unmet = role_graph.unmet_requirements(edge, all_ratings)
+                    needs = ", ".join(f"{key} {required:g} (you: {current:.1f})" for key, required, current in unmet)
+                    steps.append(f"<li><strong>{from_role} → {to_role}</strong> · ~{role_graph.years[edge]:g} years"
+                                 f"{' · build up ' + needs if needs else ' · requirements met'}</li>")
+                st.markdown(f"""
+                <div class="focus-area">
+                    <h4>Steps to {target_role}</h4>
+                    <ul>{"".join(steps)}</ul>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.info(f"{current_role} is the most senior role in the career graph")
             
             # Certification recommendations based on learning goals
             if learning_goals:
@@ -471,38 +528,67 @@ def main():
                 <div class="chart-explanation">
                     <p><strong>Purpose:</strong> Provides targeted certification recommendations based on your selected learning goals.</p>
                     <p><strong>How to use:</strong> These certifications are industry-recognized credentials that can help validate your
-                    skills and accelerate your career progression in your chosen focus areas.</p>
+                    skills and accelerate your career progression in your chosen focus areas. They are ranked by how much they cover
+                    the skills you rated below Advanced.</p>
                 </div>
                 """, unsafe_allow_html=True)
                 
-                # Sample certifications map
-                cert_map = {
-                    "Full-Stack Development": ["AWS Certified Developer", "Full Stack Web Developer", "JavaScript Full Stack Certification"],
-                    "Cloud Architecture": ["AWS Solutions Architect", "Google Cloud Architect", "Azure Solutions Architect"],
-                    "Data Science & ML": ["TensorFlow Developer Certificate", "Microsoft Certified: Azure Data Scientist", "IBM Data Science Professional"],
-                    "DevOps & SRE": ["AWS DevOps Engineer", "Certified Kubernetes Administrator", "Docker Certified Associate"],
-                    "Cybersecurity": ["CompTIA Security+", "Certified Ethical Hacker", "CISSP"],
-                    "Mobile Development": ["Google Associate Android Developer", "Apple Certified iOS Developer", "React Native Certification"],
-                    "UI/UX Design": ["Certified User Experience Professional", "Adobe XD Certification", "Google UX Design Certificate"],
-                    "Technical Leadership": ["Scrum Master Certification", "Project Management Professional (PMP)", "Certified Agile Leadership"],
-                    "Blockchain Development": ["Certified Blockchain Developer", "Ethereum Developer Certification", "Hyperledger Fabric Developer"],
-                    "AR/VR Development": ["Unity Certified Developer", "Unreal Engine Certification", "AR/VR Design & Development Certificate"],
-                    "Game Development": ["Unity Certified Programmer", "Unreal Engine Developer", "Game Development & Design Certificate"],
-                    "IoT Development": ["IoT Developer Certificate", "Microsoft Certified: Azure IoT Developer", "AWS IoT Specialization"]
-                }
+                # Certification catalog with goal, skill and domain indexes (loaded once per process)
+                cert_catalog = get_certification_catalog()
                 
                 for goal in learning_goals:
-                    if goal in cert_map:
+                    matches = cert_catalog.recommend(goal, all_ratings)
+                    if matches:
                         st.markdown(f"""
                         <div class="focus-area">
                             <h4>{goal}</h4>
                             <ul>
-                                {"".join([f"<li>{cert}</li>" for cert in cert_map[goal]])}
+                                {"".join([f"<li>{match.name}{' · covers ' + ', '.join(match.covered) if match.covered else ''}</li>" for match in matches])}
                             </ul>
                         </div>
                         """, unsafe_allow_html=True)
             else:
                 st.info("Select learning goals in the Assessment tab to see certification recommendations")
+        
+        # AI career recommendations, rendered career by career while the model streams them
+        st.subheader("AI Career Recommendations")
+        if not os.environ.get("OPENAI_API_KEY"):
+            st.info("Set the OPENAI_API_KEY environment variable to get AI career recommendations")
+        elif st.button("Get AI Career Recommendations", key="ai_career_recommendations"):
+            # Imported here: the advisor opens the recommendation cache file at import
+            from career_advisor import stream_career_recommendations
+            
+            stream = stream_career_recommendations(all_ratings, experience_years, education_level, learning_goals)
+            try:
+                # Closed on reruns too: the HTTP stream is released and sessions waiting on it take over
+                with stream, st.spinner("Generating recommendations..."):
+                    for kind, value in stream:
+                        if kind == "career":
+                            # Model output is text, never markup
+                            career = {
+                                field: html.escape(str(value.get(field, default)))
+                                for field, default in [("title", "Career"), ("match_score", "-"), ("description", ""),
+                                                       ("growth_potential", ""), ("next_steps", "")]
+                            }
+                            st.markdown(f"""
+                            <div class="focus-area">
+                                <h4>{career["title"]} · {career["match_score"]}% match</h4>
+                                <p>{career["description"]}</p>
+                                <p><strong>Growth potential:</strong> {career["growth_potential"]}</p>
+                                <p><strong>Next steps:</strong> {career["next_steps"]}</p>
+                            </div>
+                            """, unsafe_allow_html=True)
+                        else:
+                            st.markdown(f"**Development plan:** {html.escape(str(value))}")
+                timing = stream.timing
+                if timing.cached:
+                    st.caption("Answered from the recommendation cache")
+                elif timing.shared:
+                    st.caption("Shared the response of a request already in progress for the same profile")
+                elif timing.first_career is not None:
+                    st.caption(f"First career after {timing.first_career:.1f} s · complete response in {timing.total:.1f} s")
+            except Exception as e:
+                st.error(str(e))
 
     with app_tabs[3]:  # Documentation Tab
         add_analytics_document_tab()
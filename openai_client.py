@@ -0,0 +1,165 @@
+import os
+import threading
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+# Process-wide OpenAI client for the career advisor.
+#
+# The client is created on first use, not at import, so importing the advisor works
+# without a key or network. One client (and its httpx connection pool) is shared by
+# every session and thread of the Streamlit server; keep-alive connections are
+# reused between requests instead of paying a TCP/TLS handshake each time. When
+# the client is created, a background warm-up request opens a pooled connection
+# ahead of the first real one. Every request is traced through httpcore, so
+# stats() reports how many requests reused a pooled connection.
+#
+# Async clients are bound to an event loop, so create_async_openai_client() makes a
+# new one per loop with the same pool settings and metrics.
+
+MAX_CONNECTIONS = int(os.environ.get("OPENAI_MAX_CONNECTIONS", 20))
+MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("OPENAI_MAX_KEEPALIVE_CONNECTIONS", 10))
+KEEPALIVE_EXPIRY = float(os.environ.get("OPENAI_KEEPALIVE_EXPIRY_SECONDS", 60))
+CONNECT_TIMEOUT = float(os.environ.get("OPENAI_CONNECT_TIMEOUT_SECONDS", 5))
+READ_TIMEOUT = float(os.environ.get("OPENAI_READ_TIMEOUT_SECONDS", 120))  # Completions can take a while
+WRITE_TIMEOUT = float(os.environ.get("OPENAI_WRITE_TIMEOUT_SECONDS", 10))
+POOL_TIMEOUT = float(os.environ.get("OPENAI_POOL_TIMEOUT_SECONDS", 10))  # Waiting for a free connection
+WARM_UP = os.environ.get("OPENAI_WARM_UP", "1").strip().lower() not in ("", "0", "false", "off")
+
+LIMITS = httpx.Limits(
+    max_connections=MAX_CONNECTIONS,
+    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=KEEPALIVE_EXPIRY
+)
+TIMEOUT = httpx.Timeout(connect=CONNECT_TIMEOUT, read=READ_TIMEOUT, write=WRITE_TIMEOUT, pool=POOL_TIMEOUT)
+
+
+class ConnectionMetrics:
+    """Thread-safe counts of requests and of the connections they opened or reused"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.warm_ups = 0
+        self.warm_up_errors = 0
+
+    def record(self, connected):
+        with self._lock:
+            self.requests += 1
+            if connected:
+                self.new_connections += 1
+            else:
+                self.reused_connections += 1
+
+    def count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+                "reuse_rate": self.reused_connections / self.requests if self.requests else 0.0,
+                "warm_ups": self.warm_ups,
+                "warm_up_errors": self.warm_up_errors
+            }
+
+
+METRICS = ConnectionMetrics()
+
+
+class _ConnectionTrace:
+    """httpcore trace extension noting whether a request had to open a connection"""
+
+    def __init__(self):
+        self.connected = False
+
+    def __call__(self, event, info):
+        if event == "connection.connect_tcp.complete":
+            self.connected = True
+
+
+class _AsyncConnectionTrace(_ConnectionTrace):
+    async def __call__(self, event, info):
+        _ConnectionTrace.__call__(self, event, info)
+
+
+def _record(response):
+    trace = response.request.extensions.get("trace")
+    if isinstance(trace, _ConnectionTrace):
+        METRICS.record(trace.connected)
+
+
+def _trace_request(request):
+    request.extensions["trace"] = _ConnectionTrace()
+
+
+def _record_response(response):
+    _record(response)
+
+
+async def _trace_async_request(request):
+    request.extensions["trace"] = _AsyncConnectionTrace()
+
+
+async def _record_async_response(response):
+    _record(response)
+
+
+def create_openai_client(**options):
+    """New OpenAI client on a traced httpx pool with the module's limits and timeouts"""
+    http_client = DefaultHttpxClient(
+        limits=LIMITS,
+        timeout=TIMEOUT,
+        event_hooks={"request": [_trace_request], "response": [_record_response]}
+    )
+    return OpenAI(http_client=http_client, timeout=TIMEOUT, **options)
+
+
+def create_async_openai_client(**options):
+    """New AsyncOpenAI client for the running event loop, with the same pool settings and metrics"""
+    http_client = DefaultAsyncHttpxClient(
+        limits=LIMITS,
+        timeout=TIMEOUT,
+        event_hooks={"request": [_trace_async_request], "response": [_record_async_response]}
+    )
+    return AsyncOpenAI(http_client=http_client, timeout=TIMEOUT, **options)
+
+
+def warm_up(client):
+    """Open a pooled connection with a cheap request (the model list); failures are only counted"""
+    try:
+        client.with_options(max_retries=0).models.list()
+        METRICS.count("warm_ups")
+    except Exception:
+        METRICS.count("warm_up_errors")
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_openai_client():
+    """Process-wide OpenAI client, created on first use and warmed up in the background"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                client = create_openai_client()
+                if WARM_UP:
+                    threading.Thread(target=warm_up, args=(client,), name="openai-warm-up", daemon=True).start()
+                _client = client
+    return _client
+
+
+def close_openai_client():
+    """Close the process-wide client and its connections; the next use creates a new one"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
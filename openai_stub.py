@@ -0,0 +1,244 @@
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for the OpenAI chat completions endpoint, for exercising the
+# advisor clients without network access or cost. Every request waits a
+# configurable latency and may fail with a configurable probability; the reply is
+# a chat.completion whose content is a recommendations JSON built from the profile
+# in the user message. Requests with "stream": true get the same content as
+# server-sent chat.completion.chunk events, a few characters every token_delay.
+#
+#   python openai_stub.py --port 8765 --latency 0.5 --failure-rate 0.1
+#   OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=stub streamlit run main.py
+
+
+@dataclass
+class StubConfig:
+    latency: float = 0.2         # Seconds before every reply
+    jitter: float = 0.0          # Extra uniform random latency, up to this many seconds
+    failure_rate: float = 0.0    # Share of requests answered with failure_status
+    failure_status: int = 500
+    token_delay: float = 0.0     # Seconds between streamed chunks (latency is the time to the first)
+    chunk_chars: int = 12        # Content characters per streamed chunk
+    seed: int = None
+
+
+def stub_recommendations(profile):
+    """Deterministic recommendations document for a profile dict"""
+    skills = profile.get("skills") or {}
+    names = sorted(skills, key=lambda skill: -skills[skill]) if isinstance(skills, dict) else list(skills)
+    interests = profile.get("interests") or ["Software Engineering"]
+    return {
+        "careers": [
+            {
+                "title": f"{interest} Engineer",
+                "match_score": max(50, 90 - 10 * i),
+                "description": f"Builds on {', '.join(names[:2]) or 'your skills'}",
+                "requirements": f"- {interest}\n- {names[0] if names else 'Programming'}",
+                "growth_potential": "High",
+                "next_steps": f"Deepen {interest}"
+            }
+            for i, interest in enumerate(interests[:3])
+        ],
+        "development_plan": f"Focus on {', '.join(interests)} over the next {profile.get('experience_years', '1-3')} years"
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+
+    def setup(self):
+        super().setup()
+        self.server.stub.count("connections")
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _write_chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _stream(self, stub, completion_id, model, content):
+        """Send content as server-sent chat.completion.chunk events over chunked encoding"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        step = max(1, stub.config.chunk_chars)
+        pieces = [content[i:i + step] for i in range(0, len(content), step)]
+        for i, piece in enumerate(pieces + [None]):
+            if i:
+                time.sleep(stub.config.token_delay)
+            event = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "delta": {"role": "assistant", "content": piece} if piece is not None else {},
+                    "finish_reason": None if piece is not None else "stop"
+                }]
+            }
+            self._write_chunk(b"data: " + json.dumps(event).encode("utf-8") + b"\n\n")
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
+
+    def do_GET(self):
+        # Model listing, which the client factory uses as its warm-up request
+        if self.path.rstrip("/") != "/v1/models":
+            self._reply(404, {"error": {"message": f"unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+        self._reply(200, {"object": "list", "data": [{"id": "gpt-4o", "object": "model", "created": 0, "owned_by": "stub"}]})
+
+    def do_POST(self):
+        stub = self.server.stub
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            self._reply(404, {"error": {"message": f"unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+        with stub.track_request():
+            time.sleep(stub.delay())
+            if stub.should_fail():
+                stub.count("failures")
+                self._reply(stub.config.failure_status, {"error": {"message": "stub failure", "type": "server_error"}})
+                return
+            try:
+                profile = json.loads(body["messages"][-1]["content"])
+            except (KeyError, IndexError, TypeError, ValueError):
+                profile = {}
+            completion_id = f"chatcmpl-stub-{stub.requests}"
+            model = body.get("model", "stub")
+            content = json.dumps(stub_recommendations(profile), indent=2)
+            if body.get("stream"):
+                self._stream(stub, completion_id, model, content)
+                return
+            # The whole completion is generated before a non-streamed reply is sent
+            time.sleep(stub.config.token_delay * (len(content) // max(1, stub.config.chunk_chars)))
+            self._reply(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop"
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+            })
+
+
+class StubServer:
+    """Chat completions stub served from a background thread; use as a context manager"""
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or StubConfig()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL for the OpenAI clients (base_url=...)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def delay(self):
+        with self._lock:
+            return self.config.latency + self._random.uniform(0, self.config.jitter)
+
+    def should_fail(self):
+        with self._lock:
+            return self._random.random() < self.config.failure_rate
+
+    @contextmanager
+    def track_request(self):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def serve_forever(self):
+        """Serve on the calling thread until interrupted"""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="openai-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "connections": self.connections,
+            "max_in_flight": self.max_in_flight
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve a local chat completions stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds before every reply")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of requests that fail")
+    parser.add_argument("--failure-status", type=int, default=500)
+    parser.add_argument("--token-delay", type=float, default=0.0, help="Seconds between streamed chunks")
+    parser.add_argument("--chunk-chars", type=int, default=12, help="Content characters per streamed chunk")
+    args = parser.parse_args()
+
+    config = StubConfig(args.latency, args.jitter, args.failure_rate, args.failure_status,
+                        args.token_delay, args.chunk_chars)
+    server = StubServer(config, args.host, args.port)
+    print(f"Serving chat completions at {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
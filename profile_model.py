@@ -0,0 +1,172 @@
+from bisect import bisect_right
+import hashlib
+import json
+import numpy as np
+from skill_catalog import lookup_domains
+from skill_scoring import (
+    effort_jitter, impact_jitter, effort_scores, impact_scores, goal_alignment_scores,
+    recommendation_codes, priority_scores, priority_level_codes, top_k_indices
+)
+from profile_stats import (
+    LEVEL_EDGES, STRENGTH_MIN_RATING, GAP_MAX_RATING, STATS_TOP_K, ProfileStats, compute_profile_stats
+)
+from report_cache import seed_from_key
+
+# Incremental model of the profile being assessed, kept in Streamlit session state.
+#
+# A ProfileModel is built for one skill list and goal set. It keeps running domain
+# sums, the level histogram, the strength and gap sets and the per-skill quadrant
+# and priority scores. Changing one rating updates all of them in O(1). The
+# score randomization and goal alignment are fixed per skill list and goals, so a
+# full rebuild is only needed when the catalog or the goals change. Rebuilds use
+# the shared statistics kernel; stats() hands the running aggregates back in the
+# same ProfileStats form, computed once per model version.
+
+
+def model_seed(skills, goals):
+    """RNG seed of the score randomization for a skill list and goal set"""
+    canonical = json.dumps([list(map(str, skills)), sorted(goals or [])], separators=(",", ":"))
+    return seed_from_key(hashlib.sha256(canonical.encode("utf-8")).hexdigest())
+
+
+def _level_code(rating):
+    # Same bins as np.digitize(rating, LEVEL_EDGES), without the array round trip
+    return bisect_right(LEVEL_EDGES, rating)
+
+
+class ProfileModel:
+    """Running aggregates of one profile's ratings, updated one skill at a time"""
+
+    def __init__(self, skills, goals=(), ratings=None):
+        self.skills = np.asarray(list(skills), dtype=object)
+        self.goals = sorted(goals or [])
+        self.position = {skill: i for i, skill in enumerate(self.skills)}
+        self.skill_domains = lookup_domains(self.skills)
+        self.domains = list(dict.fromkeys(self.skill_domains))
+        domain_index = {domain: code for code, domain in enumerate(self.domains)}
+        self.domain_codes = np.array([domain_index[d] for d in self.skill_domains], dtype=np.int64)
+
+        # Fixed for this skill list and goal set; only the ratings change afterwards
+        n = len(self.skills)
+        rng = np.random.default_rng(model_seed(self.skills, self.goals))
+        self.effort_jitter = effort_jitter(n, rng)
+        self.impact_jitter = impact_jitter(n, rng)
+        self.goal_alignment = goal_alignment_scores(self.skills, self.skill_domains, self.goals)
+
+        self.ratings = np.zeros(n)
+        if ratings is not None:
+            self.ratings[:] = [ratings[skill] for skill in self.skills]
+        self.version = 0
+        self._rebuild()
+
+    def _rebuild(self):
+        """Recompute every aggregate from the ratings array"""
+        ratings = self.ratings
+        stats = compute_profile_stats(ratings, self.domain_codes, len(self.domains))
+        self.total = float(ratings.sum())
+        self.domain_sums = stats.domain_sums[0].copy()
+        self.domain_counts = stats.domain_counts
+        self.level_counts = stats.level_counts[0].copy()
+        self.strengths = set(np.flatnonzero(stats.strength_mask[0]).tolist())
+        self.gaps = set(np.flatnonzero(stats.gap_mask[0]).tolist())
+        self._stats = None
+        self.effort = effort_scores(ratings, jitter=self.effort_jitter)
+        self.impact = impact_scores(ratings, jitter=self.impact_jitter)
+        self.recommendation = recommendation_codes(self.effort, self.impact)
+        self.priority_score = priority_scores(self.impact, self.effort, self.goal_alignment, ratings)
+        self.priority_level = priority_level_codes(self.priority_score)
+
+    def matches(self, skills, goals):
+        """Whether this model was built for the skill list and goals (otherwise rebuild it)"""
+        return len(skills) == len(self.skills) and all(
+            a == b for a, b in zip(skills, self.skills)
+        ) and sorted(goals or []) == self.goals
+
+    def set_rating(self, skill, rating):
+        """Apply a single rating change as O(1) deltas; returns False if nothing changed"""
+        i = self.position[skill]
+        old = self.ratings[i]
+        if old == rating:
+            return False
+        self.ratings[i] = rating
+        self.total += rating - old
+        self.domain_sums[self.domain_codes[i]] += rating - old
+        self.level_counts[_level_code(old)] -= 1
+        self.level_counts[_level_code(rating)] += 1
+        for members, inside in ((self.strengths, rating >= STRENGTH_MIN_RATING),
+                                (self.gaps, rating <= GAP_MAX_RATING)):
+            if inside:
+                members.add(i)
+            else:
+                members.discard(i)
+        effort = effort_scores(rating, jitter=self.effort_jitter[i])
+        impact = impact_scores(rating, jitter=self.impact_jitter[i])
+        self.effort[i] = effort
+        self.impact[i] = impact
+        self.recommendation[i] = recommendation_codes(effort, impact)
+        self.priority_score[i] = priority_scores(impact, effort, self.goal_alignment[i], rating)
+        self.priority_level[i] = priority_level_codes(self.priority_score[i])
+        self.version += 1
+        return True
+
+    def update(self, ratings):
+        """Apply a {skill: rating} dict; returns the skills whose rating changed"""
+        current = self.ratings
+        position = self.position
+        changed = [skill for skill, rating in ratings.items() if current[position[skill]] != rating]
+        for skill in changed:
+            self.set_rating(skill, ratings[skill])
+        return changed
+
+    def stats(self):
+        """The running aggregates as a one-profile ProfileStats, built once per model version"""
+        if self._stats is None or self._stats_version != self.version:
+            n = len(self.skills)
+            strength_mask = np.zeros((1, n), dtype=bool)
+            strength_mask[0, list(self.strengths)] = True
+            gap_mask = np.zeros((1, n), dtype=bool)
+            gap_mask[0, list(self.gaps)] = True
+            self._stats = ProfileStats(
+                average_rating=np.array([self.total / n if n else 0.0]),
+                domain_sums=self.domain_sums[None, :].copy(),
+                domain_counts=self.domain_counts,
+                level_counts=self.level_counts[None, :].copy(),
+                strength_mask=strength_mask,
+                gap_mask=gap_mask,
+                top=top_k_indices(self.ratings, STATS_TOP_K)[None, :],
+                bottom=top_k_indices(-self.ratings, STATS_TOP_K)[None, :]
+            )
+            self._stats_version = self.version
+        return self._stats
+
+    def top_priorities(self, k):
+        """Skill indices of the k highest priority scores, highest first"""
+        return top_k_indices(self.priority_score, k)
+
+    def report_arrays(self):
+        """Aggregates as the one-profile arrays compute_batch_report accepts as precomputed"""
+        return {
+            "stats": self.stats(),
+            "effort": self.effort[None, :].copy(),
+            "impact": self.impact[None, :].copy(),
+            "goal_alignment": self.goal_alignment[None, :].copy(),
+            "recommendation": self.recommendation[None, :].copy(),
+            "priority_score": self.priority_score[None, :].copy(),
+            "priority_level": self.priority_level[None, :].copy()
+        }
+
+
+def sync_profile_model(state, ratings, goals, key="profile_model"):
+    """The ProfileModel stored in state (e.g. st.session_state), brought up to date
+
+    Rebuilt when the skill list or goals changed; otherwise only the ratings that
+    differ from the model are applied, each as an O(1) delta.
+    """
+    model = state.get(key)
+    skills = list(ratings)
+    if model is None or not model.matches(skills, goals):
+        model = ProfileModel(skills, goals, ratings)
+        state[key] = model
+    else:
+        model.update(ratings)
+    return model
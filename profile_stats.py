@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+import numpy as np
+from skill_scoring import top_k_indices
+
+# Per-profile statistics kernel shared by the Quick Overview, the Skill Gap Analysis
+# and the Comprehensive Report. One call aggregates a compact (N, S) ratings array:
+# domain sums and means, level histograms, strength and gap masks and the top and
+# bottom rated skills. A single profile is simply N = 1.
+
+LEVEL_LABELS = ['Beginner (1)', 'Basic (2)', 'Intermediate (3)', 'Advanced (4)', 'Expert (5)']
+LEVEL_EDGES = [1.5, 2.5, 3.5, 4.5]  # Rating bins of LEVEL_LABELS
+
+# Ratings counted as strengths (at least) and gaps (at most)
+STRENGTH_MIN_RATING = 4
+GAP_MAX_RATING = 2
+
+STATS_TOP_K = 5  # Top and bottom rated skills kept per profile
+
+
+@dataclass
+class ProfileStats:
+    """Aggregates of N profiles rated on the same S skills (K domains)"""
+    average_rating: np.ndarray   # (N,)
+    domain_sums: np.ndarray      # (N, K)
+    domain_counts: np.ndarray    # (K,)
+    level_counts: np.ndarray     # (N, len(LEVEL_LABELS))
+    strength_mask: np.ndarray    # (N, S)
+    gap_mask: np.ndarray         # (N, S)
+    top: np.ndarray              # (N, k) skill indices, highest rating first
+    bottom: np.ndarray           # (N, k) skill indices, lowest rating first
+
+    def __len__(self):
+        return len(self.average_rating)
+
+    @property
+    def domain_avg(self):
+        return self.domain_sums / self.domain_counts
+
+    @property
+    def strengths_count(self):
+        return self.strength_mask.sum(axis=1)
+
+    @property
+    def gaps_count(self):
+        return self.gap_mask.sum(axis=1)
+
+    def top_strengths(self, i=0):
+        """Indices of profile i's strengths among its top-rated skills, highest first"""
+        return [j for j in self.top[i] if self.strength_mask[i, j]]
+
+    def top_gaps(self, i=0):
+        """Indices of profile i's gaps among its lowest-rated skills, lowest first"""
+        return [j for j in self.bottom[i] if self.gap_mask[i, j]]
+
+
+def level_histogram(level_codes, n_levels=len(LEVEL_LABELS)):
+    """Count of every level code per row of an (N, S) code array"""
+    n = len(level_codes)
+    offsets = level_codes + n_levels * np.arange(n)[:, None]
+    return np.bincount(offsets.ravel(), minlength=n * n_levels).reshape(n, n_levels)
+
+
+def compute_profile_stats(ratings, domain_codes, n_domains, k=STATS_TOP_K):
+    """ProfileStats of an (N, S) ratings array (or one (S,) profile); domain_codes is (S,)"""
+    ratings = np.atleast_2d(np.asarray(ratings, dtype=float))
+    n, s = ratings.shape
+    # Domain sums through a skills x domains membership matrix
+    membership = np.zeros((s, n_domains))
+    membership[np.arange(s), domain_codes] = 1
+    return ProfileStats(
+        average_rating=ratings.mean(axis=1),
+        domain_sums=ratings @ membership,
+        domain_counts=membership.sum(axis=0),
+        level_counts=level_histogram(np.digitize(ratings, LEVEL_EDGES)),
+        strength_mask=ratings >= STRENGTH_MIN_RATING,
+        gap_mask=ratings <= GAP_MAX_RATING,
+        top=top_k_indices(ratings, k),
+        bottom=top_k_indices(-ratings, k)
+    )
@@ -0,0 +1,267 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from report_cache import ReportCache
+
+# Two-tier cache for career recommendation responses.
+#
+# Requests are keyed by a normalized profile: skills sorted, experience bucketed,
+# interests sorted and deduplicated, so equivalent profiles share one entry. The
+# first tier is an in-process LRU; the second is a SQLite file in WAL mode, so warm
+# entries survive restarts and are shared by every worker on the machine. Entries
+# expire after RECOMMENDATION_CACHE_TTL_SECONDS. Every entry is stored under the
+# fingerprint of the model and system prompt that produced it, so changing either
+# makes the old entries unreachable. Workers sharing the file may run different
+# fingerprints (during a rolling deploy), so opening a cache only deletes expired
+# rows; entries of fingerprints that have stopped writing are removed by an explicit
+# maintenance run once they have been idle for a grace period:
+#
+#   python recommendation_cache.py --purge-stale --grace-hours 24
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+DB_PATH = os.environ.get("RECOMMENDATION_CACHE_PATH", os.path.join(CACHE_DIR, "recommendations.sqlite3"))
+TTL_SECONDS = float(os.environ.get("RECOMMENDATION_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+MEMORY_ENTRIES = int(os.environ.get("RECOMMENDATION_CACHE_MEMORY_ENTRIES", 256))
+BUSY_TIMEOUT_SECONDS = 5.0  # How long a writer waits for another process's write lock
+STALE_GRACE_SECONDS = float(os.environ.get("RECOMMENDATION_CACHE_STALE_GRACE_SECONDS", 24 * 3600))
+
+# Upper bounds (exclusive) of the experience buckets, in years
+EXPERIENCE_BUCKETS = [1, 3, 5, 8, 12, 20]
+
+
+def experience_bucket(years):
+    """Experience range label such as "3-5" ("20+" past the last bucket)"""
+    years = max(0.0, float(years))
+    lower = 0
+    for upper in EXPERIENCE_BUCKETS:
+        if years < upper:
+            return f"{lower}-{upper}"
+        lower = upper
+    return f"{lower}+"
+
+
+def _names(values):
+    if isinstance(values, str):
+        values = [values]
+    return sorted({str(value).strip() for value in values or [] if str(value).strip()})
+
+
+def _rating(value):
+    value = float(value)
+    return int(value) if value.is_integer() else round(value, 2)
+
+
+def normalize_profile(skills, experience_years, education_level, interests):
+    """Canonical profile: sorted skills (names or a {skill: rating} dict), bucketed experience, sorted interests"""
+    if isinstance(skills, dict):
+        skills = {str(skill).strip(): _rating(rating) for skill, rating in sorted(skills.items())}
+    else:
+        skills = _names(skills)
+    return {
+        "skills": skills,
+        "experience_years": experience_bucket(experience_years),
+        "education_level": str(education_level or "").strip(),
+        "interests": _names(interests)
+    }
+
+
+def profile_cache_key(profile):
+    """SHA-256 hash of a normalized profile"""
+    canonical = json.dumps(profile, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def prompt_fingerprint(model, system_message):
+    """Hash of the model name and system prompt; responses are only reused under the same one"""
+    canonical = json.dumps([model, system_message], separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class SQLiteResponseStore:
+    """Responses on disk, shared by threads and processes through SQLite in WAL mode"""
+
+    def __init__(self, path=DB_PATH, clock=time.time):
+        self.path = path
+        self._clock = clock
+        self._local = threading.local()  # sqlite3 connections are per thread
+        self._connection()
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Autocommit: every statement is its own short transaction
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " fingerprint TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " PRIMARY KEY (fingerprint, key)"
+                ") WITHOUT ROWID"
+            )
+            self._local.connection = connection
+        return connection
+
+    def get(self, fingerprint, key):
+        """(value text, expires_at) of a live entry, None when missing or expired"""
+        return self._connection().execute(
+            "SELECT value, expires_at FROM responses WHERE fingerprint = ? AND key = ? AND expires_at > ?",
+            (fingerprint, key, self._clock())
+        ).fetchone()
+
+    def put(self, fingerprint, key, value, ttl):
+        now = self._clock()
+        self._connection().execute(
+            "INSERT OR REPLACE INTO responses (fingerprint, key, value, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+            (fingerprint, key, value, now, now + ttl)
+        )
+
+    def purge_expired(self):
+        """Delete expired entries of every fingerprint; returns the count deleted"""
+        return self._connection().execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (self._clock(),)
+        ).rowcount
+
+    def purge_stale(self, grace=STALE_GRACE_SECONDS, keep=None):
+        """Delete every entry of fingerprints with no write for grace seconds, except keep; returns the count deleted"""
+        return self._connection().execute(
+            "DELETE FROM responses WHERE fingerprint IN ("
+            " SELECT fingerprint FROM responses GROUP BY fingerprint HAVING MAX(created_at) <= ?"
+            ") AND fingerprint IS NOT ?",
+            (self._clock() - grace, keep)
+        ).rowcount
+
+    def delete(self, fingerprint):
+        """Delete every entry of a fingerprint"""
+        self._connection().execute("DELETE FROM responses WHERE fingerprint = ?", (fingerprint,))
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+class RecommendationCache:
+    """Recommendation responses by normalized profile: an in-process LRU over a SQLite file
+
+    Disk errors (a read-only or locked file) are counted and treated as misses, so the
+    cache never makes a recommendation fail. Pass path=None for a memory-only cache.
+    """
+
+    def __init__(self, fingerprint, path=DB_PATH, ttl=TTL_SECONDS, memory_entries=MEMORY_ENTRIES, clock=time.time):
+        self.fingerprint = fingerprint
+        self.ttl = ttl
+        self._clock = clock
+        self.memory = ReportCache(max_entries=memory_entries, ttl=ttl, clock=clock)
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk_errors = 0
+        self.purged = 0
+        self.disk = None
+        if path:
+            try:
+                self.disk = SQLiteResponseStore(path, clock=clock)
+                self.purged = self.disk.purge_expired()
+            except (sqlite3.Error, OSError):
+                self.disk_errors += 1
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, profile):
+        """Cached response of a normalized profile, None on a miss"""
+        key = profile_cache_key(profile)
+        text = self.memory.get(key)
+        if text is not None:
+            self._count("memory_hits")
+            return json.loads(text)
+        if self.disk is not None:
+            try:
+                row = self.disk.get(self.fingerprint, key)
+            except sqlite3.Error:
+                row = None
+                self._count("disk_errors")
+            if row is not None:
+                text, expires_at = row
+                # Promoted entries expire with their disk row
+                self.memory.put(key, text, ttl=expires_at - self._clock())
+                self._count("disk_hits")
+                return json.loads(text)
+        self._count("misses")
+        return None
+
+    def put(self, profile, value):
+        key = profile_cache_key(profile)
+        text = json.dumps(value, ensure_ascii=False)
+        self.memory.put(key, text)
+        if self.disk is not None:
+            try:
+                self.disk.put(self.fingerprint, key, text, self.ttl)
+            except sqlite3.Error:
+                self._count("disk_errors")
+        return value
+
+    def get_or_compute(self, profile, compute):
+        """Cached response of a normalized profile, calling compute() and storing its result on a miss"""
+        value = self.get(profile)
+        if value is None:
+            value = self.put(profile, compute())
+        return value
+
+    def purge_stale(self, grace=STALE_GRACE_SECONDS):
+        """Delete the disk entries of other fingerprints that have been idle for grace seconds"""
+        if self.disk is None:
+            return 0
+        return self.disk.purge_stale(grace, keep=self.fingerprint)
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.delete(self.fingerprint)
+
+    def stats(self):
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_hit_rate": self.memory_hits / lookups if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "disk_errors": self.disk_errors,
+            "purged": self.purged
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Maintain the recommendation cache file")
+    parser.add_argument("--path", default=DB_PATH)
+    parser.add_argument("--purge-stale", action="store_true",
+                        help="Also delete the entries of fingerprints idle for longer than the grace period")
+    parser.add_argument("--grace-hours", type=float, default=STALE_GRACE_SECONDS / 3600)
+    args = parser.parse_args()
+
+    store = SQLiteResponseStore(args.path)
+    print(f"{store.purge_expired()} expired entries deleted")
+    if args.purge_stale:
+        print(f"{store.purge_stale(args.grace_hours * 3600)} entries of stale fingerprints deleted")
+    print(f"{len(store)} entries left in {args.path}")
@@ -0,0 +1,402 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+import plotly
+import plotly.graph_objects as go
+from report_engine import (
+    PRIORITY_TOP_K, MILESTONE_LEVELS, get_skill_domain, generate_benchmark_data, generate_growth_projection,
+    annotate_milestones, generate_quadrant_analysis, generate_skill_priorities, growth_learning_rates,
+    goal_aligned_domains, solve_milestones, milestone_frame, rank_within_domains, profile_heatmap,
+    team_heatmap, compute_batch_report
+)
+from profile_stats import compute_profile_stats
+from skill_catalog import SKILL_CATEGORIES, DOMAIN_KEYWORDS, classify_skill_domain, lookup_domains
+from industry_benchmarks import ROLE_MODIFIERS
+
+# Benchmark suite for the report computations, independent of Streamlit.
+#
+#   python report_benchmarks.py                      # full grid, compared with the baseline
+#   python report_benchmarks.py --update-baseline    # time the grid BASELINE_RUNS times, store the medians
+#   python report_benchmarks.py --skills 24 --profiles 1,1000 --cases compute_batch_report
+#
+# Every case runs over a grid of catalog sizes x cohort sizes on seeded synthetic data.
+# Per-profile APIs are called once per profile; cells that would take minutes with them
+# (or need more memory than a workstation has) are skipped and listed as such.
+#
+# A baseline cell holds the median of the best times of several runs and their
+# relative spread; a cell only regresses when it is slower than the threshold plus
+# that spread, and it still is when re-timed.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "data", "benchmark_baseline.json")
+DEFAULT_OUTPUT = "benchmark_results.json"
+
+SKILL_SIZES = [24, 500, 5000]
+PROFILE_SIZES = [1, 1000, 100000]
+# Allowed slowdown over the baseline (fraction). Shared single-core machines swing by
+# about 25% between runs; tighten this on quiet hardware.
+DEFAULT_THRESHOLD = float(os.environ.get("REPORT_BENCH_THRESHOLD", 0.5))
+MIN_REGRESSION_MS = 5.0       # Slowdowns smaller than this are treated as noise
+BASELINE_RUNS = 3             # Suite runs whose per-cell median becomes the baseline
+CONFIRM_RUNS = 3              # Re-timings of a cell that looks slower; the best one counts
+REPEAT_UNDER_SECONDS = 0.2    # Cells faster than this are repeated and the best run kept
+REPEAT_BUDGET_SECONDS = 0.5   # Fast cells keep repeating until they have used this much time
+MAX_REPEATS = 200
+
+GOALS = ["Cloud Architecture", "Data Science & ML", "Full-Stack Development", "Technical Leadership"]
+
+
+@dataclass
+class BenchData:
+    """Seeded synthetic cohort: N profiles rating S skills"""
+    skills: np.ndarray
+    skill_domains: np.ndarray
+    domains: list
+    domain_codes: np.ndarray
+    ratings: np.ndarray        # (N, S)
+    domain_avg: np.ndarray     # (N, K)
+    roles: list
+    experience: np.ndarray
+    goals: list
+    seed: int
+
+
+def make_skills(n_skills):
+    """Catalog skills first, then synthetic names that exercise the keyword classifier"""
+    catalog = [skill for skills in SKILL_CATEGORIES.values() for skill in skills]
+    keywords = [keyword for words in DOMAIN_KEYWORDS.values() for keyword in words] + ["quantum", "robotics"]
+    extra = [f"{keywords[i % len(keywords)].title()} Skill {i}" for i in range(max(0, n_skills - len(catalog)))]
+    return np.array((catalog + extra)[:n_skills], dtype=object)
+
+
+def make_data(n_skills, n_profiles, seed=0):
+    rng = np.random.default_rng(seed)
+    skills = make_skills(n_skills)
+    skill_domains = lookup_domains(skills)
+    domains = list(dict.fromkeys(skill_domains))
+    domain_codes = np.array([domains.index(d) for d in skill_domains], dtype=np.int64)
+    ratings = rng.integers(1, 6, size=(n_profiles, n_skills)).astype(float)
+    membership = np.zeros((n_skills, len(domains)))
+    membership[np.arange(n_skills), domain_codes] = 1
+    role_names = list(ROLE_MODIFIERS)
+    goal_choices = rng.integers(0, len(GOALS), size=(n_profiles, 2))
+    return BenchData(
+        skills=skills,
+        skill_domains=skill_domains,
+        domains=domains,
+        domain_codes=domain_codes,
+        ratings=ratings,
+        domain_avg=ratings @ membership / membership.sum(axis=0),
+        roles=[role_names[i] for i in rng.integers(0, len(role_names), size=n_profiles)],
+        experience=rng.uniform(0, 15, size=n_profiles),
+        goals=[sorted({GOALS[a], GOALS[b]}) for a, b in goal_choices],
+        seed=seed
+    )
+
+
+def _domain_frames(data):
+    return [pd.DataFrame({'Domain': data.domains, 'Rating': row}) for row in data.domain_avg]
+
+
+def _skill_frames(data):
+    return [pd.DataFrame({'Skill': data.skills, 'Rating': row, 'Domain': data.skill_domains}) for row in data.ratings]
+
+
+@dataclass
+class Case:
+    """A benchmarked function: setup() builds untimed inputs, run() is timed"""
+    name: str
+    setup: object
+    run: object
+    per_profile: bool = True     # False when the work does not depend on the cohort size
+    max_profiles: int = None     # Per-profile APIs stop here; bigger cohorts use compute_batch_report
+    max_cells: float = None      # Limit on profiles x skills for vectorized cases (memory)
+
+    def skip_reason(self, n_skills, n_profiles):
+        if not self.per_profile and n_profiles != 1:
+            return "independent of the cohort size"
+        if self.max_profiles is not None and n_profiles > self.max_profiles:
+            return f"per-profile API, limited to {self.max_profiles:,} profiles"
+        if self.max_cells is not None and n_skills * n_profiles > self.max_cells:
+            return f"more than {self.max_cells:,.0f} profile x skill cells"
+        return None
+
+
+def _skill_domain_setup(data):
+    classify_skill_domain.cache_clear()  # Measure first-time classification of the catalog
+    return data
+
+
+def _milestone_setup(data):
+    months = []
+    for i in range(len(data.ratings)):
+        aligned = goal_aligned_domains(data.domains, data.goals[i])
+        rates = growth_learning_rates(data.domain_avg[i], data.experience[i], aligned)
+        months.append(milestone_frame(data.domains, MILESTONE_LEVELS, solve_milestones(data.domain_avg[i], rates)))
+    return [(go.Figure(), frame) for frame in months]
+
+
+def _priorities_setup(data):
+    rng = np.random.default_rng(data.seed)
+    return [generate_quadrant_analysis(frame, goals, rng) for frame, goals in zip(_skill_frames(data), data.goals)]
+
+
+def _heatmap_setup(data):
+    return data, rank_within_domains(data.ratings, data.domain_codes, len(data.domains))
+
+
+PER_PROFILE_LIMIT = 1000
+
+CASES = [
+    Case("get_skill_domain", _skill_domain_setup,
+         lambda data: [get_skill_domain(skill) for skill in data.skills], per_profile=False),
+    Case("generate_benchmark_data", lambda data: (data, _domain_frames(data)),
+         lambda state: [generate_benchmark_data(frame, state[0].roles[i], state[0].experience[i])
+                        for i, frame in enumerate(state[1])],
+         max_profiles=PER_PROFILE_LIMIT),
+    Case("generate_growth_projection", lambda data: (data, _domain_frames(data)),
+         lambda state: [generate_growth_projection(frame, state[0].experience[i], state[0].goals[i])
+                        for i, frame in enumerate(state[1])],
+         max_profiles=PER_PROFILE_LIMIT),
+    Case("annotate_milestones", _milestone_setup,
+         lambda figures: [annotate_milestones(fig, frame) for fig, frame in figures],
+         max_profiles=PER_PROFILE_LIMIT),
+    Case("generate_quadrant_analysis", lambda data: (data, _skill_frames(data), np.random.default_rng(data.seed)),
+         lambda state: [generate_quadrant_analysis(frame, state[0].goals[i], state[2])
+                        for i, frame in enumerate(state[1])],
+         max_profiles=PER_PROFILE_LIMIT),
+    Case("generate_skill_priorities", _priorities_setup,
+         lambda frames: [generate_skill_priorities(frame, top_k=PRIORITY_TOP_K) for frame in frames],
+         max_profiles=PER_PROFILE_LIMIT),
+    Case("rank_within_domains", lambda data: data,
+         lambda data: rank_within_domains(data.ratings, data.domain_codes, len(data.domains)),
+         max_cells=2e7),
+    Case("profile_heatmap", _heatmap_setup,
+         lambda state: [profile_heatmap(state[0].skills, state[0].domains, values, order)
+                        for values, order in zip(*state[1])],
+         max_profiles=PER_PROFILE_LIMIT),
+    Case("team_heatmap", lambda data: data,
+         lambda data: team_heatmap([f"Member {i}" for i in range(len(data.ratings))], data.skills, data.ratings),
+         max_cells=2e7),
+    Case("compute_profile_stats", lambda data: data,
+         lambda data: compute_profile_stats(data.ratings, data.domain_codes, len(data.domains)),
+         max_cells=2e7),
+    Case("compute_batch_report", lambda data: (data, np.random.default_rng(data.seed)),
+         lambda state: compute_batch_report(state[0].skills, state[0].ratings, state[0].experience,
+                                            "Bachelor's Degree", state[0].roles, state[0].goals, rng=state[1]),
+         max_cells=5e6),
+]
+
+
+def time_case(case, data, repeats):
+    """Best wall time of case.run, each run with fresh setup
+
+    Slow cells run once. Fast ones run at least `repeats` times and keep going until
+    REPEAT_BUDGET_SECONDS are used, which keeps millisecond cells stable between runs.
+    """
+    best, spent, attempts = None, 0.0, 0
+    while attempts < MAX_REPEATS:
+        state = case.setup(data)
+        gc.collect()
+        gc.disable()  # As in timeit: keep collector pauses out of the measurement
+        try:
+            started = time.perf_counter()
+            case.run(state)
+            elapsed = time.perf_counter() - started
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+        spent += elapsed
+        attempts += 1
+        if elapsed >= REPEAT_UNDER_SECONDS or (attempts >= repeats and spent >= REPEAT_BUDGET_SECONDS):
+            break
+    return best
+
+
+def result_key(case_name, n_skills, n_profiles):
+    return f"{case_name}|{n_skills}|{n_profiles}"
+
+
+def run_suite(cases, skill_sizes, profile_sizes, repeats=3, seed=0, log=print):
+    """Time every case on every grid cell; returns the results document"""
+    results = {}
+    for n_skills in skill_sizes:
+        for n_profiles in profile_sizes:
+            runnable = [case for case in cases if case.skip_reason(n_skills, n_profiles) is None]
+            for case in cases:
+                reason = case.skip_reason(n_skills, n_profiles)
+                if reason is not None:
+                    results[result_key(case.name, n_skills, n_profiles)] = {"status": "skipped", "reason": reason}
+            if not runnable:
+                continue
+            data = make_data(n_skills, n_profiles, seed)
+            for case in runnable:
+                seconds = time_case(case, data, repeats)
+                results[result_key(case.name, n_skills, n_profiles)] = {
+                    "status": "ok",
+                    "seconds": seconds,
+                    "profiles_per_second": n_profiles / seconds if seconds > 0 else None
+                }
+                log(f"{case.name:<28} {n_skills:>6} skills {n_profiles:>7} profiles  {seconds * 1000:10.2f} ms")
+            del data
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "plotly": plotly.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpus": os.cpu_count(),
+            "seed": seed,
+            "repeats": repeats
+        },
+        "results": results
+    }
+
+
+def run_baseline(cases, skill_sizes, profile_sizes, runs=BASELINE_RUNS, repeats=3, seed=0, log=print):
+    """run_suite several times; every cell keeps the median time and the spread (max - min) / median"""
+    documents = []
+    for run in range(runs):
+        log(f"Baseline run {run + 1}/{runs}")
+        documents.append(run_suite(cases, skill_sizes, profile_sizes, repeats, seed, log))
+    results = {}
+    for key, first in documents[0]["results"].items():
+        if first["status"] != "ok":
+            results[key] = first
+            continue
+        times = np.array([document["results"][key]["seconds"] for document in documents])
+        median = float(np.median(times))
+        results[key] = {
+            "status": "ok",
+            "seconds": median,
+            "spread": float((times.max() - times.min()) / median) if median > 0 else 0.0,
+            "profiles_per_second": first["profiles_per_second"] * first["seconds"] / median if median > 0 else None
+        }
+    meta = dict(documents[0]["meta"], runs=runs)
+    return {"meta": meta, "results": results}
+
+
+def _slower(seconds, previous, threshold, min_delta_ms):
+    """Ratio to the baseline cell when seconds exceeds its allowance, else None"""
+    ratio = seconds / previous["seconds"] if previous["seconds"] > 0 else float("inf")
+    allowed = 1 + threshold + previous.get("spread", 0.0)
+    if ratio > allowed and (seconds - previous["seconds"]) * 1000 > min_delta_ms:
+        return ratio
+    return None
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, min_delta_ms=MIN_REGRESSION_MS):
+    """(key, current seconds, baseline seconds, ratio) for every cell slower than the threshold allows
+
+    A cell's allowance is the threshold plus the run-to-run spread recorded in its baseline.
+    """
+    regressions = []
+    for key, current in results["results"].items():
+        previous = baseline.get("results", {}).get(key)
+        if current["status"] != "ok" or not previous or previous.get("status") != "ok":
+            continue
+        ratio = _slower(current["seconds"], previous, threshold, min_delta_ms)
+        if ratio is not None:
+            regressions.append((key, current["seconds"], previous["seconds"], ratio))
+    return regressions
+
+
+def confirm_regressions(regressions, cases, baseline, threshold=DEFAULT_THRESHOLD, min_delta_ms=MIN_REGRESSION_MS,
+                        runs=CONFIRM_RUNS, repeats=3, seed=0):
+    """Re-time the cells compare() flagged; keep those whose best re-timing is still too slow"""
+    by_name = {case.name: case for case in cases}
+    confirmed = []
+    for key, current, previous, ratio in regressions:
+        name, n_skills, n_profiles = key.split("|")
+        data = make_data(int(n_skills), int(n_profiles), seed)
+        seconds = min([current] + [time_case(by_name[name], data, repeats) for _ in range(runs)])
+        del data
+        ratio = _slower(seconds, baseline["results"][key], threshold, min_delta_ms)
+        if ratio is not None:
+            confirmed.append((key, seconds, previous, ratio))
+    return confirmed
+
+
+def _sizes(text):
+    return [int(value) for value in text.split(",") if value]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the report computations across catalog and cohort sizes")
+    parser.add_argument("--skills", type=_sizes, default=SKILL_SIZES, help="Comma-separated catalog sizes")
+    parser.add_argument("--profiles", type=_sizes, default=PROFILE_SIZES, help="Comma-separated cohort sizes")
+    parser.add_argument("--cases", default=None, help="Comma-separated case names (default: all)")
+    parser.add_argument("--repeats", type=int, default=3, help="Minimum runs per fast cell; the best one is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write this run's results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Results to compare against")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Time the cells --baseline-runs times and store their medians in the baseline file")
+    parser.add_argument("--baseline-runs", type=int, default=BASELINE_RUNS, help="Suite runs behind a baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown over the baseline, e.g. 0.25 for 25%%")
+    parser.add_argument("--min-delta-ms", type=float, default=MIN_REGRESSION_MS,
+                        help="Ignore slowdowns smaller than this many milliseconds")
+    args = parser.parse_args(argv)
+
+    cases = CASES
+    if args.cases:
+        wanted = set(args.cases.split(","))
+        unknown = wanted - {case.name for case in CASES}
+        if unknown:
+            parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+        cases = [case for case in CASES if case.name in wanted]
+
+    if args.update_baseline:
+        results = run_baseline(cases, args.skills, args.profiles, args.baseline_runs, args.repeats, args.seed)
+    else:
+        results = run_suite(cases, args.skills, args.profiles, args.repeats, args.seed)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {args.output}")
+
+    if args.update_baseline:
+        # Cells of this run replace their baseline entries; cells it did not run are kept
+        baseline = {"results": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline["meta"] = results["meta"]
+        baseline["results"].update(results["results"])
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Wrote {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+    if regressions:
+        print(f"Re-timing {len(regressions)} slower cells")
+        regressions = confirm_regressions(regressions, cases, baseline, args.threshold, args.min_delta_ms,
+                                          repeats=args.repeats, seed=args.seed)
+    for key, current, previous, ratio in regressions:
+        print(f"REGRESSION {key}: {previous * 1000:.2f} ms -> {current * 1000:.2f} ms ({ratio:.2f}x)")
+    if regressions:
+        print(f"{len(regressions)} cells slower than the baseline by more than {args.threshold:.0%}")
+        return 1
+    print(f"No regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+import numpy as np
+import pandas as pd
+
+# Process-wide cache for computed reports and serialized figures. Streamlit imports
+# this module once per server process, so entries are shared by reruns and sessions.
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get("REPORT_CACHE_MAX_ENTRIES", 1024))
+DEFAULT_MAX_BYTES = int(float(os.environ.get("REPORT_CACHE_MAX_MB", 128)) * 1024 * 1024)
+DEFAULT_TTL_SECONDS = float(os.environ.get("REPORT_CACHE_TTL_SECONDS", 3600))
+
+
+def profile_key(ratings, experience, education, role, goals):
+    """Canonical SHA-256 hash of a profile, independent of dict and goal ordering"""
+    canonical = json.dumps(
+        {
+            "ratings": sorted((str(skill), float(rating)) for skill, rating in ratings.items()),
+            "experience": float(experience),
+            "education": education,
+            "role": role,
+            "goals": sorted(goals or [])
+        },
+        separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def seed_from_key(key):
+    """Deterministic RNG seed derived from a profile key"""
+    return int(key[:16], 16)
+
+
+def estimate_size(value):
+    """Approximate memory footprint of a cached value in bytes"""
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, np.ndarray):
+        return value.nbytes if value.dtype != object else value.size * 64
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(deep=True)))
+    if is_dataclass(value):
+        return sum(estimate_size(getattr(value, f.name)) for f in fields(value))
+    if isinstance(value, dict):
+        return sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class ReportCache:
+    """Thread-safe LRU cache with a TTL, an entry limit and a memory cap"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES,
+                 ttl=DEFAULT_TTL_SECONDS, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (value, size, expires_at)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[2] > self._clock()
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if entry[2] <= self._clock():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size=None, ttl=None):
+        """Store value under key; ttl overrides the cache's TTL for this entry"""
+        size = estimate_size(value) if size is None else size
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return value  # Too large to ever fit
+            self._entries[key] = (value, size, self._clock() + (self.ttl if ttl is None else ttl))
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, computing and storing it on a miss"""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+
+REPORT_CACHE = ReportCache()
@@ -0,0 +1,784 @@
+import time
+from dataclasses import dataclass, field
+import pandas as pd
+import numpy as np
+from skill_scoring import (
+    RECOMMENDATIONS, PRIORITY_LEVELS, effort_scores, impact_scores, goal_alignment_scores,
+    recommendation_codes, score_skills, priority_scores, priority_level_codes, priority_levels, top_k_indices
+)
+from industry_benchmarks import lookup_benchmarks
+from skill_catalog import DOMAIN_NAMES, lookup_domain, lookup_domain_codes, lookup_domains
+from profile_stats import (
+    LEVEL_LABELS, LEVEL_EDGES, ProfileStats, compute_profile_stats
+)
+from report_profiler import profiled, stage
+
+# Pure computation layer behind the Comprehensive Report. Nothing in this module
+# touches Streamlit, so reports can be produced offline for any number of profiles.
+
+# Goal keywords that speed up the projected growth of a domain
+GROWTH_GOAL_KEYWORDS = {
+    "Programming": ["Development", "Stack", "Mobile"],
+    "Data & Analytics": ["Data", "ML", "Science"],
+    "Infrastructure": ["Cloud", "DevOps", "Security"],
+    "Soft Skills": ["Leadership", "Management"]
+}
+
+GROWTH_MONTHS = 12  # Project for one year by default
+
+# Projection time units expressed in months, the unit of the learning rates
+GROWTH_TIME_UNITS = {
+    "week": 12 / 52,
+    "month": 1.0,
+    "quarter": 3.0,
+    "year": 12.0
+}
+
+MAX_GROWTH_HORIZON_MONTHS = 120  # Ten years
+
+# Named skill levels reported as growth milestones
+MILESTONE_LEVELS = {
+    "Advanced": 4.0,
+    "Expert": 4.5
+}
+
+
+def get_skill_domain(skill, all_skills=None):
+    """Determine which domain a skill belongs to (all_skills is kept for compatibility and ignored)"""
+    return lookup_domain(skill)
+
+
+def generate_benchmark_data(domain_avg, role, experience):
+    """Generate realistic benchmark data based on role and experience"""
+    # Read benchmarks for all domains from the precomputed table
+    benchmark_df = domain_avg.copy()
+    benchmark_df['Benchmark'] = lookup_benchmarks([role], [experience], benchmark_df['Domain'])[0]
+    benchmark_df = benchmark_df.rename(columns={'Rating': 'Your Rating'})
+    
+    return benchmark_df
+
+
+def get_base_learning_rate(experience):
+    """Monthly learning rate before goal and difficulty adjustments"""
+    if experience < 2:
+        return 0.20  # Faster progress for beginners
+    elif experience < 5:
+        return 0.15  # Moderate progress for mid-level
+    return 0.10  # Slower progress for experienced pros
+
+
+def goal_aligned_domains(domains, learning_goals):
+    """Boolean array marking the domains that align with any learning goal"""
+    return np.array([
+        any(any(kw in goal for kw in GROWTH_GOAL_KEYWORDS.get(domain, [])) for goal in learning_goals)
+        for domain in domains
+    ], dtype=bool)
+
+
+def growth_learning_rates(levels, experience, aligned):
+    """Monthly learning rates for (..., domains) levels; experience broadcasts over the leading axes"""
+    experience = np.asarray(experience, dtype=float)
+    base_rate = np.select([experience < 2, experience < 5], [0.20, 0.15], 0.10)
+    difficulty_factor = 1 - np.asarray(levels) / 6  # Higher current level = slower progress
+    return np.expand_dims(base_rate, -1) * np.where(aligned, 1.5, 0.8) * difficulty_factor
+
+
+def growth_time_grid(horizon=GROWTH_MONTHS, step=1, unit="month"):
+    """Projection time points in months, from 0 to horizon inclusive, with horizon and step given in unit"""
+    if unit not in GROWTH_TIME_UNITS:
+        raise ValueError(f"Unknown time unit '{unit}', expected one of {list(GROWTH_TIME_UNITS)}")
+    if horizon <= 0 or step <= 0:
+        raise ValueError("Projection horizon and step must be positive")
+    months_per_unit = GROWTH_TIME_UNITS[unit]
+    if horizon * months_per_unit > MAX_GROWTH_HORIZON_MONTHS + 1e-9:
+        raise ValueError(f"Projection horizon is limited to {MAX_GROWTH_HORIZON_MONTHS // 12} years")
+    steps = int(np.floor(horizon / step + 1e-9))
+    return np.arange(steps + 1) * (step * months_per_unit)
+
+
+def project_growth(levels, rates, months, dtype=np.float64):
+    """Evaluate level + (5 - level)(1 - e^(-rt)) on a (..., domains) x time grid in one expression
+
+    Pass dtype=np.float32 for large cohort grids to halve memory traffic.
+    """
+    levels = np.asarray(levels, dtype=dtype)[..., None]
+    rates = np.asarray(rates, dtype=dtype)[..., None]
+    # Written with in-place ufuncs so a cohort grid allocates a single output array
+    projection = np.multiply(rates, -np.asarray(months, dtype=dtype))
+    np.expm1(projection, out=projection)       # e^(-rt) - 1
+    projection *= levels - 5                   # (5 - level)(1 - e^(-rt))
+    projection += levels
+    return np.minimum(projection, 5.0, out=projection)
+
+
+def growth_long_format(domains, months, projection):
+    """Long-format DataFrame of a (domains, time) projection for plotting"""
+    return pd.DataFrame({
+        'Domain': np.repeat(np.asarray(domains, dtype=object), len(months)),
+        'Month': np.tile(months, len(domains)),
+        'Projected Level': np.asarray(projection).ravel()
+    })
+
+
+def generate_growth_projection(domain_avg, experience, learning_goals, horizon=GROWTH_MONTHS, step=1,
+                               unit="month", long_format=True):
+    """Generate growth projection data for skills over time
+
+    Returns the long-format DataFrame used by the chart, or the (months, domains x time array)
+    pair when long_format is False.
+    """
+    domains = domain_avg['Domain'].to_numpy()
+    levels = domain_avg['Rating'].to_numpy(dtype=float)
+    rates = growth_learning_rates(levels, experience, goal_aligned_domains(domains, learning_goals))
+    months = growth_time_grid(horizon, step, unit)
+    projection = project_growth(levels, rates, months)
+    if not long_format:
+        return months, projection
+    return growth_long_format(domains, months, projection)
+
+
+def solve_milestones(levels, rates, thresholds=None):
+    """Exact months until (..., domains) levels reach each threshold level
+
+    Inverts level + (5 - level)(1 - e^(-rt)) = target, giving t = -ln(1 - (target - level)/(5 - level)) / r.
+    Returns a (..., domains, thresholds) array: 0 where the target is already reached and inf where the
+    growth model never reaches it (targets of 5 or more, or a zero learning rate).
+    """
+    if thresholds is None:
+        thresholds = MILESTONE_LEVELS
+    if isinstance(thresholds, dict):
+        thresholds = list(thresholds.values())
+    targets = np.asarray(thresholds, dtype=float)
+    levels = np.asarray(levels, dtype=float)[..., None]
+    rates = np.asarray(rates, dtype=float)[..., None]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        months = -np.log1p(-(targets - levels) / (5 - levels)) / rates
+    reachable = (targets < 5) & (rates > 0)
+    months = np.where(reachable, months, np.inf)
+    return np.where(levels >= targets, 0.0, months)
+
+
+def milestone_frame(domains, thresholds, months):
+    """Long-format DataFrame of a (domains, thresholds) milestone array for a {name: level} dict"""
+    return pd.DataFrame({
+        'Domain': np.repeat(np.asarray(domains, dtype=object), len(thresholds)),
+        'Milestone': np.tile(np.asarray(list(thresholds.keys()), dtype=object), len(domains)),
+        'Level': np.tile(np.asarray(list(thresholds.values()), dtype=float), len(domains)),
+        'Month': np.asarray(months).ravel()
+    })
+
+
+def annotate_milestones(fig, milestones, horizon_months=GROWTH_MONTHS, names=("Advanced",)):
+    """Add milestone annotations from a milestone_frame to the growth projection chart"""
+    # Only milestones still ahead and inside the charted horizon are annotated
+    visible = milestones[
+        milestones['Milestone'].isin(names)
+        & (milestones['Month'] > 0)
+        & (milestones['Month'] <= horizon_months)
+    ]
+    for milestone, month, level in visible[['Milestone', 'Month', 'Level']].itertuples(index=False):
+        fig.add_annotation(
+            x=month,
+            y=level,
+            text=f"{milestone}<br>{month:.1f} months",
+            showarrow=True,
+            arrowhead=2,
+            arrowcolor="#2c3e50",
+            arrowsize=1,
+            arrowwidth=1,
+            font=dict(size=10)
+        )
+
+
+def add_milestone_annotations(fig, growth_data, experience=None):
+    """Add milestone annotations to the growth projection chart (original interface, from a projection frame)
+
+    Marks the first charted month each domain reaches Advanced, unless it already has;
+    experience is kept for compatibility and ignored, as it always was.
+    """
+    reached = growth_data[growth_data['Projected Level'] >= MILESTONE_LEVELS["Advanced"]]
+    first = reached.sort_values('Month', kind='stable').drop_duplicates('Domain')
+    first = first[first['Month'] > 0]
+    milestones = pd.DataFrame({
+        'Domain': first['Domain'].to_numpy(),
+        'Milestone': "Advanced",
+        'Level': first['Projected Level'].to_numpy(dtype=float),
+        'Month': first['Month'].to_numpy(dtype=float)
+    })
+    annotate_milestones(fig, milestones, horizon_months=growth_data['Month'].max())
+
+
+def generate_quadrant_analysis(skills_df, learning_goals, rng=None):
+    """Generate a quadrant analysis of skills based on impact and effort"""
+    # Create a copy of the relevant data
+    df = skills_df[['Skill', 'Rating', 'Domain']].copy()
+    df = df.rename(columns={'Rating': 'Current Level'})
+    
+    # Score all skills at once with the columnar engine
+    scores = score_skills(
+        df['Skill'].to_numpy(),
+        df['Current Level'].to_numpy(),
+        df['Domain'].to_numpy(),
+        learning_goals,
+        rng=rng
+    )
+    for column in ['Effort', 'Impact', 'Goal Alignment', 'Recommendation']:
+        df[column] = scores[column]
+    
+    return df
+
+
+def calculate_goal_alignment(skill, domain, learning_goals):
+    """Calculate how well a skill aligns with learning goals (per-row reference for goal_alignment_scores)"""
+    alignment_score = 5  # Base alignment
+    
+    # Check for direct keyword matches
+    for goal in learning_goals:
+        # Direct skill name alignment
+        if any(kw.lower() in skill.lower() for kw in goal.split()):
+            alignment_score += 5
+        
+        # Domain alignment
+        if (domain == "Programming" and any(kw in goal for kw in ["Development", "Stack", "Full", "Web"])) or \
+           (domain == "Data & Analytics" and any(kw in goal for kw in ["Data", "Analytics", "ML", "Science"])) or \
+           (domain == "Infrastructure" and any(kw in goal for kw in ["Cloud", "DevOps", "Security", "SRE"])) or \
+           (domain == "Soft Skills" and any(kw in goal for kw in ["Leadership", "Management"])):
+            alignment_score += 3
+    
+    return min(15, alignment_score)  # Cap at 15
+
+
+def get_quadrant_recommendation(effort, impact, current_level):
+    """Generate a recommendation based on quadrant position (per-row reference for recommendation_codes)"""
+    if impact > 5 and effort < 5:
+        return "High Priority - Quick Win"
+    elif impact > 5 and effort >= 5:
+        return "Strategic Investment - High Value"
+    elif impact <= 5 and effort < 5:
+        return "Easy Improvement - Lower Priority"
+    else:
+        return "Consider Later - Low Value/High Effort"
+
+
+def generate_skill_priorities(quadrant_data, top_k=None):
+    """Generate prioritized skill recommendations based on quadrant analysis (only the top_k when given)"""
+    # Create a copy of the relevant data
+    df = quadrant_data[['Skill', 'Current Level', 'Effort', 'Impact', 'Goal Alignment', 'Domain', 'Recommendation']].copy()
+    
+    # Calculate priority score and level for all skills at once
+    df['Priority Score'] = priority_scores(
+        df['Impact'].to_numpy(),
+        df['Effort'].to_numpy(),
+        df['Goal Alignment'].to_numpy(),
+        df['Current Level'].to_numpy()
+    )
+    df['Priority Level'] = priority_levels(df['Priority Score'].to_numpy())
+    
+    # Sort by priority score, selecting only the top_k rows when requested
+    if top_k is not None:
+        return df.iloc[top_k_indices(df['Priority Score'].to_numpy(), top_k)]
+    df = df.sort_values('Priority Score', ascending=False)
+    
+    return df
+
+
+def calculate_priority_score(impact, effort, goal_alignment, current_level):
+    """Calculate a priority score for skill development (per-row reference for priority_scores)"""
+    # Higher impact, lower effort, higher goal alignment, lower current level = higher priority
+    effort_factor = max(1, (10 - effort)) / 10  # Invert so lower effort = higher score
+    impact_factor = impact / 10
+    alignment_factor = goal_alignment / 15
+    level_factor = (5 - current_level) / 5  # Lower current level = higher priority
+    
+    # Weighted priority calculation
+    priority = (
+        (impact_factor * 40) +      # 40% weight to impact
+        (effort_factor * 25) +      # 25% weight to ease of acquisition
+        (alignment_factor * 20) +   # 20% weight to goal alignment
+        (level_factor * 15)         # 15% weight to current level (gap size)
+    ) * 100
+    
+    return min(99, round(priority))  # Cap at 99 and round
+
+
+# Minimum sustained throughput of compute_batch_report for the 24-skill catalog
+TARGET_PROFILES_PER_SECOND = 20000
+
+# Report sections in display order; each can be computed on its own
+REPORT_SECTIONS = ("overview", "domains", "distribution", "benchmarks", "focus", "insights")
+
+# Number of top priority skills kept in a report
+PRIORITY_TOP_K = 12
+
+# Wider heatmaps are binned into this many columns so large catalogs stay readable
+HEATMAP_MAX_COLUMNS = 48
+
+
+@dataclass
+class HeatmapMatrix:
+    """Heatmap values with axis labels and per-cell hover labels"""
+    values: np.ndarray       # (rows, columns)
+    row_labels: list
+    column_labels: list
+    cell_labels: np.ndarray  # (rows, columns)
+
+
+def rank_within_domains(ratings, domain_codes, n_domains):
+    """Write ratings sorted descending within each domain into a preallocated (..., K, M) array
+
+    Returns the 0-padded values and the matching skill index of every cell (-1 for padding).
+    Works for one profile (S,) or any stack of profiles (..., S) without per-domain loops.
+    """
+    ratings = np.asarray(ratings, dtype=float)
+    domain_codes = np.asarray(domain_codes, dtype=np.int64)
+    counts = np.bincount(domain_codes, minlength=n_domains)
+    max_skills = int(counts.max()) if len(counts) else 0
+    lead_shape = ratings.shape[:-1]
+
+    # Stable sort by (domain, -rating); every row shares the same domain layout afterwards
+    order = np.lexsort((-ratings, np.broadcast_to(domain_codes, ratings.shape)), axis=-1)
+    sorted_codes = np.sort(domain_codes, kind='stable')
+    ranks = np.arange(len(domain_codes)) - (np.cumsum(counts) - counts)[sorted_codes]
+
+    values = np.zeros(lead_shape + (n_domains, max_skills))
+    skill_index = np.full(lead_shape + (n_domains, max_skills), -1, dtype=np.int64)
+    values[..., sorted_codes, ranks] = np.take_along_axis(ratings, order, axis=-1)
+    skill_index[..., sorted_codes, ranks] = order
+    return values, skill_index
+
+
+def bin_columns(values, present, max_columns):
+    """Average groups of adjacent columns of (..., C) values into at most max_columns bins
+
+    present marks real cells; padding is excluded from the averages. Returns the binned values,
+    the number of real cells per bin and the [start, stop) column range of every bin.
+    """
+    n_columns = values.shape[-1]
+    edges = np.unique(np.linspace(0, n_columns, min(max_columns, n_columns) + 1).round().astype(np.int64))
+    starts = edges[:-1]
+    totals = np.add.reduceat(np.where(present, values, 0.0), starts, axis=-1)
+    counts = np.add.reduceat(present.astype(np.int64), starts, axis=-1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        binned = np.where(counts > 0, totals / counts, 0.0)
+    return binned, counts, np.stack([starts, edges[1:]], axis=1)
+
+
+def profile_heatmap(skills, domains, values, skill_index, max_columns=HEATMAP_MAX_COLUMNS):
+    """Domains x ranked skills HeatmapMatrix of one profile, binned when wider than max_columns"""
+    skills = np.asarray(skills, dtype=object)
+    n_columns = values.shape[-1]
+    if n_columns <= max_columns:
+        padding = np.array([f'No skill {j + 1}' for j in range(n_columns)], dtype=object)
+        return HeatmapMatrix(
+            values=values,
+            row_labels=list(domains),
+            column_labels=[f"#{j + 1}" for j in range(n_columns)],
+            cell_labels=np.where(skill_index >= 0, skills[np.maximum(skill_index, 0)], padding)
+        )
+
+    binned, counts, ranges = bin_columns(values, skill_index >= 0, max_columns)
+    column_labels = [f"#{start + 1}-{stop}" for start, stop in ranges]
+    cell_labels = np.array([
+        [f"Skills {label}: {count} rated" for label, count in zip(column_labels, row)]
+        for row in counts
+    ], dtype=object)
+    return HeatmapMatrix(binned, list(domains), column_labels, cell_labels)
+
+
+def team_heatmap(members, skills, ratings, max_columns=HEATMAP_MAX_COLUMNS):
+    """Members x skills HeatmapMatrix of a team, skills grouped by domain and binned when too wide"""
+    skills = np.asarray(skills, dtype=object)
+    ratings = np.asarray(ratings, dtype=float)
+    domain_codes = lookup_domain_codes(skills)
+
+    # Order columns by domain, then by the team's average rating
+    columns = np.lexsort((-ratings.mean(axis=0), domain_codes))
+    ratings = ratings[:, columns]
+    skills = skills[columns]
+    domains = np.array(DOMAIN_NAMES, dtype=object)[domain_codes[columns]]
+
+    if len(skills) <= max_columns:
+        return HeatmapMatrix(
+            values=ratings,
+            row_labels=list(members),
+            column_labels=list(skills),
+            cell_labels=np.broadcast_to(domains, ratings.shape)
+        )
+
+    binned, _, ranges = bin_columns(ratings, np.ones(ratings.shape, dtype=bool), max_columns)
+    column_labels = [
+        f"{domains[start]}: {skills[start]}" + (f" +{stop - start - 1}" if stop - start > 1 else "")
+        for start, stop in ranges
+    ]
+    return HeatmapMatrix(
+        values=binned,
+        row_labels=list(members),
+        column_labels=column_labels,
+        cell_labels=np.broadcast_to(np.array(column_labels, dtype=object), binned.shape)
+    )
+
+
+@dataclass
+class ReportInsights:
+    """Key findings shown in the report summary"""
+    top_strengths: pd.DataFrame
+    improvement_areas: pd.DataFrame
+    top_domain: str
+    weakest_domain: str
+    priority_skills: list
+
+
+@dataclass
+class AnalyticsReport:
+    """All tables behind the Comprehensive Report of a single profile
+
+    Tables of sections that were not requested are left as None.
+    """
+    role: str
+    experience: float
+    education: str
+    goals: list
+    average_rating: float
+    strengths_count: int
+    gaps_count: int
+    skills: pd.DataFrame = None           # One row per rated skill with its Level
+    heatmap: HeatmapMatrix = None
+    domain_avg: pd.DataFrame = None
+    domain_counts: pd.DataFrame = None
+    level_counts: pd.DataFrame = None
+    benchmark: pd.DataFrame = None
+    growth: pd.DataFrame = None
+    growth_horizon: float = None
+    milestones: pd.DataFrame = None
+    quadrant: pd.DataFrame = None
+    priorities: pd.DataFrame = None     # Top PRIORITY_TOP_K skills, highest priority first
+    insights: ReportInsights = None
+
+
+@dataclass
+class BatchReport:
+    """Report arrays for N profiles rated on the same S skills (K domains, T months)"""
+    skills: np.ndarray           # (S,)
+    skill_domains: np.ndarray    # (S,) domain of every skill
+    domains: list                # (K,) domains in order of first appearance
+    ratings: np.ndarray          # (N, S)
+    experience: np.ndarray       # (N,)
+    education: list              # (N,)
+    role: list                   # (N,)
+    goals: list                  # (N,) list of goal lists
+    stats: ProfileStats          # Per-profile aggregates the fields below are taken from
+    average_rating: np.ndarray   # (N,)
+    strengths_count: np.ndarray  # (N,)
+    gaps_count: np.ndarray       # (N,)
+    level_counts: np.ndarray     # (N, 5)
+    domain_avg: np.ndarray       # (N, K)
+    domain_counts: np.ndarray    # (K,)
+    heatmap_values: np.ndarray   # (N, K, M) ratings sorted within each domain, 0-padded
+    heatmap_order: np.ndarray    # (N, K, M) skill index per heatmap cell, -1 for padding
+    benchmark: np.ndarray        # (N, K)
+    learning_rates: np.ndarray   # (N, K)
+    growth_months: np.ndarray    # (T,)
+    growth: np.ndarray           # (N, K, T)
+    milestone_levels: dict       # (L,) milestone name -> level
+    milestones: np.ndarray       # (N, K, L) months to reach each milestone level
+    effort: np.ndarray           # (N, S)
+    impact: np.ndarray           # (N, S)
+    goal_alignment: np.ndarray   # (N, S)
+    recommendation: np.ndarray   # (N, S) index into RECOMMENDATIONS
+    priority_score: np.ndarray   # (N, S)
+    priority_level: np.ndarray   # (N, S) index into PRIORITY_LEVELS
+    priority_top: np.ndarray     # (N, PRIORITY_TOP_K) skill indices, highest priority first
+    sections: tuple = field(default=REPORT_SECTIONS)
+    elapsed: float = field(default=0.0)
+
+    def __len__(self):
+        return len(self.ratings)
+
+    def has(self, section):
+        return section in self.sections
+
+    @property
+    def profiles_per_second(self):
+        return len(self) / self.elapsed if self.elapsed else float('inf')
+
+    def report(self, i):
+        """Materialize the DataFrame tables of profile i"""
+        return _build_report(self, i)
+
+
+def _per_profile(value, n):
+    """Broadcast a scalar profile attribute to a list of n values"""
+    if isinstance(value, (list, tuple, np.ndarray, pd.Series)):
+        if len(value) != n:
+            raise ValueError(f"Expected {n} profile values, got {len(value)}")
+        return list(value)
+    return [value] * n
+
+
+def _per_profile_goals(goals, n):
+    """Normalize goals to one goal list per profile"""
+    if not goals:
+        return [[] for _ in range(n)]
+    if all(isinstance(goal, str) for goal in goals):
+        return [list(goals) for _ in range(n)]
+    return _per_profile([list(g or []) for g in goals], n)
+
+
+def _group_by_goals(goals):
+    """Map each distinct goal set to the profile rows that share it"""
+    groups = {}
+    for row, profile_goals in enumerate(goals):
+        groups.setdefault(tuple(profile_goals), []).append(row)
+    return groups
+
+
+@profiled()
+def compute_batch_report(skills, ratings, experience, education, role, goals, rng=None,
+                         growth_horizon=GROWTH_MONTHS, growth_step=1, growth_unit="month", sections=None,
+                         precomputed=None):
+    """Compute the report arrays of N profiles in one vectorized pass
+
+    ratings is an N x skills array; experience, education and role can be scalars or
+    per-profile sequences, goals a single goal list or one goal list per profile.
+    The growth projection spans growth_horizon at growth_step, both in growth_unit.
+    sections limits the work to a subset of REPORT_SECTIONS; arrays of skipped sections are None.
+    precomputed holds the ProfileStats ('stats') and score arrays kept up to date elsewhere
+    (see ProfileModel.report_arrays), keyed by BatchReport field; they are used as they are.
+    """
+    started = time.perf_counter()
+    sections = REPORT_SECTIONS if sections is None else tuple(sections)
+    unknown = set(sections) - set(REPORT_SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown report sections: {sorted(unknown)}")
+    rng = rng if rng is not None else np.random.default_rng()
+    skills = np.asarray(skills, dtype=object)
+    ratings = np.atleast_2d(np.asarray(ratings, dtype=float))
+    n, s = ratings.shape
+    if s != len(skills):
+        raise ValueError(f"ratings has {s} columns but {len(skills)} skills were given")
+
+    experience = np.asarray(_per_profile(experience, n), dtype=float)
+    education = _per_profile(education, n)
+    role = _per_profile(role, n)
+    goals = _per_profile_goals(goals, n)
+    goal_groups = _group_by_goals(goals)
+
+    # Skill domains depend only on the catalog, so they are shared by all profiles
+    skill_domains = lookup_domains(skills)
+    domains = list(dict.fromkeys(skill_domains))
+    domain_codes = np.array([domains.index(d) for d in skill_domains], dtype=np.int64)
+    k = len(domains)
+
+    # Summary statistics and domain averages from the shared statistics kernel
+    stats = precomputed['stats'] if precomputed is not None else compute_profile_stats(ratings, domain_codes, k)
+    domain_avg = stats.domain_avg
+
+    heatmap_values = heatmap_order = None
+    benchmark = learning_rates = growth_months = growth = milestones = None
+    effort = impact = goal_alignment = recommendation = None
+    priority_score = priority_level = priority_top = None
+
+    if "overview" in sections:
+        with stage("heatmap"):
+            # Heatmap: ratings sorted descending inside each domain, padded to the largest domain
+            heatmap_values, heatmap_order = rank_within_domains(ratings, domain_codes, k)
+
+    if "benchmarks" in sections:
+        with stage("benchmarks"):
+            # Benchmarks by role, experience and domain
+            benchmark = lookup_benchmarks(role, experience, domains)
+
+        with stage("growth"):
+            # Growth projection on a domains x months grid
+            aligned = np.zeros((n, k), dtype=bool)
+            for profile_goals, rows in goal_groups.items():
+                aligned[rows] = goal_aligned_domains(domains, profile_goals)
+            learning_rates = growth_learning_rates(domain_avg, experience, aligned)
+            growth_months = growth_time_grid(growth_horizon, growth_step, growth_unit)
+            growth = project_growth(domain_avg, learning_rates, growth_months)
+            milestones = solve_milestones(domain_avg, learning_rates, MILESTONE_LEVELS)
+
+    if "focus" in sections or "insights" in sections:
+        with stage("quadrant"):
+            if precomputed is not None:
+                effort = precomputed['effort']
+                impact = precomputed['impact']
+                goal_alignment = precomputed['goal_alignment']
+                recommendation = precomputed['recommendation']
+            else:
+                # Quadrant scores and priorities for every skill of every profile
+                effort = effort_scores(ratings, rng)
+                impact = impact_scores(ratings, rng)
+                goal_alignment = np.empty((n, s), dtype=np.int64)
+                for profile_goals, rows in goal_groups.items():
+                    goal_alignment[rows] = goal_alignment_scores(skills, skill_domains, profile_goals)
+                recommendation = recommendation_codes(effort, impact)
+
+        with stage("priorities"):
+            if precomputed is not None:
+                priority_score = precomputed['priority_score']
+                priority_level = precomputed['priority_level']
+            else:
+                priority_score = priority_scores(impact, effort, goal_alignment, ratings)
+                priority_level = priority_level_codes(priority_score)
+            priority_top = top_k_indices(priority_score, PRIORITY_TOP_K)
+
+    return BatchReport(
+        skills=skills,
+        skill_domains=skill_domains,
+        domains=domains,
+        ratings=ratings,
+        experience=experience,
+        education=education,
+        role=role,
+        goals=goals,
+        stats=stats,
+        average_rating=stats.average_rating,
+        strengths_count=stats.strengths_count,
+        gaps_count=stats.gaps_count,
+        level_counts=stats.level_counts,
+        domain_avg=domain_avg,
+        domain_counts=stats.domain_counts,
+        heatmap_values=heatmap_values,
+        heatmap_order=heatmap_order,
+        benchmark=benchmark,
+        learning_rates=learning_rates,
+        growth_months=growth_months,
+        growth=growth,
+        milestone_levels=dict(MILESTONE_LEVELS),
+        milestones=milestones,
+        effort=effort,
+        impact=impact,
+        goal_alignment=goal_alignment,
+        recommendation=recommendation,
+        priority_score=priority_score,
+        priority_level=priority_level,
+        priority_top=priority_top,
+        sections=sections,
+        elapsed=time.perf_counter() - started
+    )
+
+
+@profiled("tables")
+def _build_report(batch, i):
+    """Turn row i of a BatchReport into the DataFrames used by the renderer"""
+    ratings = batch.ratings[i]
+    tables = {}
+
+    if batch.has("distribution") or batch.has("insights"):
+        df = pd.DataFrame({
+            'Skill': batch.skills,
+            'Rating': ratings,
+            'Domain': batch.skill_domains
+        })
+        df['Level'] = pd.Categorical.from_codes(
+            np.digitize(ratings, LEVEL_EDGES), categories=LEVEL_LABELS, ordered=True
+        )
+        tables['skills'] = df
+
+    if batch.has("distribution"):
+        tables['level_counts'] = pd.DataFrame({'Level': LEVEL_LABELS, 'Count': batch.level_counts[i]})
+
+    domain_order = np.argsort(-batch.domain_avg[i], kind='stable')
+    domains = np.array(batch.domains, dtype=object)[domain_order]
+    domain_avg = pd.DataFrame({'Domain': domains, 'Rating': batch.domain_avg[i][domain_order]})
+
+    if batch.has("overview"):
+        tables['heatmap'] = profile_heatmap(
+            batch.skills, batch.domains, batch.heatmap_values[i], batch.heatmap_order[i]
+        )
+
+    if batch.has("domains"):
+        domain_counts = pd.DataFrame({'Domain': batch.domains, 'Count': batch.domain_counts.astype(int)})
+        tables['domain_avg'] = domain_avg
+        tables['domain_counts'] = domain_counts.sort_values('Count', ascending=False, kind='stable').reset_index(drop=True)
+
+    if batch.has("benchmarks"):
+        tables['benchmark'] = pd.DataFrame({
+            'Domain': domains,
+            'Your Rating': batch.domain_avg[i][domain_order],
+            'Benchmark': batch.benchmark[i][domain_order]
+        })
+        tables['growth'] = growth_long_format(domains, batch.growth_months, batch.growth[i][domain_order])
+        tables['growth_horizon'] = float(batch.growth_months[-1])
+        tables['milestones'] = milestone_frame(domains, batch.milestone_levels, batch.milestones[i][domain_order])
+
+    if batch.has("focus") or batch.has("insights"):
+        top = batch.priority_top[i]
+        priorities = pd.DataFrame({
+            'Skill': batch.skills[top],
+            'Current Level': ratings[top],
+            'Effort': batch.effort[i][top],
+            'Impact': batch.impact[i][top],
+            'Goal Alignment': batch.goal_alignment[i][top],
+            'Domain': batch.skill_domains[top],
+            'Recommendation': RECOMMENDATIONS[batch.recommendation[i][top]],
+            'Priority Score': batch.priority_score[i][top],
+            'Priority Level': pd.Categorical.from_codes(
+                batch.priority_level[i][top], categories=PRIORITY_LEVELS, ordered=True
+            )
+        }, index=top)
+        tables['priorities'] = priorities
+
+    if batch.has("focus"):
+        tables['quadrant'] = pd.DataFrame({
+            'Skill': batch.skills,
+            'Current Level': ratings,
+            'Domain': batch.skill_domains,
+            'Effort': batch.effort[i],
+            'Impact': batch.impact[i],
+            'Goal Alignment': batch.goal_alignment[i],
+            'Recommendation': RECOMMENDATIONS[batch.recommendation[i]]
+        })
+
+    if batch.has("insights"):
+        df = tables['skills']
+        priorities = tables['priorities']
+        tables['insights'] = ReportInsights(
+            top_strengths=df.iloc[batch.stats.top[i][:3]][['Skill', 'Rating']],
+            improvement_areas=df.iloc[batch.stats.bottom[i][:3]][['Skill', 'Rating']],
+            top_domain=domain_avg.iloc[0]['Domain'],
+            weakest_domain=domain_avg.iloc[-1]['Domain'],
+            priority_skills=priorities[priorities['Priority Level'] == 'High Priority']['Skill'].tolist()[:3]
+        )
+
+    return AnalyticsReport(
+        role=batch.role[i],
+        experience=batch.experience[i],
+        education=batch.education[i],
+        goals=batch.goals[i],
+        average_rating=float(batch.average_rating[i]),
+        strengths_count=int(batch.strengths_count[i]),
+        gaps_count=int(batch.gaps_count[i]),
+        **tables
+    )
+
+
+def compute_report(ratings, experience, education, role, goals, rng=None, sections=None, model=None):
+    """Compute the report of one profile given as a {skill: rating} dict (optionally only some sections)
+
+    With a ProfileModel in sync with ratings, its running aggregates and scores are
+    used instead of recomputing them (rng is then not used).
+    """
+    if model is not None:
+        return compute_batch_report(
+            model.skills, [model.ratings], experience, education, role, [model.goals],
+            sections=sections, precomputed=model.report_arrays()
+        ).report(0)
+    batch = compute_batch_report(
+        list(ratings.keys()), [list(ratings.values())], experience, education, role, [list(goals or [])],
+        rng=rng, sections=sections
+    )
+    return batch.report(0)
+
+
+if __name__ == "__main__":
+    # Quick throughput check against TARGET_PROFILES_PER_SECOND
+    sample_skills = [f"Skill {i}" for i in range(24)]
+    sample_ratings = np.random.default_rng(0).integers(1, 6, size=(100000, 24))
+    result = compute_batch_report(
+        sample_skills, sample_ratings, 3, "Bachelor's Degree", "Mid-level Developer", ["Cloud Architecture"]
+    )
+    print(f"{len(result)} profiles in {result.elapsed:.2f}s: "
+          f"{result.profiles_per_second:,.0f} profiles/s (target {TARGET_PROFILES_PER_SECOND:,})")
@@ -0,0 +1,212 @@
+import argparse
+import hashlib
+import html
+import json
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import fields, is_dataclass
+import numpy as np
+import pandas as pd
+from plotly.offline import get_plotlyjs
+from report_engine import compute_report
+from report_figures import REPORT_FIGURES
+from profile_model import ProfileModel
+
+# Offline bulk export of Comprehensive Reports. Reads a JSONL file of profiles,
+# computes each report in a process pool and writes one HTML page and one compact
+# JSON data file per profile. All pages load a single shared plotly.min.js.
+#
+#   python report_export.py profiles.jsonl exports/ --workers 8
+#
+# Each input line is {"id": ..., "ratings": {skill: rating}, "experience": ...,
+# "education": ..., "role": ..., "goals": [...]}; a missing id falls back to the
+# line number. Files are named after the id plus a short hash of it, so ids that
+# only differ in characters a filename cannot hold still get their own files.
+# Finished ids are appended to a checkpoint file, so an interrupted
+# run picks up where it stopped when started again with the same output directory.
+
+PLOTLYJS_FILENAME = "plotly.min.js"
+CHECKPOINT_FILENAME = "checkpoint.jsonl"
+DEFAULT_CHUNK_SIZE = 32
+FLOAT_DIGITS = 4  # Decimals kept in the JSON data files
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Skills Analysis Report - {title}</title>
+<script src="{plotlyjs}"></script>
+<style>body {{ font-family: sans-serif; margin: 2em; }} .figure {{ margin-bottom: 2em; }}</style>
+</head>
+<body>
+<h1>Skills Analysis Report</h1>
+<p><strong>Current Role:</strong> {role}<br>
+<strong>Years of Experience:</strong> {experience}<br>
+<strong>Education Level:</strong> {education}<br>
+<strong>Average Skill Level:</strong> {average:.1f}/5.0</p>
+{figures}
+</body>
+</html>
+"""
+
+
+def load_profiles(path):
+    """(profile id, profile dict) for every non-empty line of a JSONL file"""
+    with open(path) as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if line:
+                profile = json.loads(line)
+                yield str(profile.get("id", line_number)), profile
+
+
+def safe_filename(profile_id):
+    """Filesystem-safe name for a profile id, unique per id ('a/b' and 'a_b' differ)"""
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", profile_id).strip("._")[:80] or "profile"
+    digest = hashlib.sha256(profile_id.encode("utf-8")).hexdigest()[:10]
+    return f"{slug}-{digest}"
+
+
+def to_jsonable(value):
+    """Report tables as plain JSON values; NaN and inf become null"""
+    if isinstance(value, pd.DataFrame):
+        return {column: to_jsonable(value[column].tolist()) for column in value.columns}
+    if is_dataclass(value):
+        return {f.name: to_jsonable(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, np.ndarray):
+        return to_jsonable(value.tolist())
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float):
+        return round(value, FLOAT_DIGITS) if math.isfinite(value) else None
+    return value
+
+
+def _write_atomic(path, text):
+    """Write through a temporary file so an interrupted run never leaves half a file"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def export_profile(profile_id, profile, out_dir):
+    """Compute one report and write its HTML page and JSON data file"""
+    ratings = profile["ratings"]
+    experience = profile.get("experience", 0)
+    education = profile.get("education", "")
+    role = profile.get("role", "Other")
+    goals = profile.get("goals", [])
+
+    # Scores come from a ProfileModel like in the interactive report, so exports match what the app shows
+    report = compute_report(ratings, experience, education, role, goals,
+                            model=ProfileModel(list(ratings), goals, ratings))
+
+    figures = "\n".join(
+        f'<div class="figure">{build(report).to_html(full_html=False, include_plotlyjs=False)}</div>'
+        for build in REPORT_FIGURES.values()
+    )
+    name = safe_filename(profile_id)
+    _write_atomic(os.path.join(out_dir, f"{name}.html"), HTML_TEMPLATE.format(
+        title=html.escape(profile_id), plotlyjs=PLOTLYJS_FILENAME, role=html.escape(str(role)),
+        experience=html.escape(str(experience)), education=html.escape(str(education)), average=report.average_rating, figures=figures
+    ))
+    data = to_jsonable(report)
+    data["id"] = profile_id
+    _write_atomic(os.path.join(out_dir, f"{name}.json"), json.dumps(data, separators=(",", ":")))
+    return profile_id
+
+
+def export_chunk(chunk, out_dir):
+    """Worker entry point: export a list of (profile id, profile) pairs"""
+    done, failed = [], []
+    for profile_id, profile in chunk:
+        try:
+            done.append(export_profile(profile_id, profile, out_dir))
+        except Exception as e:
+            failed.append((profile_id, f"{type(e).__name__}: {e}"))
+    return done, failed
+
+
+def read_checkpoint(out_dir):
+    """Ids already exported by an earlier run"""
+    path = os.path.join(out_dir, CHECKPOINT_FILENAME)
+    if not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        return {json.loads(line)["id"] for line in f if line.strip()}
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def export_reports(input_path, out_dir, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, log=print):
+    """Export every profile of input_path not yet in the checkpoint; returns run statistics"""
+    os.makedirs(out_dir, exist_ok=True)
+    plotlyjs_path = os.path.join(out_dir, PLOTLYJS_FILENAME)
+    if not os.path.exists(plotlyjs_path):
+        _write_atomic(plotlyjs_path, get_plotlyjs())
+
+    finished = read_checkpoint(out_dir)
+    pending = [(pid, profile) for pid, profile in load_profiles(input_path) if pid not in finished]
+    log(f"{len(finished)} profiles already exported, {len(pending)} to go")
+
+    started = time.perf_counter()
+    exported, errors = 0, []
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        with open(os.path.join(out_dir, CHECKPOINT_FILENAME), "a") as checkpoint:
+            futures = [pool.submit(export_chunk, chunk, out_dir) for chunk in _chunks(pending, chunk_size)]
+            for future in as_completed(futures):
+                done, failed = future.result()
+                # Only the parent writes the checkpoint, one line per finished profile
+                checkpoint.writelines(json.dumps({"id": pid}) + "\n" for pid in done)
+                checkpoint.flush()
+                os.fsync(checkpoint.fileno())
+                exported += len(done)
+                errors.extend(failed)
+                elapsed = time.perf_counter() - started
+                log(f"{exported}/{len(pending)} exported ({exported / elapsed:,.1f} profiles/s)")
+    finally:
+        # On Ctrl+C drop the queued chunks; the checkpoint already covers everything finished
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    elapsed = time.perf_counter() - started
+    for pid, message in errors:
+        log(f"failed {pid}: {message}")
+    return {
+        "exported": exported,
+        "skipped": len(finished),
+        "failed": len(errors),
+        "seconds": elapsed,
+        "profiles_per_second": exported / elapsed if elapsed else 0.0
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export Comprehensive Reports for a JSONL file of profiles")
+    parser.add_argument("input", help="JSONL file with one profile per line")
+    parser.add_argument("out_dir", help="Directory for the HTML pages, JSON files and checkpoint")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Profiles per worker task")
+    args = parser.parse_args(argv)
+
+    stats = export_reports(args.input, args.out_dir, args.workers, args.chunk_size)
+    print(f"Exported {stats['exported']} profiles in {stats['seconds']:.1f}s "
+          f"({stats['profiles_per_second']:,.1f} profiles/s), "
+          f"{stats['skipped']} skipped from checkpoint, {stats['failed']} failed")
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
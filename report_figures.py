@@ -0,0 +1,322 @@
+import plotly.graph_objects as go
+import plotly.express as px
+from report_engine import annotate_milestones
+
+# Figure builders for the Comprehensive Report. Each takes an AnalyticsReport and
+# returns a Plotly figure, without touching Streamlit.
+
+
+def build_heatmap_matrix_figure(matrix, height=400):
+    """Plotly heatmap of a HeatmapMatrix, with cell labels shown on hover"""
+    fig = px.imshow(
+        matrix.values,
+        x=matrix.column_labels,
+        y=matrix.row_labels,
+        color_continuous_scale='viridis',
+        labels=dict(color="Rating"),
+        height=height,
+        aspect="auto"
+    )
+    fig.update_traces(
+        customdata=matrix.cell_labels,
+        hovertemplate="%{y}<br>%{customdata}: %{z:.1f}<extra></extra>"
+    )
+    fig.update_layout(
+        xaxis={'side': 'top'},
+        coloraxis_colorbar=dict(
+            title="Rating",
+            tickvals=[1, 2, 3, 4, 5],
+            ticktext=["1", "2", "3", "4", "5"],
+        )
+    )
+    return fig
+
+
+def build_heatmap_figure(report):
+    """Skill proficiency heatmap of domains x ranked skills"""
+    return build_heatmap_matrix_figure(report.heatmap)
+
+
+def build_domain_bar_figure(report):
+    """Average proficiency per domain with the overall average line"""
+    domain_avg = report.domain_avg
+    avg_rating = report.average_rating
+    # Create a visually enhanced bar chart
+    fig = px.bar(
+        domain_avg, 
+        x='Domain', 
+        y='Rating',
+        color='Rating',
+        color_continuous_scale=px.colors.sequential.Viridis,
+        labels={'Rating': 'Average Proficiency (1-5)'},
+        height=400,
+        text=domain_avg['Rating'].round(1)
+    )
+    fig.update_layout(
+        xaxis_title="Technical Domain",
+        yaxis_title="Average Proficiency Level",
+        yaxis=dict(range=[0, 5.5]),
+        coloraxis_showscale=False
+    )
+    # Add a horizontal line for the overall average
+    fig.add_hline(y=avg_rating, line_dash="dash", line_color="#e74c3c")
+    fig.add_annotation(
+        x=0,
+        y=avg_rating + 0.2,
+        text=f"Overall Avg: {avg_rating:.1f}",
+        showarrow=False,
+        font=dict(size=10, color="#e74c3c")
+    )
+    return fig
+
+
+def build_domain_pie_figure(report):
+    """Share of evaluated skills per domain"""
+    domain_counts = report.domain_counts
+    # Create an enhanced pie chart
+    fig = px.pie(
+        domain_counts, 
+        values='Count', 
+        names='Domain',
+        hole=0.4,
+        color_discrete_sequence=px.colors.qualitative.Bold
+    )
+    fig.update_traces(
+        textposition='inside', 
+        textinfo='percent+label',
+        hoverinfo='label+percent+value',
+        marker=dict(line=dict(color='#FFF', width=2))
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+def build_rating_histogram_figure(report):
+    """Frequency distribution of all skill ratings"""
+    df = report.skills
+    # Create a histogram with enhanced styling
+    fig = px.histogram(
+        df, 
+        x='Rating',
+        nbins=5,
+        range_x=[0.5, 5.5],
+        color_discrete_sequence=['#4a69bd'],
+        labels={'Rating': 'Skill Level (1-5)'},
+        height=400
+    )
+    fig.update_layout(
+        bargap=0.1,
+        xaxis=dict(
+            tickvals=[1, 2, 3, 4, 5],
+            ticktext=['Beginner (1)', 'Basic (2)', 'Intermediate (3)', 'Advanced (4)', 'Expert (5)']
+        ),
+        yaxis_title="Number of Skills",
+        xaxis_title="Proficiency Level"
+    )
+    return fig
+
+
+def build_level_donut_figure(report):
+    """Skills per proficiency level with the total in the center"""
+    df = report.skills
+    level_counts = report.level_counts
+    # Create a visually enhanced donut chart
+    colors = {
+        'Beginner (1)': '#e74c3c',
+        'Basic (2)': '#f39c12',
+        'Intermediate (3)': '#3498db',
+        'Advanced (4)': '#2ecc71',
+        'Expert (5)': '#9b59b6'
+    }
+    
+    fig = px.pie(
+        level_counts, 
+        values='Count', 
+        names='Level',
+        color='Level',
+        color_discrete_map=colors,
+        hole=0.6,
+        height=400
+    )
+    fig.update_traces(
+        textposition='inside', 
+        textinfo='percent+label',
+        hoverinfo='label+percent+value'
+    )
+    # Add a total count in the center
+    fig.update_layout(
+        annotations=[dict(
+            text=f"{len(df)} Skills<br>Evaluated",
+            x=0.5, y=0.5,
+            font_size=15,
+            showarrow=False
+        )]
+    )
+    return fig
+
+
+def build_benchmark_radar_figure(report):
+    """Domain proficiency against industry benchmarks"""
+    benchmark_data = report.benchmark
+    # Create radar chart for benchmark comparison
+    fig = go.Figure()
+    
+    # First, plot the benchmark trace
+    fig.add_trace(go.Scatterpolar(
+        r=benchmark_data['Benchmark'].tolist() + [benchmark_data['Benchmark'].iloc[0]],
+        theta=benchmark_data['Domain'].tolist() + [benchmark_data['Domain'].iloc[0]],
+        fill=None,
+        line=dict(color='rgba(150, 150, 150, 0.8)', width=2, dash='dash'),
+        name='Industry Benchmark'
+    ))
+    
+    # Then, plot the user's skills on top
+    fig.add_trace(go.Scatterpolar(
+        r=benchmark_data['Your Rating'].tolist() + [benchmark_data['Your Rating'].iloc[0]],
+        theta=benchmark_data['Domain'].tolist() + [benchmark_data['Domain'].iloc[0]],
+        fill='toself',
+        line=dict(color='#4a69bd', width=3),
+        fillcolor='rgba(74, 105, 189, 0.3)',
+        name='Your Skills'
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 5],
+                tickvals=[1, 2, 3, 4, 5],
+            ),
+            angularaxis=dict(
+                direction="clockwise"
+            )
+        ),
+        showlegend=True,
+        legend=dict(x=0.85, y=0.15, font=dict(size=12)),
+        height=500
+    )
+    return fig
+
+
+def build_growth_lines_figure(report):
+    """Projected growth per domain with milestone annotations"""
+    growth_data = report.growth
+    # Create line chart for growth projection
+    fig = px.line(
+        growth_data, 
+        x='Month', 
+        y='Projected Level',
+        color='Domain',
+        line_shape='spline',
+        markers=True,
+        color_discrete_sequence=px.colors.qualitative.Bold,
+        height=450
+    )
+    
+    # Add a horizontal line at level 5 (maximum)
+    fig.add_hline(y=5, line_dash="dash", line_color="gray")
+    
+    # Add annotations for key milestones
+    annotate_milestones(fig, report.milestones, report.growth_horizon)
+    
+    fig.update_layout(
+        xaxis_title="Months from Now",
+        yaxis_title="Projected Skill Level",
+        yaxis=dict(range=[0, 5.5]),
+        legend_title="Domain",
+        hovermode="x unified"
+    )
+    return fig
+
+
+def build_quadrant_scatter_figure(report):
+    """Impact-effort quadrant of all skills"""
+    quadrant_data = report.quadrant
+    # Create the quadrant chart
+    fig = px.scatter(
+        quadrant_data,
+        x='Effort',
+        y='Impact',
+        color='Domain',
+        size='Goal Alignment',
+        hover_name='Skill',
+        hover_data={
+            'Current Level': True,
+            'Effort': False,
+            'Impact': False,
+            'Domain': True,
+            'Goal Alignment': False,
+            'Recommendation': True
+        },
+        color_discrete_sequence=px.colors.qualitative.Bold,
+        size_max=25,
+        opacity=0.8,
+        height=600
+    )
+    
+    # Add quadrant lines
+    fig.add_vline(x=5, line_dash="dash", line_color="gray", opacity=0.5)
+    fig.add_hline(y=5, line_dash="dash", line_color="gray", opacity=0.5)
+    
+    # Add quadrant labels
+    fig.add_annotation(x=2.5, y=7.5, text="Quick Wins", showarrow=False, font=dict(size=14))
+    fig.add_annotation(x=7.5, y=7.5, text="Major Projects", showarrow=False, font=dict(size=14))
+    fig.add_annotation(x=2.5, y=2.5, text="Fill-in Tasks", showarrow=False, font=dict(size=14))
+    fig.add_annotation(x=7.5, y=2.5, text="Thankless Tasks", showarrow=False, font=dict(size=14))
+    
+    fig.update_layout(
+        xaxis=dict(
+            title="Effort to Improve (Lower is Easier)",
+            range=[0, 10]
+        ),
+        yaxis=dict(
+            title="Potential Impact (Higher is Better)",
+            range=[0, 10]
+        ),
+        legend_title="Domain"
+    )
+    return fig
+
+
+def build_priority_bars_figure(report):
+    """Top 12 development priorities"""
+    priority_data = report.priorities
+    # Create bar chart for priority recommendations
+    fig = px.bar(
+        priority_data.head(12),  # Top 12 priority skills
+        x='Priority Score',
+        y='Skill',
+        color='Priority Level',
+        color_discrete_map={
+            'High Priority': '#e74c3c',
+            'Medium Priority': '#f39c12',
+            'Consider Later': '#3498db'
+        },
+        orientation='h',
+        height=500,
+        text='Current Level'
+    )
+    
+    fig.update_layout(
+        yaxis=dict(autorange="reversed"),
+        xaxis_title="Development Priority Score",
+        yaxis_title="Skill",
+        legend_title="Priority Level"
+    )
+    
+    fig.update_traces(texttemplate='Level: %{text}', textposition='inside')
+    return fig
+
+
+# Builders in the order the charts appear in the report
+REPORT_FIGURES = {
+    "heatmap": build_heatmap_figure,
+    "domain_bar": build_domain_bar_figure,
+    "domain_pie": build_domain_pie_figure,
+    "rating_histogram": build_rating_histogram_figure,
+    "level_donut": build_level_donut_figure,
+    "benchmark_radar": build_benchmark_radar_figure,
+    "growth_lines": build_growth_lines_figure,
+    "quadrant_scatter": build_quadrant_scatter_figure,
+    "priority_bars": build_priority_bars_figure
+}
@@ -0,0 +1,171 @@
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import logging
+import logging.handlers
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+# Opt-in stage profiler for the analytics report. Off unless REPORT_PROFILE is set:
+#
+#   REPORT_PROFILE=1         time every stage
+#   REPORT_PROFILE=cprofile  also capture a cProfile summary per stage
+#
+# Each profiled run (one report render, one lazy section, ...) is appended as a JSON
+# line to a rotating log and kept in memory for the in-app debug panel. When the
+# profiler is off, stage() hands back one shared no-op context manager and
+# profiled() returns the function unchanged, so instrumented code pays nothing.
+
+PROFILE_MODE = os.environ.get("REPORT_PROFILE", "").strip().lower()
+ENABLED = PROFILE_MODE not in ("", "0", "false", "off")
+CPROFILE = PROFILE_MODE == "cprofile"
+
+LOG_PATH = os.environ.get("REPORT_PROFILE_LOG", os.path.join("logs", "report_profile.jsonl"))
+LOG_MAX_BYTES = int(float(os.environ.get("REPORT_PROFILE_LOG_MB", 5)) * 1024 * 1024)
+LOG_BACKUPS = int(os.environ.get("REPORT_PROFILE_LOG_BACKUPS", 3))
+PSTATS_LINES = 15  # Functions kept per stage in cProfile summaries
+
+# Most recent runs, newest last, for the debug panel
+RECENT_RUNS = deque(maxlen=int(os.environ.get("REPORT_PROFILE_RECENT_RUNS", 50)))
+
+_NULL_STAGE = contextlib.nullcontext()
+_local = threading.local()
+_logger = None
+_logger_lock = threading.Lock()
+
+
+def _get_logger():
+    """JSONL logger writing to LOG_PATH, created on the first profiled run"""
+    global _logger
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                directory = os.path.dirname(LOG_PATH)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    LOG_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8"
+                )
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                logger = logging.getLogger("report_profiler")
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+                logger.addHandler(handler)
+                _logger = logger
+    return _logger
+
+
+def _pstats_summary(profiler):
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.strip_dirs().sort_stats("cumulative").print_stats(PSTATS_LINES)
+    return stream.getvalue()
+
+
+class _Stage:
+    """One timed stage; nested stages get slash-separated paths"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        stack = _local.stack
+        path = f"{stack[-1].record['stage']}/{self.name}" if stack else self.name
+        # Records are appended on entry so a run lists parents before their children
+        self.record = {"stage": path, "ms": None, "depth": len(stack)}
+        _local.records.append(self.record)
+        self.profiler = None
+        if CPROFILE:
+            # Pause the parent's profiler so every summary only covers its own stage
+            if stack and stack[-1].profiler is not None:
+                stack[-1].profiler.disable()
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        stack.append(self)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.record["ms"] = round((time.perf_counter() - self.started) * 1000, 3)
+        stack = _local.stack
+        stack.pop()
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.record["pstats"] = _pstats_summary(self.profiler)
+            if stack and stack[-1].profiler is not None:
+                stack[-1].profiler.enable()
+        if exc_type is not None:
+            self.record["error"] = exc_type.__name__
+        return False
+
+
+def _active():
+    return ENABLED and getattr(_local, "records", None) is not None
+
+
+def stage(name):
+    """Time a named stage of the current profiled run (no-op when profiling is off)"""
+    if not ENABLED or getattr(_local, "records", None) is None:
+        return _NULL_STAGE
+    return _Stage(name)
+
+
+def profiled(name=None):
+    """Decorator running a function as a stage; returns it untouched when profiling is off"""
+    def decorate(func):
+        if not ENABLED:
+            return func
+        stage_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(stage_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextlib.contextmanager
+def profile_run(name, **context):
+    """Collect the stages of one run and log them when it finishes
+
+    Also usable as a decorator. Runs do not nest: inside an active run this
+    behaves like stage(name).
+    """
+    if not ENABLED:
+        yield None
+        return
+    if _active():
+        with _Stage(name):
+            yield None
+        return
+
+    _local.records = []
+    _local.stack = []
+    started_at = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+    started = time.perf_counter()
+    try:
+        with _Stage(name):
+            yield _local.records
+    finally:
+        run = {
+            "run": name,
+            "started": started_at,
+            "total_ms": round((time.perf_counter() - started) * 1000, 3),
+            "thread": threading.current_thread().name,
+            **context,
+            "stages": _local.records
+        }
+        _local.records = None
+        _local.stack = None
+        RECENT_RUNS.append(run)
+        try:
+            _get_logger().info(json.dumps(run, separators=(",", ":"), default=str))
+        except OSError:
+            pass  # Profiling must never break the report
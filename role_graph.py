@@ -0,0 +1,436 @@
+import heapq
+import json
+import os
+import threading
+from dataclasses import dataclass
+import numpy as np
+from skill_catalog import CATALOG, lookup_domain_codes
+
+# Career role graph behind the Career Roadmap. Roles are nodes with a career level;
+# transitions are weighted edges carrying the typical years they take and the skill
+# thresholds they require (keyed by catalog domain, compared with the domain
+# average, or by skill name).
+#
+# The graph lives in data/role_graph.json (or ROLE_GRAPH_PATH) and is loaded once
+# per process. Shortest paths over all transitions come from an all-pairs table
+# (distances plus the first transition of every shortest path), computed once per
+# graph; lookups then only walk the path. Transitions the user's ratings don't
+# allow are masked out per query instead of getting a table of their own: masked
+# lookups run a single-source Dijkstra, or A* with the table's distances as the
+# heuristic (the masked graph is a subgraph, so they never overestimate). The
+# k-best alternatives use Yen's algorithm with the same A* spur searches, so they
+# stay cheap on graphs with thousands of roles.
+#
+#   python role_graph.py --roles 3000   # time the table and lookups on a synthetic graph
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+GRAPH_PATH = os.environ.get("ROLE_GRAPH_PATH", os.path.join(DATA_DIR, "role_graph.json"))
+GRAPH_VERSION = 1
+
+# Rating points a requirement may still be short by: skills keep growing along the way
+GROWTH_SLACK = float(os.environ.get("ROLE_GRAPH_GROWTH_SLACK", 1.0))
+
+DEFAULT_PATH_COUNT = 3      # Alternatives shown on the roadmap
+
+
+@dataclass
+class RolePath:
+    """A route through the role graph"""
+    roles: list          # Role names, current role first
+    years: list          # Typical years of each transition
+    edges: list          # Transition indices
+
+    @property
+    def total_years(self):
+        return float(sum(self.years))
+
+    @property
+    def cumulative_years(self):
+        return np.concatenate([[0.0], np.cumsum(self.years)]).tolist()
+
+
+class RoleGraph:
+    """Roles and weighted transitions, with a precomputed all-pairs shortest path table"""
+
+    def __init__(self, roles, levels, sources, targets, years, requirements):
+        self.roles = list(roles)
+        self.role_index = {role: i for i, role in enumerate(self.roles)}
+        self.levels = np.asarray(levels, dtype=np.int64)
+        self.sources = np.asarray(sources, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        self.years = np.asarray(years, dtype=float)
+        self.requirements = [dict(r) for r in requirements]
+
+        # Requirement thresholds as an (E, R) array, NaN where a transition has none
+        self.requirement_keys = sorted({key for r in self.requirements for key in r})
+        key_index = {key: i for i, key in enumerate(self.requirement_keys)}
+        self.thresholds = np.full((len(self.years), len(self.requirement_keys)), np.nan)
+        for e, r in enumerate(self.requirements):
+            for key, minimum in r.items():
+                self.thresholds[e, key_index[key]] = minimum
+        self._domain_keys = [CATALOG.domain_code(key) for key in self.requirement_keys]
+
+        # Outgoing transitions: CSR order for the table, lists of (edge, target, years) for searches
+        self.edge_order = np.argsort(self.sources, kind="stable")
+        self.out = [[] for _ in self.roles]
+        for e in self.edge_order.tolist():
+            self.out[self.sources[e]].append((e, int(self.targets[e]), float(self.years[e])))
+        self.sweep_order = self._postorder()
+
+        self._table = None   # (distances, first edges) over all transitions
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.roles)
+
+    def __contains__(self, role):
+        return role in self.role_index
+
+    def rating_levels(self, ratings):
+        """Current level for every requirement key: domain averages or single skill ratings"""
+        skills = list(ratings)
+        values = np.asarray([ratings[skill] for skill in skills], dtype=float)
+        codes = lookup_domain_codes(skills)
+        levels = np.zeros(len(self.requirement_keys))
+        for i, (key, code) in enumerate(zip(self.requirement_keys, self._domain_keys)):
+            if code is not None:
+                in_domain = codes == code
+                levels[i] = values[in_domain].mean() if in_domain.any() else 0.0
+            else:
+                levels[i] = float(ratings.get(key, 0.0))
+        return levels
+
+    def eligible_edges(self, ratings, slack=GROWTH_SLACK):
+        """Transitions whose every threshold is within slack of the ratings, as a bool mask"""
+        levels = self.rating_levels(ratings)
+        return np.all(np.isnan(self.thresholds) | (self.thresholds <= levels + slack), axis=1)
+
+    def unmet_requirements(self, edge, ratings):
+        """Thresholds of a transition above the current ratings, as (key, required, current)"""
+        levels = self.rating_levels(ratings)
+        key_index = {key: i for i, key in enumerate(self.requirement_keys)}
+        return [(key, minimum, float(levels[key_index[key]]))
+                for key, minimum in self.requirements[edge].items()
+                if levels[key_index[key]] < minimum]
+
+    def _postorder(self):
+        """Roles in DFS postorder: on an acyclic graph every role comes after all its successors"""
+        seen = [False] * len(self.roles)
+        order = []
+        for root in range(len(self.roles)):
+            if seen[root]:
+                continue
+            seen[root] = True
+            stack = [(root, iter(self.out[root]))]
+            while stack:
+                u, successors = stack[-1]
+                for _, v, _ in successors:
+                    if not seen[v]:
+                        seen[v] = True
+                        stack.append((v, iter(self.out[v])))
+                        break
+                else:
+                    stack.pop()
+                    order.append(u)
+        return order
+
+    def all_pairs(self):
+        """(distances, first edges) of all shortest paths over every transition, computed once"""
+        if self._table is None:
+            with self._lock:
+                if self._table is None:
+                    self._table = self._compute_all_pairs()
+        return self._table
+
+    def _compute_all_pairs(self):
+        """Row-wise Bellman-Ford: relax whole distance rows through each role's transitions
+
+        Rows are relaxed in DFS postorder, so a row is relaxed after the rows it reads
+        and an acyclic graph settles in one sweep; cycles (lateral moves back and
+        forth) only add sweeps until nothing changes.
+        """
+        n = len(self.roles)
+        dist = np.full((n, n), np.inf, dtype=np.float32)
+        np.fill_diagonal(dist, 0)
+        first_edge = np.full((n, n), -1, dtype=np.int32)
+        order = self.edge_order
+        bounds = np.searchsorted(self.sources[order], np.arange(n + 1))
+        years = self.years.astype(np.float32)
+        rows = [u for u in self.sweep_order if bounds[u] < bounds[u + 1]]
+        changed = True
+        while changed:
+            changed = False
+            for u in rows:
+                edges = order[bounds[u]:bounds[u + 1]]
+                candidates = years[edges, None] + dist[self.targets[edges]]
+                better = np.flatnonzero(candidates.min(axis=0) < dist[u])
+                if len(better):
+                    best = candidates[:, better].argmin(axis=0)
+                    dist[u, better] = candidates[best, better]
+                    first_edge[u, better] = edges[best]
+                    changed = True
+        return dist, first_edge
+
+    def _path(self, source, edges):
+        roles = [self.roles[source]] + [self.roles[self.targets[e]] for e in edges]
+        return RolePath(roles=roles, years=[float(self.years[e]) for e in edges], edges=list(edges))
+
+    def _heuristic(self, target):
+        """Years from every role to target over all transitions: a lower bound under any mask"""
+        dist, _ = self.all_pairs()
+        return dist[:, target].astype(float)
+
+    def distance(self, source, target, mask=None):
+        """Typical years from one role to another, inf when unreachable"""
+        if mask is not None:
+            path = self.shortest_path(source, target, mask)
+            return path.total_years if path is not None else float("inf")
+        dist, _ = self.all_pairs()
+        return float(dist[self.role_index[source], self.role_index[target]])
+
+    def shortest_path(self, source, target, mask=None):
+        """Fastest RolePath between two roles, None when unreachable"""
+        u, t = self.role_index[source], self.role_index[target]
+        if mask is not None:
+            edges = self._search(u, t, mask, self._heuristic(t), set(), set())
+            return self._path(u, edges) if edges is not None else None
+        dist, first_edge = self.all_pairs()
+        if not np.isfinite(dist[u, t]):
+            return None
+        edges = []
+        while u != t:
+            e = int(first_edge[u, t])
+            edges.append(e)
+            u = int(self.targets[e])
+        return self._path(self.role_index[source], edges)
+
+    def reachable_roles(self, source, mask=None):
+        """Roles reachable from source (excluding it) with their typical years"""
+        s = self.role_index[source]
+        if mask is not None:
+            return {self.roles[v]: d for v, d in self._dijkstra(s, mask).items() if v != s}
+        dist, _ = self.all_pairs()
+        row = dist[s]
+        return {self.roles[i]: float(row[i]) for i in np.flatnonzero(np.isfinite(row)) if i != s}
+
+    def _dijkstra(self, source, mask):
+        """Years from source to every role it reaches over the masked transitions"""
+        best = {source: 0.0}
+        heap = [(0.0, source)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > best[u]:
+                continue
+            for e, v, w in self.out[u]:
+                if mask[e] and d + w < best.get(v, np.inf):
+                    best[v] = d + w
+                    heapq.heappush(heap, (d + w, v))
+        return best
+
+    def _search(self, source, target, mask, heuristic, banned_nodes, banned_edges):
+        """A* from source to target avoiding the banned roles and transitions; edge list or None"""
+        best = {source: 0.0}
+        previous = {}
+        heap = [(heuristic[source], 0.0, source)]
+        while heap:
+            _, d, u = heapq.heappop(heap)
+            if u == target:
+                edges = []
+                while u != source:
+                    e = previous[u]
+                    edges.append(e)
+                    u = int(self.sources[e])
+                return edges[::-1]
+            if d > best[u]:
+                continue
+            for e, v, w in self.out[u]:
+                if v in banned_nodes or e in banned_edges or (mask is not None and not mask[e]):
+                    continue
+                nd = d + w
+                if nd < best.get(v, np.inf) and np.isfinite(heuristic[v]):
+                    best[v] = nd
+                    previous[v] = e
+                    heapq.heappush(heap, (nd + heuristic[v], nd, v))
+        return None
+
+    def k_shortest_paths(self, source, target, k=DEFAULT_PATH_COUNT, mask=None):
+        """Up to k loopless RolePaths from source to target, fastest first (Yen's algorithm)"""
+        first = self.shortest_path(source, target, mask)
+        if first is None or source == target:
+            return [first] if first is not None else []
+        s, t = self.role_index[source], self.role_index[target]
+        # Removing transitions only makes paths longer, so these distances stay admissible
+        heuristic = self._heuristic(t)
+        found = [first.edges]
+        candidates = []
+        seen = {tuple(first.edges)}
+        while len(found) < k:
+            previous = found[-1]
+            nodes = [s] + [int(self.targets[e]) for e in previous]
+            for i in range(len(previous)):
+                root = previous[:i]
+                banned_edges = {path[i] for path in found if len(path) > i and path[:i] == root}
+                spur = self._search(nodes[i], t, mask, heuristic, set(nodes[:i]), banned_edges)
+                if spur is None:
+                    continue
+                edges = root + spur
+                if tuple(edges) not in seen:
+                    seen.add(tuple(edges))
+                    heapq.heappush(candidates, (float(self.years[edges].sum()), len(edges), edges))
+            if not candidates:
+                break
+            found.append(heapq.heappop(candidates)[2])
+        return [self._path(s, edges) for edges in found]
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def validate_role_graph(doc):
+    """Problems with a role graph document, empty when it is valid"""
+    if not isinstance(doc, dict):
+        return ["role graph must be a JSON object"]
+    problems = []
+    if doc.get("version") != GRAPH_VERSION:
+        problems.append(f"unsupported version {doc.get('version')!r}, expected {GRAPH_VERSION}")
+    roles = doc.get("roles")
+    if not isinstance(roles, list) or not roles:
+        return problems + ["roles must be a non-empty list"]
+    names = set()
+    for i, role in enumerate(roles):
+        name = role.get("name") if isinstance(role, dict) else None
+        if not isinstance(name, str) or not name.strip():
+            problems.append(f"roles[{i}] needs a non-empty name")
+            continue
+        if name in names:
+            problems.append(f"role {name!r} is defined twice")
+        names.add(name)
+        if not isinstance(role.get("level"), int):
+            problems.append(f"role {name!r}: level must be an integer")
+
+    transitions = doc.get("transitions")
+    if not isinstance(transitions, list):
+        return problems + ["transitions must be a list"]
+    pairs = set()
+    for i, transition in enumerate(transitions):
+        if not isinstance(transition, dict):
+            problems.append(f"transitions[{i}] must be an object")
+            continue
+        source, target = transition.get("from"), transition.get("to")
+        label = f"transition {source!r} -> {target!r}"
+        for end in (source, target):
+            if end not in names:
+                problems.append(f"{label} references unknown role {end!r}")
+        if source == target:
+            problems.append(f"{label} loops on itself")
+        if (source, target) in pairs:
+            problems.append(f"{label} is defined twice")
+        pairs.add((source, target))
+        if not _is_number(transition.get("years")) or not transition["years"] > 0:
+            problems.append(f"{label}: years must be a positive number")
+        requirements = transition.get("requirements", {})
+        if not isinstance(requirements, dict):
+            problems.append(f"{label}: requirements must map domains or skills to ratings")
+            continue
+        for key, minimum in requirements.items():
+            if CATALOG.domain_code(key) is None and key not in CATALOG.index:
+                problems.append(f"{label}: {key!r} is neither a catalog domain nor a skill")
+            if not _is_number(minimum) or not 1 <= minimum <= 5:
+                problems.append(f"{label}: requirement {key!r} must be a rating from 1 to 5")
+    return problems
+
+
+def load_role_graph(path=GRAPH_PATH):
+    """Load and validate a role graph file; raises ValueError listing every problem found"""
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    problems = validate_role_graph(doc)
+    if problems:
+        raise ValueError(f"invalid role graph {path}:\n  " + "\n  ".join(problems))
+    index = {role["name"]: i for i, role in enumerate(doc["roles"])}
+    transitions = doc["transitions"]
+    return RoleGraph(
+        roles=[role["name"] for role in doc["roles"]],
+        levels=[role["level"] for role in doc["roles"]],
+        sources=[index[t["from"]] for t in transitions],
+        targets=[index[t["to"]] for t in transitions],
+        years=[t["years"] for t in transitions],
+        requirements=[t.get("requirements", {}) for t in transitions]
+    )
+
+
+_graph = None
+_graph_lock = threading.Lock()
+
+
+def get_role_graph():
+    """Role graph, loaded once per process with its all-pairs table"""
+    global _graph
+    if _graph is None:
+        with _graph_lock:
+            if _graph is None:
+                graph = load_role_graph()
+                graph.all_pairs()
+                _graph = graph
+    return _graph
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Time the role graph tables and lookups on a synthetic graph")
+    parser.add_argument("--roles", type=int, default=2000)
+    parser.add_argument("--transitions-per-role", type=int, default=5)
+    parser.add_argument("--levels", type=int, default=12)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Layered graph: mostly promotions one or two levels up, plus some lateral moves
+    rng = np.random.default_rng(args.seed)
+    n = args.roles
+    levels = np.sort(rng.integers(0, args.levels, n))
+    keys = list(CATALOG.domains)
+    sources, targets, years, requirements = [], [], [], []
+    pairs = set()
+    for u in range(n):
+        for _ in range(args.transitions_per_role):
+            step = rng.choice([0, 1, 1, 2])
+            candidates = np.flatnonzero(levels == min(levels[u] + step, args.levels - 1))
+            v = int(rng.choice(candidates))
+            if v == u or (u, v) in pairs:
+                continue
+            pairs.add((u, v))
+            sources.append(u)
+            targets.append(v)
+            years.append(float(rng.integers(1, 9)) / 2)
+            requirements.append({keys[rng.integers(len(keys))]: float(rng.integers(4, 10)) / 2})
+    graph = RoleGraph([f"Role {i}" for i in range(n)], levels, sources, targets, years, requirements)
+    print(f"{n} roles, {len(years)} transitions")
+
+    start = time.perf_counter()
+    graph.all_pairs()
+    print(f"all-pairs table: {time.perf_counter() - start:.2f} s")
+    ratings = {skill: float(rng.integers(1, 6)) for skills in CATALOG.categories.values() for skill in skills}
+    mask = graph.eligible_edges(ratings)
+    sources = rng.integers(0, n, 50)
+    start = time.perf_counter()
+    for a in sources:
+        graph.reachable_roles(graph.roles[a], mask)
+    print(f"filtered reachable roles ({mask.mean():.0%} of transitions usable): "
+          f"{(time.perf_counter() - start) / len(sources) * 1e3:.1f} ms each")
+
+    pairs = rng.integers(0, n, (args.queries, 2))
+    start = time.perf_counter()
+    paths = [graph.shortest_path(graph.roles[a], graph.roles[b], mask) for a, b in pairs]
+    elapsed = time.perf_counter() - start
+    print(f"shortest path lookups: {elapsed / len(pairs) * 1e6:.1f} us each, "
+          f"{sum(p is not None for p in paths)} of {len(pairs)} reachable")
+
+    reachable = [(a, b) for (a, b), p in zip(pairs, paths) if p is not None and len(p.edges) > 1][:50]
+    start = time.perf_counter()
+    for a, b in reachable:
+        graph.k_shortest_paths(graph.roles[a], graph.roles[b], DEFAULT_PATH_COUNT, mask)
+    print(f"{DEFAULT_PATH_COUNT}-best paths: {(time.perf_counter() - start) / max(len(reachable), 1) * 1e3:.1f} ms each")
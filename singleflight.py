@@ -0,0 +1,88 @@
+import threading
+
+# Request coalescing across threads. While a call for a key is running, further
+# calls for the same key do not start their own; they wait for the running one and
+# all get its result, or its exception. Streamlit runs every session's script on
+# its own thread of one server process, so concurrent sessions (or reruns) asking
+# for the same thing share one execution. do() wraps a function call; callers that
+# produce their result over time (a streamed response) use begin/wait/finish.
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one in-flight execution of a function among concurrent callers with the same key"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.calls = 0
+        self.executions = 0
+        self.deduplicated = 0
+        self.errors = 0
+
+    def begin(self, key):
+        """(call, leader) for a key; a leader must finish() its call, others wait() for it"""
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                call.waiters += 1
+                self.deduplicated += 1
+        return call, leader
+
+    def wait(self, call):
+        """Result of another caller's call, or its exception raised again"""
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def finish(self, key, call, result=None, error=None):
+        """Release the key and hand the leader's outcome to its waiters"""
+        call.result = result
+        call.error = error
+        # Callers arriving from here on start a new execution
+        with self._lock:
+            if error is not None:
+                self.errors += 1
+            del self._calls[key]
+        call.done.set()
+
+    def do(self, key, fn):
+        """fn() for the first caller of a key; later concurrent callers wait and share its outcome"""
+        call, leader = self.begin(key)
+        if not leader:
+            return self.wait(call)
+        try:
+            result = fn()
+        except BaseException as e:
+            self.finish(key, call, error=e)
+            raise
+        self.finish(key, call, result)
+        return result
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executions": self.executions,
+                "deduplicated": self.deduplicated,
+                "dedup_rate": self.deduplicated / self.calls if self.calls else 0.0,
+                "errors": self.errors,
+                "in_flight": len(self._calls)
+            }
@@ -0,0 +1,361 @@
+import csv
+import json
+import os
+import threading
+from functools import lru_cache
+import numpy as np
+
+# Skill catalog shared by the assessment UI, get_skill_domain and the reports.
+#
+# The catalog lives in data/skill_catalog.json (or SKILL_CATALOG_PATH): the domains
+# with their classifier keywords and assessment skills, plus any skills imported from
+# larger taxonomies. It is loaded and validated once per process into CATALOG; the
+# module constants below are views of it.
+#
+#   python skill_catalog.py taxonomy.csv more_skills.jsonl   # bulk import into the catalog file
+#
+# Taxonomy files are CSV (header with a skill column and an optional domain column),
+# JSON arrays or JSON Lines of {"skill": ..., "domain": ...} objects or plain names.
+# They are read row by row, so files with tens of thousands of skills import quickly.
+# Rows without a domain are classified with the domain keywords.
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+CATALOG_PATH = os.environ.get("SKILL_CATALOG_PATH", os.path.join(DATA_DIR, "skill_catalog.json"))
+CATALOG_VERSION = 1
+
+IMPORT_BATCH_SIZE = 5000  # Rows resolved before they are added to the live catalog
+MAX_SKILL_NAME_LENGTH = 200
+MAX_REPORTED_ERRORS = 20
+
+
+class SkillCatalog:
+    """Domains, classifier keywords and an index from every known skill to its domain code
+
+    Domain codes index into domain_names; the last code is the catalog's "other" domain.
+    Assessment skills are also indexed under their prefixed widget-key forms.
+    """
+
+    def __init__(self, categories, keywords, other_domain):
+        self.categories = categories      # Assessment skills per domain
+        self.keywords = keywords          # Classifier keywords per domain
+        self.domains = list(categories)
+        self.other_domain = other_domain
+        self.domain_names = self.domains + [other_domain]
+        self.other_code = len(self.domains)
+        self.index = _compile_domain_index(categories)
+        self.imported = []                # Imported skill names in import order
+        self._domain_codes = {name.lower(): code for code, name in enumerate(self.domain_names)}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(skills) for skills in self.categories.values()) + len(self.imported)
+
+    def domain_code(self, domain):
+        """Code of a domain name (case-insensitive), None if the catalog has no such domain"""
+        return self._domain_codes.get(domain.strip().lower())
+
+    def classify(self, skill):
+        """Domain code from the first domain whose keywords appear in the skill name"""
+        skill_lower = skill.lower()
+        for code, keywords in enumerate(self.keywords.values()):
+            if any(keyword in skill_lower for keyword in keywords):
+                return code
+        return self.other_code
+
+    def add_skills(self, skills, codes):
+        """Add skills with their domain codes; known skills keep their domain. Returns the count added"""
+        with self._lock:
+            new = {}
+            for skill, code in zip(skills, codes):
+                if skill not in self.index and skill not in new:
+                    new[skill] = code
+            # One dict update, so concurrent readers see either none or all of a batch
+            self.index.update(new)
+            self.imported.extend(new)
+            return len(new)
+
+    def to_dict(self):
+        imported = {domain: [] for domain in self.domain_names}
+        for skill in self.imported:
+            imported[self.domain_names[self.index[skill]]].append(skill)
+        doc = {
+            "version": CATALOG_VERSION,
+            "other_domain": self.other_domain,
+            "domains": [
+                {"name": domain, "keywords": self.keywords[domain], "skills": self.categories[domain]}
+                for domain in self.domains
+            ]
+        }
+        if self.imported:
+            doc["imported"] = {domain: skills for domain, skills in imported.items() if skills}
+        return doc
+
+
+def _compile_domain_index(categories):
+    """Map every catalog skill, and its prefixed widget-key forms, to a domain code"""
+    index = {}
+    for code, (domain, skills) in enumerate(categories.items()):
+        for skill in skills:
+            for key in (skill, f"{domain}_{skill}", f"{domain} {skill}"):
+                index.setdefault(key, code)
+    return index
+
+
+def _is_string_list(value):
+    return isinstance(value, list) and all(isinstance(item, str) and item.strip() for item in value)
+
+
+def validate_catalog(doc):
+    """Problems with a catalog document, empty when it is valid"""
+    if not isinstance(doc, dict):
+        return ["catalog must be a JSON object"]
+    problems = []
+    if doc.get("version") != CATALOG_VERSION:
+        problems.append(f"unsupported version {doc.get('version')!r}, expected {CATALOG_VERSION}")
+    other = doc.get("other_domain")
+    if not isinstance(other, str) or not other.strip():
+        problems.append("other_domain must be a non-empty string")
+    domains = doc.get("domains")
+    if not isinstance(domains, list) or not domains:
+        return problems + ["domains must be a non-empty list"]
+
+    names, owners = set(), {}
+    for i, domain in enumerate(domains):
+        name = domain.get("name") if isinstance(domain, dict) else None
+        if not isinstance(name, str) or not name.strip():
+            problems.append(f"domains[{i}] needs a non-empty name")
+            continue
+        if name.lower() in names or name == other:
+            problems.append(f"domain {name!r} is defined twice")
+        names.add(name.lower())
+        if not _is_string_list(domain.get("keywords", [])):
+            problems.append(f"domain {name!r}: keywords must be a list of non-empty strings")
+        if not _is_string_list(domain.get("skills")) or not domain.get("skills"):
+            problems.append(f"domain {name!r}: skills must be a non-empty list of non-empty strings")
+            continue
+        for skill in domain["skills"]:
+            if skill in owners:
+                problems.append(f"skill {skill!r} is listed under {owners[skill]!r} and {name!r}")
+            owners[skill] = name
+
+    imported = doc.get("imported", {})
+    if not isinstance(imported, dict):
+        problems.append("imported must map domain names to skill lists")
+    else:
+        for name, skills in imported.items():
+            if name.lower() not in names and name != other:
+                problems.append(f"imported skills reference unknown domain {name!r}")
+            if not _is_string_list(skills):
+                problems.append(f"imported[{name!r}] must be a list of non-empty strings")
+    return problems
+
+
+def load_catalog(path=CATALOG_PATH):
+    """Load and validate a catalog file; raises ValueError listing every problem found"""
+    with open(path, encoding="utf-8") as f:
+        doc = json.load(f)
+    problems = validate_catalog(doc)
+    if problems:
+        raise ValueError(f"invalid skill catalog {path}:\n  " + "\n  ".join(problems))
+    catalog = SkillCatalog(
+        categories={domain["name"]: list(domain["skills"]) for domain in doc["domains"]},
+        keywords={domain["name"]: [kw.lower() for kw in domain.get("keywords", [])] for domain in doc["domains"]},
+        other_domain=doc["other_domain"]
+    )
+    for domain, skills in doc.get("imported", {}).items():
+        catalog.add_skills(skills, [catalog.domain_code(domain)] * len(skills))
+    return catalog
+
+
+def save_catalog(catalog, path=CATALOG_PATH):
+    """Write a catalog file through a temporary file"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(catalog.to_dict(), f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+# Loaded once per process; everything below reads from it
+CATALOG = load_catalog()
+
+SKILL_CATEGORIES = CATALOG.categories
+DOMAINS = CATALOG.domains
+OTHER_DOMAIN = CATALOG.other_domain
+
+# Domain codes index into DOMAIN_NAMES; unknown skills map to OTHER_CODE
+DOMAIN_NAMES = CATALOG.domain_names
+OTHER_CODE = CATALOG.other_code
+
+# Keywords used to classify skills that are not in the catalog
+DOMAIN_KEYWORDS = CATALOG.keywords
+
+DOMAIN_INDEX = CATALOG.index
+
+
+@lru_cache(maxsize=65536)
+def classify_skill_domain(skill):
+    """Keyword fallback for skills missing from the catalog (cached per skill name)"""
+    return CATALOG.classify(skill)
+
+
+def lookup_domain_code(skill):
+    """Domain code of a skill: O(1) catalog lookup, cached classifier otherwise"""
+    code = DOMAIN_INDEX.get(skill)
+    return code if code is not None else classify_skill_domain(skill)
+
+
+def lookup_domain(skill):
+    """Domain name of a skill"""
+    return DOMAIN_NAMES[lookup_domain_code(skill)]
+
+
+def lookup_domain_codes(skills):
+    """Domain codes of many skills as an int array"""
+    return np.fromiter((lookup_domain_code(skill) for skill in skills), dtype=np.int64, count=len(skills))
+
+
+def lookup_domains(skills):
+    """Domain names of many skills as an object array"""
+    return np.array(DOMAIN_NAMES, dtype=object)[lookup_domain_codes(skills)]
+
+
+_JSON_DELIMITERS = frozenset(",] \t\r\n")
+
+
+def _iter_json_array(f, chunk_size=1 << 16):
+    """Items of a top-level JSON array, decoded one at a time from a text stream"""
+    decoder = json.JSONDecoder()
+    buffer, eof, started = "", False, False
+    while True:
+        buffer = buffer.lstrip()
+        if buffer and not started:
+            if buffer[0] != "[":
+                raise ValueError("expected a JSON array")
+            buffer, started = buffer[1:], True
+            continue
+        if buffer and buffer[0] == "]":
+            return
+        if buffer and buffer[0] == ",":
+            buffer = buffer[1:]
+            continue
+        if buffer:
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None  # Item continues in the next chunk
+            # A value is only complete once a delimiter follows it ("3." may be the start of 3.25)
+            if end is not None and (eof or (end < len(buffer) and buffer[end] in _JSON_DELIMITERS)):
+                yield item
+                buffer = buffer[end:]
+                continue
+        if eof:
+            raise ValueError("unterminated JSON array")
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+
+
+def _row_fields(row, skill_field, domain_field):
+    if isinstance(row, str):
+        return row, None
+    if isinstance(row, dict):
+        return row.get(skill_field), row.get(domain_field)
+    return None, None
+
+
+def iter_taxonomy_rows(path, skill_field="skill", domain_field="domain"):
+    """(skill, domain or None) for every row of a CSV, JSON array or JSON Lines file"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                yield row.get(skill_field), row.get(domain_field)
+    elif extension in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield _row_fields(json.loads(line), skill_field, domain_field)
+    elif extension == ".json":
+        with open(path, encoding="utf-8") as f:
+            for row in _iter_json_array(f):
+                yield _row_fields(row, skill_field, domain_field)
+    else:
+        raise ValueError(f"unsupported taxonomy file type {extension!r} (use .csv, .json or .jsonl)")
+
+
+def import_taxonomy(path, catalog=None, skill_field="skill", domain_field="domain", batch_size=IMPORT_BATCH_SIZE):
+    """Stream a taxonomy file into the catalog (CATALOG by default); returns import statistics"""
+    catalog = CATALOG if catalog is None else catalog
+    stats = {"rows": 0, "added": 0, "known": 0, "classified": 0, "rejected": 0, "errors": []}
+    skills, codes = [], []
+
+    def reject(message):
+        stats["rejected"] += 1
+        if len(stats["errors"]) < MAX_REPORTED_ERRORS:
+            stats["errors"].append(f"row {stats['rows']}: {message}")
+
+    def flush():
+        added = catalog.add_skills(skills, codes)
+        stats["added"] += added
+        stats["known"] += len(skills) - added
+        skills.clear()
+        codes.clear()
+
+    for skill, domain in iter_taxonomy_rows(path, skill_field, domain_field):
+        stats["rows"] += 1
+        skill = skill.strip() if isinstance(skill, str) else ""
+        if not skill:
+            reject(f"missing {skill_field!r}")
+            continue
+        if len(skill) > MAX_SKILL_NAME_LENGTH:
+            reject(f"skill name longer than {MAX_SKILL_NAME_LENGTH} characters")
+            continue
+        if isinstance(domain, str) and domain.strip():
+            code = catalog.domain_code(domain)
+            if code is None:
+                reject(f"unknown domain {domain.strip()!r}")
+                continue
+        else:
+            code = classify_skill_domain(skill) if catalog is CATALOG else catalog.classify(skill)
+            stats["classified"] += 1
+        skills.append(skill)
+        codes.append(code)
+        if len(skills) >= batch_size:
+            flush()
+    flush()
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    import time
+
+    parser = argparse.ArgumentParser(description="Import taxonomy files into the skill catalog")
+    parser.add_argument("files", nargs="+", help="CSV, JSON array or JSON Lines taxonomy files")
+    parser.add_argument("--catalog", default=CATALOG_PATH, help="Catalog file to update")
+    parser.add_argument("--skill-field", default="skill", help="Column or key holding the skill name")
+    parser.add_argument("--domain-field", default="domain", help="Column or key holding the domain (optional)")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be imported without saving")
+    args = parser.parse_args()
+
+    catalog = load_catalog(args.catalog)
+    before = len(catalog)
+    for path in args.files:
+        started = time.perf_counter()
+        stats = import_taxonomy(path, catalog, args.skill_field, args.domain_field)
+        elapsed = time.perf_counter() - started
+        print(f"{path}: {stats['rows']:,} rows in {elapsed:.2f}s ({stats['rows'] / max(elapsed, 1e-9):,.0f} rows/s), "
+              f"{stats['added']:,} added, {stats['known']:,} already known, "
+              f"{stats['classified']:,} classified by keyword, {stats['rejected']:,} rejected")
+        for error in stats["errors"]:
+            print(f"  {error}")
+
+    print(f"Catalog: {before:,} -> {len(catalog):,} skills")
+    if args.dry_run:
+        sys.exit(0)
+    save_catalog(catalog, args.catalog)
+    print(f"Wrote {args.catalog}")
@@ -0,0 +1,229 @@
+import numpy as np
+import pandas as pd
+
+# Columnar scoring engine for the impact/effort quadrant and skill priorities.
+# Every function works on whole NumPy arrays, so the same code scores one
+# 24-skill profile or an N x skills cohort matrix in a single pass.
+
+RECOMMENDATIONS = np.array([
+    "High Priority - Quick Win",
+    "Strategic Investment - High Value",
+    "Easy Improvement - Lower Priority",
+    "Consider Later - Low Value/High Effort"
+], dtype=object)
+
+PRIORITY_LEVELS = ['Consider Later', 'Medium Priority', 'High Priority']
+
+# Upper edges of the 'Consider Later' and 'Medium Priority' bins
+PRIORITY_BIN_EDGES = np.array([30, 60])
+
+# Goal keywords that mark a whole domain as aligned with a learning goal
+GOAL_ALIGNMENT_KEYWORDS = {
+    "Programming": ["Development", "Stack", "Full", "Web"],
+    "Data & Analytics": ["Data", "Analytics", "ML", "Science"],
+    "Infrastructure": ["Cloud", "DevOps", "Security", "SRE"],
+    "Soft Skills": ["Leadership", "Management"]
+}
+
+
+def _get_rng(rng):
+    return rng if rng is not None else np.random.default_rng()
+
+
+def effort_jitter(shape, rng=None):
+    return _get_rng(rng).uniform(-0.5, 0.5, size=shape)
+
+
+def impact_jitter(shape, rng=None):
+    return _get_rng(rng).uniform(-1, 1, size=shape)
+
+
+def effort_scores(levels, rng=None, jitter=None):
+    """Effort to improve each skill (inverse of current level with randomization)
+
+    jitter fixes the randomization (see effort_jitter); otherwise it is drawn from rng.
+    """
+    levels = np.asarray(levels, dtype=float)
+    jitter = effort_jitter(levels.shape, rng) if jitter is None else jitter
+    return np.maximum(1, 10 - levels * 1.5 + jitter)
+
+
+def impact_scores(levels, rng=None, jitter=None):
+    """Potential impact of improving each skill (higher for lower current levels)
+
+    jitter fixes the randomization (see impact_jitter); otherwise it is drawn from rng.
+    """
+    levels = np.asarray(levels, dtype=float)
+    jitter = impact_jitter(levels.shape, rng) if jitter is None else jitter
+    return np.maximum(1, 10 - (levels - 1) * 2 + jitter)
+
+
+def goal_domains(goal):
+    """Domains whose keywords appear in a learning goal"""
+    return [domain for domain, keywords in GOAL_ALIGNMENT_KEYWORDS.items()
+            if any(kw in goal for kw in keywords)]
+
+
+def goal_alignment_scores(skills, domains, learning_goals):
+    """Alignment of every skill with the learning goals, capped at 15"""
+    skills_lower = np.char.lower(np.asarray(skills, dtype=str))
+    domains = np.asarray(domains, dtype=object)
+    alignment = np.full(skills_lower.shape, 5, dtype=np.int64)  # Base alignment
+
+    for goal in learning_goals:
+        # Direct skill name alignment
+        keyword_hit = np.zeros(skills_lower.shape, dtype=bool)
+        for kw in goal.split():
+            keyword_hit |= np.char.find(skills_lower, kw.lower()) >= 0
+        alignment += 5 * keyword_hit
+
+        # Domain alignment
+        alignment += 3 * np.isin(domains, goal_domains(goal))
+
+    return np.minimum(15, alignment)
+
+
+def recommendation_codes(effort, impact):
+    """Index into RECOMMENDATIONS for every (effort, impact) pair"""
+    effort = np.asarray(effort)
+    impact = np.asarray(impact)
+    return np.where(impact > 5, 0, 2) + (effort >= 5)
+
+
+def priority_scores(impact, effort, goal_alignment, levels):
+    """Weighted development priority score, capped at 99"""
+    effort_factor = np.maximum(1, 10 - np.asarray(effort)) / 10  # Lower effort = higher score
+    impact_factor = np.asarray(impact) / 10
+    alignment_factor = np.asarray(goal_alignment) / 15
+    level_factor = (5 - np.asarray(levels)) / 5  # Lower current level = higher priority
+
+    priority = (
+        (impact_factor * 40) +
+        (effort_factor * 25) +
+        (alignment_factor * 20) +
+        (level_factor * 15)
+    ) * 100
+
+    return np.minimum(99, np.round(priority)).astype(np.int64)
+
+
+def priority_level_codes(priority):
+    """Index into PRIORITY_LEVELS for every score, -1 outside the (0, 100] range"""
+    priority = np.asarray(priority)
+    codes = np.searchsorted(PRIORITY_BIN_EDGES, priority, side='left')
+    return np.where((priority > 0) & (priority <= 100), codes, -1)
+
+
+def priority_levels(priority):
+    """Priority scores binned into the ordered PRIORITY_LEVELS categorical"""
+    return pd.Categorical.from_codes(
+        priority_level_codes(priority), categories=PRIORITY_LEVELS, ordered=True
+    )
+
+
+def score_skills(skills, levels, domains, learning_goals, rng=None):
+    """Score every skill of one profile (levels shape (S,)) or a cohort (N, S) at once"""
+    rng = _get_rng(rng)
+    levels = np.asarray(levels, dtype=float)
+    effort = effort_scores(levels, rng)
+    impact = impact_scores(levels, rng)
+    alignment = np.broadcast_to(
+        goal_alignment_scores(skills, domains, learning_goals), levels.shape
+    )
+    return {
+        'Effort': effort,
+        'Impact': impact,
+        'Goal Alignment': alignment,
+        'Recommendation': RECOMMENDATIONS[recommendation_codes(effort, impact)],
+        'Priority Score': priority_scores(impact, effort, alignment, levels)
+    }
+
+
+def top_k_indices(scores, k):
+    """Indices of the k highest scores along the last axis, highest first
+
+    Uses partial selection instead of a full sort. Ties are broken by the lower index,
+    so the result matches the first k rows of a stable descending sort.
+    """
+    scores = np.asarray(scores)
+    n = scores.shape[-1]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(scores.shape[:-1] + (0,), dtype=np.int64)
+
+    # k-th largest value of every row, then everything above it plus the earliest ties
+    kth = np.partition(scores, n - k, axis=-1)[..., n - k, None]
+    above = scores > kth
+    ties = scores == kth
+    needed = k - above.sum(axis=-1, keepdims=True)
+    selected = above | (ties & (np.cumsum(ties, axis=-1) <= needed))
+
+    # Every row selects exactly k columns; np.nonzero returns them in row-major order
+    indices = np.nonzero(selected)[-1].reshape(scores.shape[:-1] + (k,))
+    order = np.argsort(-np.take_along_axis(scores, indices, axis=-1), axis=-1, kind='stable')
+    return np.take_along_axis(indices, order, axis=-1)
+
+
+def top_k_priorities(skills, priority, k):
+    """Top-k skills of one profile (priority shape (S,)) or many (N, S) with scores and levels
+
+    Returns (skill names, priority scores, priority level codes), each shaped (..., k).
+    """
+    priority = np.asarray(priority)
+    indices = top_k_indices(priority, k)
+    scores = np.take_along_axis(priority, indices, axis=-1)
+    return np.asarray(skills, dtype=object)[indices], scores, priority_level_codes(scores)
+
+
+class TopKAccumulator:
+    """Running top-k over a skill catalog that arrives in column chunks
+
+    push() takes an (N, chunk) block of scores and the catalog offset of its first column;
+    result() returns the (N, k) catalog indices and scores, highest first.
+    """
+
+    def __init__(self, k, n_profiles=1):
+        self.k = k
+        self.indices = np.empty((n_profiles, 0), dtype=np.int64)
+        self.scores = np.empty((n_profiles, 0))
+
+    def push(self, scores, offset):
+        scores = np.atleast_2d(np.asarray(scores, dtype=float))
+        chunk_indices = np.broadcast_to(np.arange(offset, offset + scores.shape[1]), scores.shape)
+        candidates = np.concatenate([self.indices, chunk_indices], axis=1)
+        candidate_scores = np.concatenate([self.scores, scores], axis=1)
+        # Keep the merged candidates in catalog order so ties still favour earlier skills
+        by_index = np.argsort(candidates, axis=1, kind='stable')
+        candidates = np.take_along_axis(candidates, by_index, axis=1)
+        candidate_scores = np.take_along_axis(candidate_scores, by_index, axis=1)
+        best = top_k_indices(candidate_scores, self.k)
+        self.indices = np.take_along_axis(candidates, best, axis=1)
+        self.scores = np.take_along_axis(candidate_scores, best, axis=1)
+        return self
+
+    def result(self):
+        return self.indices, self.scores
+
+
+if __name__ == "__main__":
+    import time
+
+    # Compare top-k selection with the full sort + pd.cut path for growing catalogs
+    rng = np.random.default_rng(0)
+    for n_profiles, n_skills in [(1, 24), (1, 5000), (1, 100000), (1000, 500), (1000, 5000)]:
+        priority = rng.integers(1, 100, size=(n_profiles, n_skills))
+        skills = np.array([f"Skill {i}" for i in range(n_skills)], dtype=object)
+
+        started = time.perf_counter()
+        for row in priority:
+            frame = pd.DataFrame({'Skill': skills, 'Priority Score': row})
+            frame['Priority Level'] = pd.cut(frame['Priority Score'], bins=[0, 30, 60, 100], labels=PRIORITY_LEVELS)
+            frame.sort_values('Priority Score', ascending=False).head(12)
+        full_sort = time.perf_counter() - started
+
+        started = time.perf_counter()
+        top_k_priorities(skills, priority, 12)
+        top_k = time.perf_counter() - started
+
+        print(f"{n_profiles:>5} profiles x {n_skills:>6} skills: full sort {full_sort * 1000:8.1f} ms, "
+              f"top-k {top_k * 1000:7.1f} ms ({full_sort / top_k:5.1f}x)")
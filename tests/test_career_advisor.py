@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import pytest
+from openai import OpenAI
+import career_advisor
+from career_advisor import RecommendationStream, get_career_recommendations_batch, iter_career_recommendations
+from openai_stub import StubConfig, StubServer, stub_recommendations
+from recommendation_cache import RecommendationCache, normalize_profile
+from singleflight import SingleFlight
+
+# The career advisor's request paths against the local stub.
+
+PROFILE = normalize_profile({"Python": 4, "SQL": 2}, 3, "Bachelor's Degree", ["Cloud", "Data", "Security"])
+
+
+@pytest.fixture
+def stub():
+    with StubServer(StubConfig(latency=0.01, token_delay=0.005, chunk_chars=8)) as server:
+        yield server
+
+
+def single_connection_client(stub):
+    """A client whose pool holds one connection and gives up waiting for it after a second"""
+    http_client = httpx.Client(limits=httpx.Limits(max_connections=1), timeout=httpx.Timeout(5, pool=1))
+    return OpenAI(api_key="stub", base_url=stub.url, max_retries=0, http_client=http_client)
+
+
+def test_stream_yields_the_whole_response(stub):
+    stream = RecommendationStream(PROFILE, client=single_connection_client(stub), cache=None)
+    events = list(stream)
+
+    expected = stub_recommendations(PROFILE)
+    assert events == [("career", career) for career in expected["careers"]] + [
+        ("development_plan", expected["development_plan"])
+    ]
+    assert stream.timing.careers == len(expected["careers"])
+
+
+def test_closing_a_stream_early_releases_its_connection(stub):
+    client = single_connection_client(stub)
+    with RecommendationStream(PROFILE, client=client, cache=None) as stream:
+        kind, _ = next(iter(stream))
+        assert kind == "career"
+
+    # With the first response still open, this would wait for the pool and time out
+    events = list(RecommendationStream(PROFILE, client=client, cache=None))
+    assert events[-1][0] == "development_plan"
+
+
+def run_streams(streams):
+    """Iterate every stream on its own thread, all starting together; events per stream"""
+    barrier = threading.Barrier(len(streams))
+
+    def consume(stream):
+        barrier.wait()
+        return list(stream)
+
+    with ThreadPoolExecutor(len(streams)) as pool:
+        return list(pool.map(consume, streams))
+
+
+def test_concurrent_streams_of_one_profile_share_a_request():
+    with StubServer(StubConfig(latency=0.3, token_delay=0.005, chunk_chars=8)) as slow_stub:
+        client = single_connection_client(slow_stub)
+        cache, flights = RecommendationCache("test", path=None), SingleFlight()
+        streams = [RecommendationStream(PROFILE, client=client, cache=cache, flights=flights) for _ in range(6)]
+
+        results = run_streams(streams)
+
+    assert slow_stub.requests == 1
+    assert all(events == results[0] for events in results)
+    assert len(results[0]) == len(stub_recommendations(PROFILE)["careers"]) + 1
+    assert sorted(stream.timing.shared for stream in streams) == [False] + [True] * 5
+    assert flights.stats()["deduplicated"] == 5
+    assert cache.get(PROFILE) is not None
+
+
+def test_waiting_stream_takes_over_when_the_leader_stops(stub):
+    client = single_connection_client(stub)
+    flights = SingleFlight()
+    leader = RecommendationStream(PROFILE, client=client, cache=None, flights=flights)
+    follower = RecommendationStream(PROFILE, client=client, cache=None, flights=flights)
+
+    with leader:
+        next(iter(leader))
+        with ThreadPoolExecutor(1) as pool:
+            waiting = pool.submit(list, follower)
+            deadline = time.monotonic() + 5
+            while flights.stats()["deduplicated"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            leader.close()
+            events = waiting.result(timeout=10)
+
+    assert events[-1][0] == "development_plan"
+    assert not follower.timing.shared
+    assert stub.requests == 2
+
+
+def batch_profiles(count):
+    return [
+        {"skills": {f"Skill {i}": 3, "Python": 4}, "experience_years": 2, "education_level": "PhD", "interests": ["Data"]}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def start_stub(monkeypatch):
+    """Start a stub with the given StubConfig fields and point the batch client at it"""
+    servers = []
+    monkeypatch.setattr(career_advisor, "RETRY_BASE_DELAY", 0.001)
+
+    def start(**config):
+        server = StubServer(StubConfig(**config)).start()
+        servers.append(server)
+        monkeypatch.setenv("OPENAI_API_KEY", "stub")
+        monkeypatch.setenv("OPENAI_BASE_URL", server.url)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def test_batch_keeps_at_most_concurrency_requests_in_flight(start_stub):
+    stub_server = start_stub(latency=0.05)
+    results = get_career_recommendations_batch(batch_profiles(20), concurrency=3, rate=0, cache=None)
+
+    assert all(result.ok for result in results)
+    assert stub_server.requests == 20
+    assert stub_server.max_in_flight <= 3
+
+
+def test_batch_retries_server_errors_per_item(start_stub):
+    stub_server = start_stub(latency=0.01, failure_rate=0.4, failure_status=503, seed=7)
+    results = get_career_recommendations_batch(batch_profiles(12), rate=0, max_retries=10, cache=None)
+
+    assert all(result.ok for result in results)
+    assert stub_server.failures > 0
+    assert any(result.attempts > 1 for result in results)
+    assert sum(result.attempts for result in results) == stub_server.requests
+
+
+def test_batch_does_not_retry_client_errors(start_stub):
+    stub_server = start_stub(latency=0.01, failure_rate=1.0, failure_status=400)
+    results = get_career_recommendations_batch(batch_profiles(5), rate=0, max_retries=10, cache=None)
+
+    assert all(not result.ok for result in results)
+    assert all(result.attempts == 1 for result in results)
+    assert stub_server.requests == 5
+
+
+def test_batch_answers_cached_profiles_without_a_request(start_stub):
+    stub_server = start_stub(latency=0.02)
+    profiles = batch_profiles(5)
+    cache = RecommendationCache("test", path=None)
+    for profile in profiles[:3]:
+        cache.put(normalize_profile(**profile), {"careers": [], "development_plan": "cached"})
+
+    async def collect():
+        return [result async for result in iter_career_recommendations(profiles, rate=0, cache=cache)]
+
+    results = asyncio.run(collect())
+
+    assert stub_server.requests == 2
+    assert [result.cached for result in results] == [True, True, True, False, False]  # Cached ones come first
+    assert all(result.attempts == 0 for result in results[:3])
+    assert all(result.recommendations["development_plan"] == "cached" for result in results[:3])
+    assert all(result.ok and result.attempts == 1 for result in results[3:])
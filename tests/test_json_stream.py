@@ -0,0 +1,81 @@
+import json
+import random
+import pytest
+from json_stream import IncrementalObjectParser
+
+# The incremental parser against json.loads on random documents fed in random
+# pieces: the same events (arrays element by element) and the same final object.
+
+WORDS = ["plain", "quote \" inside", "back\\slash", "brace } ] , :", "ünïcødé ✓", "", "new\nline", "tab\t"]
+
+
+def random_value(rng, depth=0):
+    kinds = ["string", "int", "float", "literal"] + (["array", "object"] if depth < 3 else [])
+    kind = rng.choice(kinds)
+    if kind == "string":
+        return rng.choice(WORDS)
+    if kind == "int":
+        return rng.randint(-10 ** 6, 10 ** 6)
+    if kind == "float":
+        return rng.uniform(-1e3, 1e3)
+    if kind == "literal":
+        return rng.choice([True, False, None])
+    if kind == "array":
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {rng.choice(WORDS) + str(i): random_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+
+
+def random_document(rng):
+    return {f"key {i} {rng.choice(WORDS)}": random_value(rng) for i in range(rng.randint(0, 6))}
+
+
+def expected_events(document):
+    events = []
+    for key, value in document.items():
+        if isinstance(value, list):
+            events.extend((key, item) for item in value)
+        else:
+            events.append((key, value))
+    return events
+
+
+def random_pieces(rng, text):
+    pieces, i = [], 0
+    while i < len(text):
+        size = rng.choice([1, 1, 2, 3, 7, 20, 100])
+        pieces.append(text[i:i + size])
+        i += size
+    return pieces
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_random_documents_in_random_pieces(seed):
+    rng = random.Random(seed)
+    document = random_document(rng)
+    text = json.dumps(document, indent=rng.choice([None, 2]), ensure_ascii=rng.random() < 0.5)
+
+    parser = IncrementalObjectParser()
+    events = []
+    for piece in random_pieces(rng, text):
+        events.extend(parser.feed(piece))
+
+    assert events == expected_events(json.loads(text))
+    assert parser.close() == json.loads(text)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_truncated_documents_do_not_close(seed):
+    rng = random.Random(seed)
+    text = json.dumps(random_document(rng))
+    parser = IncrementalObjectParser()
+    parser.feed(text[:rng.randrange(len(text))])
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+@pytest.mark.parametrize("text", ['[1, 2]', '"text"', '{"a": 1} {"b": 2}', '{"a": 1}x'])
+def test_non_object_input_is_rejected(text):
+    parser = IncrementalObjectParser()
+    with pytest.raises(ValueError):
+        parser.feed(text)
+        parser.close()
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import openai_client
+from openai_client import METRICS, close_openai_client, create_async_openai_client, get_openai_client
+from openai_stub import StubConfig, StubServer
+
+# Connection reuse of the shared OpenAI client against the local stub. The stub
+# counts accepted TCP connections; METRICS counts what the client saw.
+
+MESSAGES = [{"role": "user", "content": json.dumps({"skills": ["Python"], "interests": ["Cloud"]})}]
+
+
+def complete(client):
+    return client.chat.completions.create(model="gpt-4o", messages=MESSAGES)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.01)
+
+
+def delta(before):
+    after = METRICS.stats()
+    return {name: after[name] - before[name] for name in ("requests", "new_connections", "reused_connections",
+                                                          "warm_ups", "warm_up_errors")}
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    close_openai_client()
+    with StubServer(StubConfig(latency=0.01)) as server:
+        monkeypatch.setenv("OPENAI_API_KEY", "stub")
+        monkeypatch.setenv("OPENAI_BASE_URL", server.url)
+        yield server
+        close_openai_client()
+
+
+def test_client_is_created_once_and_shared(stub):
+    before = METRICS.stats()
+    with ThreadPoolExecutor(8) as pool:
+        clients = list(pool.map(lambda _: get_openai_client(), range(32)))
+    assert all(client is clients[0] for client in clients)
+    wait_for(lambda: delta(before)["warm_ups"] == 1)  # One client, one warm-up
+
+
+def test_warm_up_opens_a_connection_that_requests_reuse(stub):
+    before = METRICS.stats()
+    client = get_openai_client()
+    wait_for(lambda: delta(before)["warm_ups"] == 1)
+    assert stub.connections == 1
+
+    for _ in range(20):
+        complete(client)
+
+    assert stub.requests == 20
+    assert stub.connections == 1
+    counts = delta(before)
+    assert counts["requests"] == 21  # The warm-up and the completions
+    assert counts["new_connections"] == 1
+    assert counts["reused_connections"] == 20
+
+
+def test_threaded_requests_share_the_pool(stub, monkeypatch):
+    monkeypatch.setattr(openai_client, "WARM_UP", False)
+    before = METRICS.stats()
+    client = get_openai_client()
+
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda _: complete(client), range(40)))
+
+    counts = delta(before)
+    assert stub.requests == 40
+    assert 1 <= stub.connections <= 4
+    assert counts["new_connections"] == stub.connections
+    assert counts["reused_connections"] == 40 - stub.connections
+
+
+def test_async_client_reuses_connections(stub):
+    before = METRICS.stats()
+
+    async def run():
+        client = create_async_openai_client()
+        try:
+            for _ in range(10):
+                await client.chat.completions.create(model="gpt-4o", messages=MESSAGES)
+        finally:
+            await client.close()
+
+    asyncio.run(run())
+    assert stub.connections == 1
+    counts = delta(before)
+    assert counts["new_connections"] == 1
+    assert counts["reused_connections"] == 9
+
+
+def test_failed_warm_up_is_counted_not_raised(monkeypatch):
+    # A port nothing listens on
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    close_openai_client()
+    monkeypatch.setenv("OPENAI_API_KEY", "stub")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{port}/v1")
+    before = METRICS.stats()
+    try:
+        get_openai_client()
+        wait_for(lambda: delta(before)["warm_up_errors"] == 1)
+    finally:
+        close_openai_client()
+    assert delta(before)["warm_ups"] == 0
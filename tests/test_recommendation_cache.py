@@ -0,0 +1,53 @@
+from recommendation_cache import RecommendationCache
+
+# Workers sharing one cache file while running different fingerprints (a rolling
+# deploy) must not delete each other's entries.
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_opening_a_cache_keeps_other_fingerprints(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    clock = Clock()
+    old = RecommendationCache("old", path=path, ttl=100, clock=clock)
+    old.put({"profile": 1}, {"careers": ["old"]})
+    new = RecommendationCache("new", path=path, ttl=100, clock=clock)
+    new.put({"profile": 1}, {"careers": ["new"]})
+
+    assert RecommendationCache("old", path=path, ttl=100, clock=clock).get({"profile": 1}) == {"careers": ["old"]}
+    assert RecommendationCache("new", path=path, ttl=100, clock=clock).get({"profile": 1}) == {"careers": ["new"]}
+
+
+def test_opening_a_cache_deletes_expired_entries(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    clock = Clock()
+    RecommendationCache("old", path=path, ttl=100, clock=clock).put({"profile": 1}, {"careers": []})
+    RecommendationCache("new", path=path, ttl=300, clock=clock).put({"profile": 1}, {"careers": []})
+
+    clock.now += 200
+    cache = RecommendationCache("new", path=path, ttl=300, clock=clock)
+    assert cache.purged == 1
+    assert len(cache.disk) == 1
+
+
+def test_purge_stale_only_removes_idle_fingerprints(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    clock = Clock()
+    old = RecommendationCache("old", path=path, ttl=1000, clock=clock)
+    old.put({"profile": 1}, {"careers": []})
+    new = RecommendationCache("new", path=path, ttl=1000, clock=clock)
+
+    clock.now += 50
+    new.put({"profile": 2}, {"careers": []})
+    assert new.purge_stale(grace=60) == 0  # "old" wrote 50 s ago
+    clock.now += 20
+    assert new.purge_stale(grace=60) == 1
+    assert old.get({"profile": 1}) is not None  # Still in the old worker's memory tier
+    assert len(new.disk) == 1
+    assert new.purge_stale(grace=0) == 0  # Never its own entries
@@ -0,0 +1,46 @@
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+from report_engine import add_milestone_annotations, generate_growth_projection
+from analytics_report import add_milestone_annotations as reexported_add_milestone_annotations
+
+
+def original_add_milestone_annotations(fig, growth_data, experience):
+    """The per-domain implementation the report used before milestones were solved exactly"""
+    for domain in growth_data['Domain'].unique():
+        domain_data = growth_data[growth_data['Domain'] == domain]
+        level_4_milestone = domain_data[domain_data['Projected Level'] >= 4].sort_values('Month')
+        if not level_4_milestone.empty and level_4_milestone.iloc[0]['Month'] > 0:
+            fig.add_annotation(
+                x=level_4_milestone.iloc[0]['Month'],
+                y=level_4_milestone.iloc[0]['Projected Level'],
+                text="Advanced"
+            )
+
+
+def annotation_points(fig):
+    return sorted((a.x, round(a.y, 9)) for a in fig.layout.annotations)
+
+
+@pytest.mark.parametrize("ratings, experience, goals", [
+    ([1.0, 2.5, 3.5, 4.2], 1, ["Cloud Architecture", "Data Science & ML"]),
+    ([3.9, 3.0, 2.0, 1.5], 4, ["Technical Leadership"]),
+    ([4.5, 4.0, 5.0, 3.8], 8, []),
+])
+def test_old_style_milestone_annotations_match_the_original(ratings, experience, goals):
+    domain_avg = pd.DataFrame({
+        'Domain': ["Programming", "Data & Analytics", "Infrastructure", "Soft Skills"],
+        'Rating': ratings
+    })
+    growth_data = generate_growth_projection(domain_avg, experience, goals)
+
+    expected, actual = go.Figure(), go.Figure()
+    original_add_milestone_annotations(expected, growth_data, experience)
+    add_milestone_annotations(actual, growth_data, experience)
+
+    assert annotation_points(actual) == annotation_points(expected)
+    assert all(a.text.startswith("Advanced") for a in actual.layout.annotations)
+
+
+def test_analytics_report_reexports_the_old_interface():
+    assert reexported_add_milestone_annotations is add_milestone_annotations
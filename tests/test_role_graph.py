@@ -0,0 +1,101 @@
+import itertools
+import random
+import numpy as np
+import pytest
+from role_graph import RoleGraph, get_role_graph
+
+# Role graph lookups against brute force on small random graphs, with and without
+# a mask of usable transitions.
+
+
+def random_graph(seed, n=9, edge_probability=0.3):
+    """Random graph with lateral moves and cycles; years in half-year steps like the data"""
+    rng = random.Random(seed)
+    sources, targets, years = [], [], []
+    for u, v in itertools.permutations(range(n), 2):
+        if rng.random() < edge_probability:
+            sources.append(u)
+            targets.append(v)
+            years.append(rng.randint(1, 8) / 2)
+    graph = RoleGraph([f"Role {i}" for i in range(n)], [0] * n, sources, targets, years, [{}] * len(years))
+    masks = [None, np.array([rng.random() < 0.6 for _ in years], dtype=bool)]
+    return graph, masks
+
+
+def simple_paths(graph, s, t, mask):
+    """Every loopless path from s to t over the usable transitions, as edge lists"""
+    paths = []
+
+    def extend(u, visited, edges):
+        if u == t:
+            paths.append(list(edges))
+            return
+        for e, v, _ in graph.out[u]:
+            if v not in visited and (mask is None or mask[e]):
+                extend(v, visited | {v}, edges + [e])
+
+    extend(s, {s}, [])
+    return paths
+
+
+def path_years(graph, edges):
+    return float(sum(graph.years[e] for e in edges))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_lookups_match_brute_force(seed):
+    graph, masks = random_graph(seed)
+    for mask in masks:
+        for s, t in itertools.product(range(len(graph)), repeat=2):
+            source, target = graph.roles[s], graph.roles[t]
+            totals = sorted(path_years(graph, edges) for edges in simple_paths(graph, s, t, mask))
+            expected = totals[0] if totals else np.inf
+
+            assert graph.distance(source, target, mask) == expected
+            path = graph.shortest_path(source, target, mask)
+            if totals:
+                assert path.roles[0] == source and path.roles[-1] == target
+                assert path.total_years == expected
+                assert mask is None or all(mask[e] for e in path.edges)
+            else:
+                assert path is None
+
+            if s != t:
+                alternatives = graph.k_shortest_paths(source, target, 3, mask)
+                assert [p.total_years for p in alternatives] == totals[:3]
+                assert len({tuple(p.edges) for p in alternatives}) == len(alternatives)
+
+        for s in range(len(graph)):
+            expected = {graph.roles[t]: graph.distance(graph.roles[s], graph.roles[t], mask)
+                        for t in range(len(graph)) if t != s}
+            reachable = {role: years for role, years in expected.items() if np.isfinite(years)}
+            assert graph.reachable_roles(graph.roles[s], mask) == reachable
+
+
+def test_masked_lookups_reuse_the_single_table(monkeypatch):
+    graph, _ = random_graph(0, n=12)
+    computed = []
+    compute = graph._compute_all_pairs
+    monkeypatch.setattr(graph, "_compute_all_pairs", lambda: computed.append(1) or compute())
+
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        mask = rng.random(len(graph.years)) < 0.5
+        graph.reachable_roles(graph.roles[0], mask)
+        graph.k_shortest_paths(graph.roles[0], graph.roles[-1], 3, mask)
+
+    assert len(computed) == 1
+
+
+def test_eligible_paths_on_the_shipped_graph():
+    graph = get_role_graph()
+    ratings = {"Python": 3.0, "SQL": 2.0, "Communication": 4.0}
+    mask = graph.eligible_edges(ratings)
+    source = graph.roles[int(np.argmin(graph.levels))]
+
+    reachable = graph.reachable_roles(source, mask)
+    assert set(reachable) <= set(graph.reachable_roles(source))
+    for role, years in reachable.items():
+        path = graph.shortest_path(source, role, mask)
+        assert path.total_years == pytest.approx(years)
+        assert all(mask[e] for e in path.edges)
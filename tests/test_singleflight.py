@@ -0,0 +1,94 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from singleflight import SingleFlight
+
+THREADS = 8
+
+
+def run_together(flights, key, fn, threads=THREADS):
+    """flights.do(key, fn) on every thread, with fn held until all of them have called do()"""
+    arrived = threading.Barrier(threads)
+
+    def call():
+        arrived.wait()
+        return flights.do(key, fn)
+
+    with ThreadPoolExecutor(threads) as pool:
+        futures = [pool.submit(call) for _ in range(threads)]
+        return [future.exception() or future.result() for future in futures]
+
+
+def held_until_all_joined(flights, result=None, error=None):
+    """Function that blocks until every other caller is waiting on its flight"""
+    executions = []
+
+    def fn():
+        executions.append(1)
+        while flights.stats()["deduplicated"] < THREADS - 1:
+            time.sleep(0.001)
+        if error is not None:
+            raise error
+        return result
+
+    return fn, executions
+
+
+def test_concurrent_calls_run_once_and_share_the_result():
+    flights = SingleFlight()
+    result = {"careers": []}
+    fn, executions = held_until_all_joined(flights, result=result)
+
+    results = run_together(flights, "key", fn)
+
+    assert len(executions) == 1
+    assert all(r is result for r in results)
+    stats = flights.stats()
+    assert stats["calls"] == THREADS
+    assert stats["executions"] == 1
+    assert stats["deduplicated"] == THREADS - 1
+    assert stats["in_flight"] == 0
+
+
+def test_followers_reraise_the_leaders_exception():
+    flights = SingleFlight()
+    error = RuntimeError("upstream failed")
+    fn, executions = held_until_all_joined(flights, error=error)
+
+    results = run_together(flights, "key", fn)
+
+    assert len(executions) == 1
+    assert all(r is error for r in results)
+    assert flights.stats()["errors"] == 1
+
+
+def test_key_is_released_after_completion():
+    flights = SingleFlight()
+    calls = []
+    assert flights.do("key", lambda: calls.append(1) or len(calls)) == 1
+    assert flights.in_flight() == 0
+    assert flights.do("key", lambda: calls.append(1) or len(calls)) == 2
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flights.do("key", fail)
+    assert flights.in_flight() == 0
+    assert flights.do("key", lambda: "recovered") == "recovered"
+    assert flights.stats()["executions"] == 4
+
+
+def test_different_keys_do_not_wait_for_each_other():
+    flights = SingleFlight()
+    started = threading.Barrier(2, timeout=5)
+
+    def fn():
+        started.wait()  # Only passes when both keys execute at the same time
+        return "done"
+
+    with ThreadPoolExecutor(2) as pool:
+        results = list(pool.map(lambda key: flights.do(key, fn), ["a", "b"]))
+    assert results == ["done", "done"]
+    assert flights.stats()["deduplicated"] == 0
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+from skill_catalog import SKILL_CATEGORIES, lookup_domains
+from skill_scoring import (
+    PRIORITY_LEVELS, effort_jitter, impact_jitter, priority_levels, priority_scores, score_skills
+)
+from report_engine import calculate_goal_alignment, calculate_priority_score, get_quadrant_recommendation
+
+# Parity of the columnar scoring engine with the per-row functions it replaced.
+# Both sides use the same jitter draws: score_skills draws the effort jitter, then
+# the impact jitter, from the Generator it is given.
+
+GOAL_SETS = [
+    [],
+    ["Full-Stack Development"],
+    ["Data Science & ML", "Cloud Architecture"],
+    ["Technical Leadership", "DevOps & SRE", "Cybersecurity", "Mobile Development"],
+]
+
+SKILLS = [skill for skills in SKILL_CATEGORIES.values() for skill in skills] + [
+    "Web Scraping", "Data Engineering", "Cloud Security", "Leadership Coaching", "Game Physics", "Knitting"
+]
+
+
+def reference_rows(skills, levels, domains, goals, seed):
+    """Effort, impact, alignment, recommendation and priority per skill, computed row by row"""
+    rng = np.random.default_rng(seed)
+    effort_draws = effort_jitter(levels.shape, rng).ravel()
+    impact_draws = impact_jitter(levels.shape, rng).ravel()
+    rows = []
+    for i, (skill, level, domain) in enumerate(zip(skills, levels.ravel(), domains)):
+        effort = max(1, 10 - (level * 1.5) + effort_draws[i])
+        impact = max(1, 10 - (level - 1) * 2 + impact_draws[i])
+        alignment = calculate_goal_alignment(skill, domain, goals)
+        rows.append((
+            effort,
+            impact,
+            alignment,
+            get_quadrant_recommendation(effort, impact, level),
+            calculate_priority_score(impact, effort, alignment, level)
+        ))
+    return [np.array(column) for column in zip(*rows)]
+
+
+@pytest.mark.parametrize("goals", GOAL_SETS)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_score_skills_matches_per_row_functions(goals, seed):
+    levels = np.random.default_rng(100 + seed).integers(1, 6, size=len(SKILLS)).astype(float)
+    domains = lookup_domains(SKILLS)
+
+    scores = score_skills(SKILLS, levels, domains, goals, rng=np.random.default_rng(seed))
+    effort, impact, alignment, recommendation, priority = reference_rows(SKILLS, levels, domains, goals, seed)
+
+    np.testing.assert_allclose(scores['Effort'], effort)
+    np.testing.assert_allclose(scores['Impact'], impact)
+    np.testing.assert_array_equal(scores['Goal Alignment'], alignment)
+    np.testing.assert_array_equal(scores['Recommendation'], recommendation)
+    np.testing.assert_array_equal(scores['Priority Score'], priority)
+
+
+def test_score_skills_cohort_matches_per_row_functions():
+    goals = GOAL_SETS[2]
+    levels = np.random.default_rng(7).integers(1, 6, size=(5, len(SKILLS))).astype(float)
+    domains = lookup_domains(SKILLS)
+
+    scores = score_skills(SKILLS, levels, domains, goals, rng=np.random.default_rng(3))
+    effort, impact, alignment, recommendation, priority = reference_rows(
+        SKILLS * len(levels), levels, list(domains) * len(levels), goals, 3
+    )
+
+    np.testing.assert_allclose(scores['Effort'].ravel(), effort)
+    np.testing.assert_allclose(scores['Impact'].ravel(), impact)
+    np.testing.assert_array_equal(scores['Goal Alignment'].ravel(), alignment)
+    np.testing.assert_array_equal(scores['Recommendation'].ravel(), recommendation)
+    np.testing.assert_array_equal(scores['Priority Score'].ravel(), priority)
+
+
+def test_priority_scores_match_per_row_function():
+    rng = np.random.default_rng(11)
+    impact = rng.uniform(1, 11, 2000)
+    effort = rng.uniform(1, 11, 2000)
+    alignment = rng.integers(5, 16, 2000)
+    levels = rng.integers(1, 6, 2000)
+
+    expected = [calculate_priority_score(*row) for row in zip(impact, effort, alignment, levels)]
+    np.testing.assert_array_equal(priority_scores(impact, effort, alignment, levels), expected)
+
+
+def test_priority_levels_match_pd_cut():
+    # Bin edges, both ends of the range and values outside it (NaN in pd.cut)
+    priority = np.arange(-5, 106)
+    expected = pd.cut(pd.Series(priority), bins=[0, 30, 60, 100], labels=PRIORITY_LEVELS)
+    pd.testing.assert_series_equal(pd.Series(priority_levels(priority)), expected)